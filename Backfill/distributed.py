@@ -0,0 +1,396 @@
+"""
+여러 프로세스 / 호스트용 백필 (SQLite 작업 큐)
+
+코디네이터가 (날짜, 단계, 샤드) 작업을 큐에 넣고, 워커들이 작업을 임대받아 실행한다.
+Tokenizer / Summarizer는 하루치 기사를 샤드 수만큼 나눠 처리한 뒤, 병합 작업이
+샤드 결과를 항상 같은 순서(기사 파일명 순)로 합쳐서 Backfill/main.py와 같은 파일을 만든다
+(rank CSV, 동시 출현 네트워크, 기사 클러스터, 키워드 역색인, 스케치 / .sum).
+
+    download → tokenize(샤드 N개) → tokenize_merge → summarize(샤드 N개) → summarize_merge
+
+사용 예:
+    python distributed.py enqueue --start 20230101 --end 20241231 --shards 4
+    python distributed.py worker --processes 4          # 호스트마다 실행
+    python distributed.py status
+    python distributed.py finalize                      # 시계열 저장소 / dashboard.json 갱신
+
+여러 호스트에서 실행할 때는 큐 DB, 샤드 폴더, 각 단계 data 폴더를 공유 파일 시스템에 둔다.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List
+
+from main import (
+    ARTICLE_DIR, MAX_RANK, ROOT_DIR, SUMMARY_DIR, CheckpointStore, date_range, load_stage_module, run_stage,
+)
+from workqueue import WorkQueue
+
+sys.path.insert(0, str(ROOT_DIR / "Common"))
+import metrics
+
+QUEUE_DB = Path(__file__).resolve().parent / "queue" / "queue.db"
+SHARD_DIR = Path(__file__).resolve().parent / "queue" / "shards"
+
+# 큐 단계 → 같은 날짜 안의 실행 순서 (병합 작업이 끝나면 해당 단계 체크포인트를 남김)
+QUEUE_STAGES = {
+    "download": 0,
+    "tokenize": 1,
+    "tokenize_merge": 2,
+    "summarize": 3,
+    "summarize_merge": 4,
+}
+
+# 사용자 단계 → 큐 단계 (샤드 작업, 병합 작업)
+USER_STAGES = {
+    "download": ["download"],
+    "tokenize": ["tokenize", "tokenize_merge"],
+    "summarize": ["summarize", "summarize_merge"],
+}
+
+# 워커 프로세스별 캐시 (Kiwi, Gemini 모델)
+_kiwi = None
+_summary_model = None
+
+
+def shard_files(date_str: str, shard: int, shards: int) -> List[Path]:
+    """날짜 폴더의 .txt 파일을 이름순으로 정렬해서 shard번째 몫만 반환 (shard, shard+shards, ...)"""
+    files = sorted((ARTICLE_DIR / date_str).glob("*.txt"), key=lambda f: f.name)
+    return files[shard::shards]
+
+
+def shard_path(shard_dir: Path, date_str: str, stage: str, shard: int) -> Path:
+    return shard_dir / date_str / f"{stage}_{shard:03d}.json"
+
+
+def write_json_atomic(path: Path, data: Any):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    tmp_path.replace(path)
+
+
+def read_shards(shard_dir: Path, date_str: str, stage: str, shards: int) -> List[Dict[str, Any]]:
+    """샤드 결과를 샤드 번호 순서로 읽기 (하나라도 없으면 오류)"""
+    results = []
+    for shard in range(shards):
+        path = shard_path(shard_dir, date_str, stage, shard)
+        if not path.exists():
+            raise FileNotFoundError(f"샤드 결과 없음: {path}")
+        with open(path, "r", encoding="utf-8") as f:
+            results.append(json.load(f))
+    return results
+
+
+def execute(task: Dict[str, Any], shard_dir: Path, store: CheckpointStore) -> Dict[str, Any]:
+    """
+    작업 하나 실행
+
+    Returns:
+        dict: {"ok": 성공 여부, ...통계} (실패 시 "error")
+    """
+    global _kiwi, _summary_model
+    stage, date_str = task["stage"], task["date"]
+    shard, shards = task["shard"], task["shards"]
+
+    if stage == "download":
+        result = run_stage("download", date_str, task["params"])
+        if result["ok"]:
+            store.mark_done("download", date_str, {k: v for k, v in result.items() if k != "ok"})
+        return result
+
+    if stage == "tokenize":
+        tokenizer = load_stage_module("Tokenizer")
+        if _kiwi is None:
+            _kiwi = tokenizer.Kiwi()
+        files = shard_files(date_str, shard, shards)
+        # 기사별 명사 카운트 / 출현 위치도 저장 (병합 단계에서 동시 출현 네트워크, 클러스터링, 역색인용)
+        docs: List[Dict[str, int]] = []
+        positions: List[Dict[str, List[int]]] = []
+        counts = tokenizer.word_count_for_files(_kiwi, files, docs, positions)
+        write_json_atomic(shard_path(shard_dir, date_str, stage, shard), {
+            "files": len(files), "counts": counts, "names": [f.name for f in files], "docs": docs,
+            "positions": positions,
+        })
+        return {"ok": True, "files": len(files), "words": len(counts)}
+
+    if stage == "tokenize_merge":
+        tokenizer = load_stage_module("Tokenizer")
+        parts = read_shards(shard_dir, date_str, "tokenize", task["params"]["shards"])
+        # 샤드 번호 순서로 합산. 저장 시 (빈도수 내림차순, 단어 오름차순) 정렬이므로 샤드 수와 무관하게 같은 CSV
+        merged: Dict[str, int] = {}
+        for part in parts:
+            for word, count in part["counts"].items():
+                merged[word] = merged.get(word, 0) + count
+        if not merged:
+            return {"ok": False, "error": "단어 없음"}
+        tokenizer.save_word_count_to_file(date_str, merged, MAX_RANK)
+        if all("docs" in part and "positions" in part for part in parts):
+            # 기사 파일명 순서로 되돌려서 Backfill/main.py (word_count_for_folder)와 같은 입력으로 계산
+            articles = sorted(
+                (item for part in parts for item in zip(part["names"], part["docs"], part["positions"])),
+                key=lambda a: a[0],
+            )
+            names = [name for name, _, _ in articles]
+            docs = [doc for _, doc, _ in articles]
+            tokenizer.save_network(date_str, tokenizer.cooccurrence_edges(docs, merged))
+            clusters = tokenizer.cluster_articles(docs, names)
+            if clusters:
+                tokenizer.save_clusters(date_str, clusters)
+            # 기사 번호 = 파일명 순서 (WebProgram 드릴다운이 이 순서로 기사 파일을 찾음)
+            tokenizer.save_keyword_index(date_str, [offsets for _, _, offsets in articles], names)
+        else:
+            print(f"✗ {date_str}: 기사별 카운트가 없는 이전 샤드 결과라서 동시 출현 네트워크 / 클러스터 / 역색인을 건너뜀 "
+                  f"(tokenize 다시 실행 필요)")
+        tokenizer.save_day_sketch(date_str, merged)
+        # 시계열 저장소는 finalize에서 한 프로세스만 갱신
+        write_json_atomic(shard_dir / date_str / "tokenize_merged.json", merged)
+        info = {"files": sum(p["files"] for p in parts), "words": len(merged), "shards": len(parts)}
+        store.mark_done("tokenize", date_str, info)
+        return dict(info, ok=True)
+
+    if stage == "summarize":
+        summarizer = load_stage_module("Summarizer")
+        if not os.getenv("GOOGLE_API_KEY"):
+            return {"ok": False, "error": "GOOGLE_API_KEY 환경 변수가 설정되지 않았습니다."}
+        if _summary_model is None:
+            _summary_model = summarizer.get_single_summary_model()
+        files = shard_files(date_str, shard, shards)
+        items = []
+        for txt_file in files:
+            summary = summarizer.summarize_article(_summary_model, str(txt_file))
+            if summary:
+                items.append([txt_file.name, summary])
+        if files and not items:
+            return {"ok": False, "error": f"요약 0/{len(files)}건"}
+        write_json_atomic(shard_path(shard_dir, date_str, stage, shard), items)
+        return {"ok": True, "files": len(files), "summaries": len(items)}
+
+    if stage == "summarize_merge":
+        parts = read_shards(shard_dir, date_str, "summarize", task["params"]["shards"])
+        # 파일명 순서로 정렬해서 샤드 수와 무관하게 같은 .sum 파일
+        items = sorted((item for part in parts for item in part), key=lambda item: item[0])
+        if not items:
+            return {"ok": False, "error": "요약 없음"}
+        # 분류는 하루치를 모아서 한 번에 고정 분류 체계로 정리
+        summarizer = load_stage_module("Summarizer")
+        summaries = summarizer.assign_categories([summarizer.with_article(summary, name) for name, summary in items])
+        SUMMARY_DIR.mkdir(parents=True, exist_ok=True)
+        output_file = SUMMARY_DIR / f"{date_str}.sum"
+        tmp_file = output_file.with_suffix(".sum.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for summary in summaries:
+                f.write(summary)
+                f.write("\n\n")  # 각 요약 뒤에 한 줄 띄기 (Summarizer와 같은 형식)
+        tmp_file.replace(output_file)
+        metrics.inc("files_written_total", kind="summary")
+        info = {"summaries": len(items), "shards": len(parts)}
+        store.mark_done("summarize", date_str, info)
+        return dict(info, ok=True)
+
+    raise ValueError(f"unknown stage: {stage}")
+
+
+class Heartbeat:
+    """작업 실행 중 임대를 주기적으로 연장하는 스레드 (자체 DB 연결 사용)"""
+
+    def __init__(self, db_path: Path, task: Dict[str, Any], lease_seconds: float):
+        self.db_path = db_path
+        self.task = task
+        self.lease_seconds = lease_seconds
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-heartbeat", daemon=True)
+
+    def _run(self):
+        queue = WorkQueue(self.db_path, self.lease_seconds)
+        try:
+            while not self._stop.wait(self.lease_seconds / 3):
+                if not queue.heartbeat(self.task):
+                    self.lost = True
+                    print(f"✗ Lease lost: {self.task['date']} {self.task['stage']}#{self.task['shard']}")
+                    return
+        finally:
+            queue.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def worker_loop(db_path: Path, shard_dir: Path, checkpoint_dir: Path, lease_seconds: float,
+                max_attempts: int, poll_seconds: float, wait_forever: bool):
+    """
+    큐에서 작업을 하나씩 가져와 실행 (가져갈 작업이 더 이상 없으면 종료)
+
+    wait_forever가 True면 큐가 비어도 종료하지 않고 새 작업을 기다린다.
+    """
+    metrics.configure("queue-worker")
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    queue = WorkQueue(db_path, lease_seconds, max_attempts)
+    store = CheckpointStore(checkpoint_dir)
+    print(f"✓ Worker started: {worker_id}")
+
+    while True:
+        task = queue.claim(worker_id)
+        if task is None:
+            if not wait_forever and not queue.has_unfinished():
+                break
+            time.sleep(poll_seconds)
+            continue
+
+        label = f"{task['date']} {task['stage']}#{task['shard']}/{task['shards']} (시도 {task['attempts']})"
+        print(f"[{worker_id}] 시작: {label}")
+        started = time.perf_counter()
+        with Heartbeat(db_path, task, lease_seconds) as heartbeat:
+            try:
+                result = execute(task, shard_dir, store)
+            except Exception as e:
+                traceback.print_exc()
+                result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        metrics.observe("queue_task_seconds", time.perf_counter() - started, step=task["stage"])
+
+        if heartbeat.lost:
+            metrics.inc("queue_tasks_total", step=task["stage"], result="lost")
+            continue
+        if result.pop("ok", False):
+            queue.complete(task, result)
+            metrics.inc("queue_tasks_total", step=task["stage"], result="done")
+            print(f"✓ [{worker_id}] 완료: {label} {result}")
+        else:
+            status = queue.fail(task, str(result.get("error") or result))
+            metrics.inc("queue_tasks_total", step=task["stage"], result=status)
+            print(f"✗ [{worker_id}] 실패: {label} → {status}: {result.get('error') or result}")
+
+    queue.close()
+    print(f"✓ Worker finished: {worker_id}")
+    metrics.report()
+
+
+def cmd_enqueue(args):
+    queue = WorkQueue(Path(args.db))
+    store = CheckpointStore(Path(args.checkpoint_dir))
+    params = {"section": args.section, "group": args.group, "shards": args.shards}
+
+    added = 0
+    skipped = 0
+    for date_str in date_range(args.start, args.end):
+        for user_stage in args.stages:
+            # Backfill/main.py 또는 이전 큐 실행에서 이미 끝난 (날짜, 단계)는 넣지 않음
+            if store.is_done(user_stage, date_str):
+                skipped += 1
+                continue
+            for stage in USER_STAGES[user_stage]:
+                order = QUEUE_STAGES[stage]
+                shards = args.shards if stage in ("tokenize", "summarize") else 1
+                added += queue.enqueue(date_str, stage, order, shards, params)
+    queue.close()
+    print(f"✓ 작업 {added}개 추가 (완료된 날짜·단계 {skipped}개 건너뜀): {args.db}")
+
+
+def cmd_worker(args):
+    loop_args = (Path(args.db), Path(args.shard_dir), Path(args.checkpoint_dir), args.lease,
+                 args.max_attempts, args.poll, args.forever)
+    if args.processes <= 1:
+        worker_loop(*loop_args)
+        return
+
+    processes = [multiprocessing.Process(target=worker_loop, args=loop_args) for _ in range(args.processes)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+
+def cmd_status(args):
+    queue = WorkQueue(Path(args.db))
+    print(f"\n{'='*60}")
+    print(f"작업 큐: {args.db}")
+    print(f"{'='*60}")
+    by_stage: Dict[str, Dict[str, int]] = {}
+    for row in queue.summary():
+        by_stage.setdefault(row["stage"], {})[row["status"]] = row["n"]
+    for stage in QUEUE_STAGES:
+        if stage in by_stage:
+            counts = by_stage[stage]
+            detail = "  ".join(f"{s} {counts.get(s, 0):>5}" for s in ("pending", "running", "done", "dead"))
+            print(f"  {stage:<16} {detail}")
+
+    dead = queue.tasks(status="dead")
+    if dead:
+        print(f"\n[dead 작업 {len(dead)}개] (requeue 명령으로 다시 시도)")
+        for task in dead[:20]:
+            error = (task["error"] or "").strip().splitlines()[:1]
+            print(f"  ✗ {task['date']} {task['stage']}#{task['shard']} 시도 {task['attempts']}회: {''.join(error)}")
+    print(f"{'='*60}")
+    queue.close()
+
+
+def cmd_requeue(args):
+    queue = WorkQueue(Path(args.db))
+    print(f"✓ dead 작업 {queue.requeue_dead()}개를 다시 대기열에 넣었습니다.")
+    queue.close()
+
+
+def cmd_finalize(args):
+    """병합된 날짜별 전체 단어 카운트로 시계열 저장소와 dashboard.json 갱신 (한 프로세스에서만 실행)"""
+    tokenizer = load_stage_module("Tokenizer")
+    timeseries = tokenizer.TermTimeSeries()
+    shard_dir = Path(args.shard_dir)
+
+    merged_files = sorted(shard_dir.glob("*/tokenize_merged.json"), key=lambda f: f.parent.name)
+    for merged_file in merged_files:
+        with open(merged_file, "r", encoding="utf-8") as f:
+            timeseries.add_day(merged_file.parent.name, json.load(f))
+    print(f"✓ 시계열 저장소 갱신: {len(merged_files)}일")
+
+    if merged_files:
+        print(f"Saved dashboard artifact to: {tokenizer.save_dashboard_artifact()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Article Analyser 분산 백필 (SQLite 작업 큐)")
+    parser.add_argument("--db", default=str(QUEUE_DB), help="작업 큐 SQLite 파일")
+    parser.add_argument("--shard-dir", default=str(SHARD_DIR), help="샤드 결과 폴더")
+    parser.add_argument("--checkpoint-dir", default=str(CheckpointStore().root), help="완료 표시 폴더")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("enqueue", help="기간 작업을 큐에 추가")
+    p.add_argument("--start", required=True, help="시작 날짜 (yyyymmdd)")
+    p.add_argument("--end", required=True, help="종료 날짜 (yyyymmdd)")
+    p.add_argument("--stages", nargs="+", choices=list(USER_STAGES), default=list(USER_STAGES), help="실행할 단계")
+    p.add_argument("--shards", type=int, default=4, help="tokenize / summarize 날짜별 샤드 수")
+    p.add_argument("--section", default="101", help="섹션 번호 (기본: 101 경제)")
+    p.add_argument("--group", default="259", help="그룹 번호 (기본: 259 금융)")
+    p.set_defaults(func=cmd_enqueue)
+
+    p = sub.add_parser("worker", help="큐에서 작업을 가져와 실행")
+    p.add_argument("--processes", type=int, default=1, help="이 호스트에서 띄울 워커 프로세스 수")
+    p.add_argument("--lease", type=float, default=300, help="작업 임대 시간(초)")
+    p.add_argument("--max-attempts", type=int, default=3, help="작업별 최대 시도 횟수")
+    p.add_argument("--poll", type=float, default=5, help="가져갈 작업이 없을 때 대기 시간(초)")
+    p.add_argument("--forever", action="store_true", help="큐가 비어도 종료하지 않고 대기")
+    p.set_defaults(func=cmd_worker)
+
+    sub.add_parser("status", help="단계별 진행 상황").set_defaults(func=cmd_status)
+    sub.add_parser("requeue", help="dead 작업 다시 시도").set_defaults(func=cmd_requeue)
+    sub.add_parser("finalize", help="시계열 저장소 / dashboard.json 갱신").set_defaults(func=cmd_finalize)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
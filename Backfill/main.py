@@ -0,0 +1,306 @@
+"""
+기간 백필 실행기 (Downloader → Tokenizer → Summarizer)
+
+기간을 (날짜, 단계) 작업으로 나눠 여러 프로세스에서 병렬로 실행하고, 단계가 끝날 때마다
+checkpoints/<단계>/<yyyymmdd>.json 완료 표시를 남긴다. 중간에 멈춰도 다시 실행하면
+완료 표시가 없는 (날짜, 단계)부터 이어서 처리한다.
+
+같은 날짜의 단계는 download → tokenize → summarize 순서로 실행되고,
+서로 다른 날짜는 --workers 개수만큼 동시에 실행된다.
+
+사용 예:
+    python main.py --start 20250101 --end 20250331 --workers 4
+    python main.py --start 20250101 --end 20250331 --stages tokenize summarize
+    python main.py --start 20250101 --end 20250331 --status     # 진행 상황만 출력
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CHECKPOINT_DIR = Path(__file__).resolve().parent / "checkpoints"
+
+# 단계별 입출력 폴더
+ARTICLE_DIR = ROOT_DIR / "Downloader" / "data"
+SUMMARY_DIR = ROOT_DIR / "Summarizer" / "data"
+
+# 실행 순서 (같은 날짜 안에서)
+STAGES = ("download", "tokenize", "summarize")
+
+# Tokenizer main()과 같은 CSV 저장 개수
+MAX_RANK = 30
+
+sys.path.insert(0, str(ROOT_DIR / "Common"))
+import metrics
+
+# 워커 프로세스별로 한 번만 로드하는 단계 모듈 / Gemini 모델
+_modules: Dict[str, object] = {}
+_summary_model = None
+
+
+def load_stage_module(stage_dir: str):
+    """각 단계의 main.py를 이름이 겹치지 않게 모듈로 로드 (프로세스당 한 번)"""
+    if stage_dir not in _modules:
+        path = ROOT_DIR / stage_dir / "main.py"
+        sys.path.insert(0, str(path.parent))
+        spec = importlib.util.spec_from_file_location(f"{stage_dir.lower()}_main", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[stage_dir] = module
+    return _modules[stage_dir]
+
+
+class CheckpointStore:
+    """
+    (단계, 날짜)별 완료 표시 저장소
+
+    checkpoints/<단계>/<yyyymmdd>.json 파일이 있으면 완료로 본다.
+    파일은 임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 반쯤 쓰인 표시가 남지 않는다.
+    """
+
+    def __init__(self, root: Path = CHECKPOINT_DIR):
+        self.root = root
+
+    def _path(self, stage: str, date_str: str) -> Path:
+        return self.root / stage / f"{date_str}.json"
+
+    def is_done(self, stage: str, date_str: str) -> bool:
+        return self._path(stage, date_str).exists()
+
+    def mark_done(self, stage: str, date_str: str, info: dict):
+        path = self._path(stage, date_str)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"stage": stage, "date": date_str, "finished_at": datetime.now().isoformat(timespec="seconds")}
+        record.update(info)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def clear(self, stage: str, date_str: str):
+        self._path(stage, date_str).unlink(missing_ok=True)
+
+
+def date_range(start_date: str, end_date: str) -> List[str]:
+    """start_date ~ end_date (yyyymmdd, 양 끝 포함) 날짜 리스트"""
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    dates = []
+    while start <= end:
+        dates.append(start.strftime("%Y%m%d"))
+        start += timedelta(days=1)
+    return dates
+
+
+def run_stage(stage: str, date_str: str, options: dict) -> dict:
+    """
+    워커 프로세스에서 (단계, 날짜) 작업 하나 실행
+
+    Returns:
+        dict: {"ok": 완료 표시 여부, "elapsed_s", 단계별 통계...}
+            tokenize는 전체 단어 카운트("word_counts")도 돌려주며, 시계열 저장소 갱신은
+            여러 프로세스가 같은 파일을 쓰지 않도록 부모 프로세스에서 한다.
+    """
+    global _summary_model
+    started = time.perf_counter()
+    date_dir = ARTICLE_DIR / date_str
+
+    if stage == "download":
+        downloader = load_stage_module("Downloader")
+        result = downloader.download_articles_for_date(date_str, options["section"], options["group"])
+        # URL을 하나도 못 모았거나 전부 실패하면 (Selenium 오류 등) 다음 실행에서 다시 시도
+        result["ok"] = result["success"] > 0
+
+    elif stage == "tokenize":
+        tokenizer = load_stage_module("Tokenizer")
+        if not date_dir.is_dir():
+            return {"ok": False, "error": f"기사 폴더 없음: {date_dir}"}
+        docs = []
+        names = []
+        positions = []
+        word_counts = tokenizer.word_count_for_folder(date_dir, docs, names, positions)
+        if word_counts:
+            tokenizer.save_word_count_to_file(date_str, word_counts, MAX_RANK)
+            tokenizer.save_network(date_str, tokenizer.cooccurrence_edges(docs, word_counts))
+            clusters = tokenizer.cluster_articles(docs, names)
+            if clusters:
+                tokenizer.save_clusters(date_str, clusters)
+            tokenizer.save_keyword_index(date_str, positions, names)
+            tokenizer.save_day_sketch(date_str, word_counts)
+        result = {"ok": bool(word_counts), "words": len(word_counts), "word_counts": word_counts}
+
+    elif stage == "summarize":
+        summarizer = load_stage_module("Summarizer")
+        mode = options.get("summary_mode", "llm")
+        if mode != "textrank" and not os.getenv("GOOGLE_API_KEY"):
+            return {"ok": False, "error": "GOOGLE_API_KEY 환경 변수가 설정되지 않았습니다."}
+        if not date_dir.is_dir():
+            return {"ok": False, "error": f"기사 폴더 없음: {date_dir}"}
+        if _summary_model is None and mode != "textrank":
+            _summary_model = summarizer.get_single_summary_model()
+        summaries = summarizer.summarize_date_folder(_summary_model, str(date_dir), str(SUMMARY_DIR), mode)
+        result = {"ok": bool(summaries), "summaries": len(summaries)}
+
+    else:
+        raise ValueError(f"unknown stage: {stage}")
+
+    result["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def print_status(dates: List[str], stages: List[str], store: CheckpointStore):
+    """단계별 완료 날짜 수와 남은 날짜 출력"""
+    print(f"\n{'='*60}")
+    print(f"백필 진행 상황: {dates[0]} ~ {dates[-1]} ({len(dates)}일)")
+    print(f"{'='*60}")
+    for stage in stages:
+        remaining = [d for d in dates if not store.is_done(stage, d)]
+        print(f"  {stage:<10} 완료 {len(dates) - len(remaining):>5} / {len(dates)}")
+        if remaining:
+            preview = ", ".join(remaining[:10]) + (" ..." if len(remaining) > 10 else "")
+            print(f"             남은 날짜: {preview}")
+    print(f"{'='*60}")
+
+
+def run_backfill(dates: List[str], stages: List[str], workers: int, options: dict, store: CheckpointStore) -> dict:
+    """
+    완료 표시가 없는 (날짜, 단계) 작업을 병렬로 실행
+
+    Args:
+        dates: 처리할 날짜 리스트
+        stages: 실행할 단계 (STAGES 순서로 정렬됨)
+        workers: 동시에 실행할 프로세스 수
+        options: 워커에 전달할 설정 (section, group, summary_mode)
+        store: 완료 표시 저장소
+
+    Returns:
+        dict: {"done": 완료 작업 수, "skipped": 이미 완료되어 건너뛴 작업 수, "failed": [(날짜, 단계, 사유)]}
+    """
+    # 날짜별로 남은 단계 (앞 단계가 끝나야 다음 단계 실행)
+    queues = {d: [s for s in stages if not store.is_done(s, d)] for d in dates}
+    skipped = len(dates) * len(stages) - sum(len(q) for q in queues.values())
+    total = sum(len(q) for q in queues.values())
+    print(f"작업 {total}개 (이미 완료 {skipped}개 건너뜀), 워커 {workers}개")
+
+    timeseries = None
+    if "tokenize" in stages:
+        timeseries = load_stage_module("Tokenizer").TermTimeSeries()
+
+    done = 0
+    failed = []
+    futures = {}
+    pool = ProcessPoolExecutor(max_workers=workers)
+
+    def submit_next(date_str: str):
+        if queues[date_str]:
+            stage = queues[date_str][0]
+            futures[pool.submit(run_stage, stage, date_str, options)] = (date_str, stage)
+
+    try:
+        for date_str in dates:
+            submit_next(date_str)
+
+        while futures:
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                date_str, stage = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"ok": False, "error": str(e)}
+
+                word_counts = result.pop("word_counts", None)
+                if result.get("ok") and word_counts and timeseries is not None:
+                    try:
+                        timeseries.add_day(date_str, word_counts)
+                    except Exception as e:
+                        result = {"ok": False, "error": f"시계열 저장 실패: {e}"}
+
+                if result.get("elapsed_s") is not None:
+                    metrics.observe("backfill_stage_seconds", result["elapsed_s"], step=stage)
+
+                if result.get("ok"):
+                    result.pop("ok")
+                    store.mark_done(stage, date_str, result)
+                    metrics.inc("backfill_tasks_total", step=stage, result="done")
+                    done += 1
+                    print(f"✓ [{done}/{total}] {date_str} {stage} 완료 {result}")
+                    queues[date_str].pop(0)
+                    submit_next(date_str)
+                else:
+                    # 실패한 날짜의 이후 단계는 다음 실행으로 미룸
+                    reason = result.get("error") or {k: v for k, v in result.items() if k != "ok"}
+                    failed.append((date_str, stage, reason))
+                    metrics.inc("backfill_tasks_total", step=stage, result="failed")
+                    print(f"✗ {date_str} {stage} 실패: {reason}")
+                    queues[date_str] = []
+    except KeyboardInterrupt:
+        print("\n중단됨: 완료 표시가 남은 작업까지 저장되었습니다. 같은 명령으로 다시 실행하면 이어서 처리합니다.")
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+    if timeseries is not None and done:
+        try:
+            dashboard_path = load_stage_module("Tokenizer").save_dashboard_artifact()
+            print(f"Saved dashboard artifact to: {dashboard_path}")
+        except Exception as e:
+            print(f"Error saving dashboard artifact: {e}")
+
+    return {"done": done, "skipped": skipped, "failed": failed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Article Analyser 기간 백필")
+    parser.add_argument("--start", required=True, help="시작 날짜 (yyyymmdd)")
+    parser.add_argument("--end", required=True, help="종료 날짜 (yyyymmdd)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="실행할 단계")
+    parser.add_argument("--workers", type=int, default=2, help="동시에 처리할 작업 수 (프로세스)")
+    parser.add_argument("--section", default="101", help="섹션 번호 (기본: 101 경제)")
+    parser.add_argument("--group", default="259", help="그룹 번호 (기본: 259 금융)")
+    parser.add_argument("--summary-mode", choices=["llm", "textrank", "draft"], default="llm",
+                        help="요약 방식 (textrank: API 키 없이 로컬 추출 요약)")
+    parser.add_argument("--checkpoint-dir", default=str(CHECKPOINT_DIR), help="완료 표시 저장 폴더")
+    parser.add_argument("--force", action="store_true", help="기간 내 완료 표시를 지우고 처음부터 실행")
+    parser.add_argument("--status", action="store_true", help="실행하지 않고 진행 상황만 출력")
+    args = parser.parse_args()
+
+    dates = date_range(args.start, args.end)
+    if not dates:
+        print("Error: 시작 날짜가 종료 날짜보다 늦습니다.")
+        return
+    stages = [s for s in STAGES if s in args.stages]
+    store = CheckpointStore(Path(args.checkpoint_dir))
+
+    if args.status:
+        print_status(dates, stages, store)
+        return
+
+    if args.force:
+        for stage in stages:
+            for date_str in dates:
+                store.clear(stage, date_str)
+
+    metrics.configure("backfill")
+    options = {"section": args.section, "group": args.group, "summary_mode": args.summary_mode}
+    result = run_backfill(dates, stages, args.workers, options, store)
+
+    print(f"\n{'='*60}")
+    print(f"백필 완료: 새로 완료 {result['done']}개, 건너뜀 {result['skipped']}개, 실패 {len(result['failed'])}개")
+    for date_str, stage, reason in result["failed"]:
+        print(f"  ✗ {date_str} {stage}: {reason}")
+    print(f"{'='*60}")
+    metrics.report()
+
+    if result["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
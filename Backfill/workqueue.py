@@ -0,0 +1,229 @@
+"""
+SQLite 기반 작업 큐 (여러 워커 프로세스 / 호스트가 공유)
+
+작업은 (날짜, 단계, 샤드) 단위이며, 워커는 claim()으로 작업 하나를 임대(lease)받아 실행한다.
+임대 시간 안에 complete()/fail()을 못 하면(워커가 죽은 경우 등) 다른 워커가 다시 가져간다.
+
+같은 날짜 안에서는 stage_order가 작은 단계가 모두 done이어야 다음 단계 작업을 가져갈 수 있다.
+"""
+import json
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          INTEGER PRIMARY KEY,
+    date        TEXT    NOT NULL,
+    stage       TEXT    NOT NULL,
+    stage_order INTEGER NOT NULL,
+    shard       INTEGER NOT NULL,
+    shards      INTEGER NOT NULL,
+    params      TEXT    NOT NULL DEFAULT '{}',    -- 작업 설정 JSON (섹션/그룹 등)
+    status      TEXT    NOT NULL DEFAULT 'pending',   -- pending / running / done / dead
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    worker      TEXT,
+    lease_token TEXT,
+    lease_until REAL,
+    not_before  REAL    NOT NULL DEFAULT 0,
+    result      TEXT,
+    error       TEXT,
+    updated_at  REAL,
+    UNIQUE (date, stage, shard)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, date, stage_order);
+"""
+
+# 재시도 대기 시간 (초): 실패 횟수에 따라 base * 2^(attempts-1), 최대 max
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 600
+
+
+class WorkQueue:
+    """
+    tasks 테이블 하나로 된 작업 큐
+
+    Args:
+        db_path: SQLite 파일 경로 (여러 호스트가 쓰면 공유 파일 시스템에 둠)
+        lease_seconds: 작업 임대 시간 (하트비트로 연장)
+        max_attempts: 이 횟수만큼 실패하면 dead 처리
+    """
+
+    def __init__(self, db_path: Path, lease_seconds: float = 300, max_attempts: int = 3):
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def enqueue(self, date_str: str, stage: str, stage_order: int, shards: int = 1,
+                params: Dict[str, Any] | None = None) -> int:
+        """
+        (날짜, 단계) 작업을 샤드 수만큼 추가 (이미 있으면 그대로 둠)
+
+        Returns:
+            int: 새로 추가된 작업 수
+        """
+        now = time.time()
+        params_json = json.dumps(params or {}, ensure_ascii=False)
+        added = 0
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for shard in range(shards):
+                cur = self.conn.execute(
+                    "INSERT OR IGNORE INTO tasks (date, stage, stage_order, shard, shards, params, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (date_str, stage, stage_order, shard, shards, params_json, now),
+                )
+                added += cur.rowcount
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def claim(self, worker: str) -> Dict[str, Any] | None:
+        """
+        실행 가능한 작업 하나를 임대
+
+        pending이거나 임대가 만료된 running 작업 중, 같은 날짜의 앞 단계가 모두 끝난 것을
+        (날짜, 단계, 샤드) 순서로 고른다.
+
+        Returns:
+            dict | None: 작업 행 (lease_token 포함). 가져갈 작업이 없으면 None
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                """
+                SELECT * FROM tasks t
+                WHERE ((t.status = 'pending' AND t.not_before <= :now)
+                       OR (t.status = 'running' AND t.lease_until < :now))
+                  AND NOT EXISTS (
+                      SELECT 1 FROM tasks d
+                      WHERE d.date = t.date AND d.stage_order < t.stage_order AND d.status != 'done'
+                  )
+                ORDER BY t.date, t.stage_order, t.shard
+                LIMIT 1
+                """,
+                {"now": now},
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+
+            if row["attempts"] >= self.max_attempts:
+                # 임대 만료가 반복된 작업 (워커가 계속 죽는 경우)
+                self.conn.execute(
+                    "UPDATE tasks SET status = 'dead', error = coalesce(error, 'lease expired'), updated_at = ? "
+                    "WHERE id = ?",
+                    (now, row["id"]),
+                )
+                self.conn.execute("COMMIT")
+                return self.claim(worker)
+
+            token = uuid.uuid4().hex
+            self.conn.execute(
+                "UPDATE tasks SET status = 'running', attempts = attempts + 1, worker = ?, lease_token = ?, "
+                "lease_until = ?, updated_at = ? WHERE id = ?",
+                (worker, token, now + self.lease_seconds, now, row["id"]),
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        task = dict(row)
+        task["params"] = json.loads(row["params"])
+        task.update(status="running", attempts=row["attempts"] + 1, worker=worker, lease_token=token)
+        return task
+
+    def heartbeat(self, task: Dict[str, Any]) -> bool:
+        """임대 연장. 이미 다른 워커에게 넘어갔으면 False"""
+        cur = self.conn.execute(
+            "UPDATE tasks SET lease_until = ?, updated_at = ? WHERE id = ? AND lease_token = ? AND status = 'running'",
+            (time.time() + self.lease_seconds, time.time(), task["id"], task["lease_token"]),
+        )
+        return cur.rowcount == 1
+
+    def complete(self, task: Dict[str, Any], result: Dict[str, Any]) -> bool:
+        """작업 완료 기록. 임대를 잃은 뒤라면 기록하지 않고 False"""
+        cur = self.conn.execute(
+            "UPDATE tasks SET status = 'done', result = ?, error = NULL, lease_until = NULL, updated_at = ? "
+            "WHERE id = ? AND lease_token = ? AND status = 'running'",
+            (json.dumps(result, ensure_ascii=False), time.time(), task["id"], task["lease_token"]),
+        )
+        return cur.rowcount == 1
+
+    def fail(self, task: Dict[str, Any], error: str) -> str:
+        """
+        작업 실패 기록 (재시도 횟수가 남았으면 대기 후 pending, 아니면 dead)
+
+        Returns:
+            str: 바뀐 상태 ("pending" / "dead" / "lost": 임대를 이미 잃음)
+        """
+        now = time.time()
+        if task["attempts"] >= self.max_attempts:
+            status, not_before = "dead", 0
+        else:
+            status = "pending"
+            not_before = now + min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (task["attempts"] - 1))
+        cur = self.conn.execute(
+            "UPDATE tasks SET status = ?, error = ?, not_before = ?, lease_until = NULL, updated_at = ? "
+            "WHERE id = ? AND lease_token = ? AND status = 'running'",
+            (status, error, not_before, now, task["id"], task["lease_token"]),
+        )
+        return status if cur.rowcount == 1 else "lost"
+
+    def requeue_dead(self) -> int:
+        """dead 작업을 재시도 횟수를 초기화해서 다시 pending으로"""
+        cur = self.conn.execute(
+            "UPDATE tasks SET status = 'pending', attempts = 0, not_before = 0, updated_at = ? WHERE status = 'dead'",
+            (time.time(),),
+        )
+        return cur.rowcount
+
+    def has_unfinished(self) -> bool:
+        """pending/running 작업이 남아 있는지 (dead로 막힌 작업은 제외)"""
+        row = self.conn.execute(
+            """
+            SELECT 1 FROM tasks t
+            WHERE t.status IN ('pending', 'running')
+              AND NOT EXISTS (
+                  SELECT 1 FROM tasks d
+                  WHERE d.date = t.date AND d.stage_order < t.stage_order AND d.status = 'dead'
+              )
+            LIMIT 1
+            """
+        ).fetchone()
+        return row is not None
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """단계 × 상태별 작업 수"""
+        rows = self.conn.execute(
+            "SELECT stage, stage_order, status, count(*) AS n FROM tasks GROUP BY stage, status ORDER BY stage_order, status"
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    def tasks(self, status: str | None = None, stage: str | None = None) -> List[Dict[str, Any]]:
+        """조건에 맞는 작업 목록 (날짜, 단계, 샤드 순)"""
+        query = "SELECT * FROM tasks WHERE 1 = 1"
+        params = []
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        if stage:
+            query += " AND stage = ?"
+            params.append(stage)
+        query += " ORDER BY date, stage_order, shard"
+        return [dict(r) for r in self.conn.execute(query, params).fetchall()]
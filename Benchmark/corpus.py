@@ -0,0 +1,164 @@
+import random
+from datetime import datetime, timedelta
+from html import escape
+from pathlib import Path
+
+# 합성 기사에 사용할 경제 뉴스 어휘
+NOUNS = [
+    "금융", "대출", "은행", "금리", "투자", "시장", "자산", "고객", "서비스", "기업",
+    "카드", "보험", "증권", "부동산", "주택", "가계", "정부", "정책", "위원회", "감독원",
+    "코스피", "환율", "달러", "수출", "물가", "성장률", "예금", "적금", "연체", "상품",
+    "지원", "관리", "혜택", "규제", "소비자", "디지털", "플랫폼", "가상자산", "채권", "펀드",
+    "실적", "영업이익", "매출", "주가", "배당", "지역", "서울", "글로벌", "경제", "산업",
+]
+VERBS = ["발표했다", "밝혔다", "강조했다", "전망했다", "확대했다", "추진한다", "검토하고 있다", "늘었다", "줄었다", "기록했다"]
+TEMPLATES = [
+    "{0}은 {1} {2}에 대한 {3} 방안을 {v}.",
+    "{0}과 {1}의 {2}가 {3} 기준으로 크게 {v}.",
+    "업계에 따르면 {0} {1}는 지난달 {2} 대비 {3}% {v}.",
+    "{0} 관계자는 \"{1} {2}를 통해 {3} 경쟁력을 높이겠다\"고 {v}.",
+    "최근 {0} {1} 변동으로 {2} {3} 부담이 커질 것으로 {v}.",
+]
+CATEGORIES = ["은행", "보험", "증권", "카드", "부동산", "가상자산", "금융정책", "기업 실적", "소비자 보호", "글로벌 경제"]
+PRESSES = ["한국경제", "매일경제", "연합뉴스", "머니투데이", "서울경제", "이데일리", "뉴시스", "파이낸셜뉴스"]
+
+# 네이버 기사 본문 하단에 반복되는 문구
+BOILERPLATE = [
+    "무단전재 및 재배포 금지",
+    "사진은 기사와 직접 관련 없음.",
+]
+
+
+def make_sentence(rng: random.Random) -> str:
+    """템플릿과 어휘로 한국어 기사 문장 하나 생성"""
+    template = rng.choice(TEMPLATES)
+    words = [rng.choice(NOUNS) for _ in range(4)]
+    if "%" in template:
+        words[3] = str(rng.randint(1, 40))
+    return template.format(*words, v=rng.choice(VERBS))
+
+
+def make_article(rng: random.Random, sentences: int) -> tuple:
+    """(제목, 본문, 언론사, 기자) 생성. 본문은 문단 단위로 빈 줄로 구분"""
+    title = f"{rng.choice(NOUNS)} {rng.choice(NOUNS)}, {rng.choice(NOUNS)} {rng.choice(VERBS)}"
+    press = rng.choice(PRESSES)
+    reporter = f"{rng.choice('김이박최정강조윤장임')}{rng.choice('민서지현도하수')}{rng.choice('준연우진호은아')}"
+
+    paragraphs = []
+    body_sentences = [make_sentence(rng) for _ in range(sentences)]
+    for i in range(0, len(body_sentences), 3):
+        paragraphs.append(" ".join(body_sentences[i:i + 3]))
+    paragraphs.append(f"{reporter} 기자 reporter{rng.randint(1, 99)}@news.co.kr")
+    paragraphs.extend(BOILERPLATE)
+    return title, "\n\n".join(paragraphs), press, reporter
+
+
+def make_naver_html(title: str, body: str, press: str, reporter: str, published: datetime, article_url: str) -> str:
+    """네이버 뉴스(n.news.naver.com) 기사 페이지와 비슷한 구조의 HTML 생성"""
+    body_html = "<br><br>".join(escape(p) for p in body.split("\n\n"))
+    stamp = published.strftime("%Y-%m-%d %H:%M:%S")
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)} : 네이버 뉴스</title>
+<meta property="og:title" content="{escape(title)}">
+<meta property="og:url" content="{article_url}">
+<meta property="og:article:author" content="{escape(press)}">
+<script>var nsc = "news.end"; window.__CONFIG__ = {{"ad": true}};</script>
+<style>.newsct_article {{ font-size: 17px; }}</style>
+</head>
+<body>
+<div id="ct" class="newsct">
+  <div class="media_end_head">
+    <a class="media_end_head_top_logo"><img alt="{escape(press)}" title="{escape(press)}"></a>
+    <h2 id="title_area" class="media_end_head_headline"><span>{escape(title)}</span></h2>
+    <div class="media_end_head_info_datestamp">
+      <span class="media_end_head_info_datestamp_time _ARTICLE_DATE_TIME" data-date-time="{stamp}">{stamp}</span>
+    </div>
+    <div class="media_end_head_journalist"><em class="media_end_head_journalist_name">{escape(reporter)} 기자</em></div>
+  </div>
+  <div id="newsct_article" class="newsct_article _article_body">
+    <article id="dic_area" class="go_trans _article_content">
+      <span class="end_photo_org"><img src="https://imgnews.pstatic.net/image/sample.jpg"><em class="img_desc">사진은 기사와 직접 관련 없음.</em></span>
+      {body_html}
+      <script>document.write("ad");</script>
+      <iframe src="https://ad.naver.com"></iframe>
+    </article>
+  </div>
+  <div class="media_end_linked">
+    <ul><li><a href="#">관련 기사 더보기</a></li></ul>
+  </div>
+</div>
+</body>
+</html>
+"""
+
+
+def generate_corpus(root: Path, days: int, articles_per_day: int, sentences: int = 12,
+                    summaries_per_day: int | None = None, rank_words: int = 30, seed: int = 42) -> dict:
+    """
+    벤치마크용 합성 코퍼스 생성
+
+    root 아래에 다음 구조로 만든다:
+        html/<yyyymmdd>/<id>.html   네이버 기사 페이지 형태의 HTML (Downloader 입력)
+        data/<yyyymmdd>/<id>.txt    기사 본문 텍스트 (Tokenizer/Summarizer 입력)
+        res/rank/<yyyymmdd>.csv     word,count CSV (WebProgram 입력)
+        res/summary/<yyyymmdd>.sum  <분류>/<요약> 파일 (WebProgram 입력)
+
+    Args:
+        root: 코퍼스를 만들 폴더
+        days: 날짜 수
+        articles_per_day: 날짜별 기사 수
+        sentences: 기사당 문장 수
+        summaries_per_day: 날짜별 요약 수 (None이면 articles_per_day와 같음)
+        rank_words: rank CSV 단어 수
+        seed: 난수 시드
+
+    Returns:
+        dict: {"dates": [...], "html_files": [...], "txt_dirs": [...], "res_dir": Path}
+    """
+    rng = random.Random(seed)
+    summaries_per_day = articles_per_day if summaries_per_day is None else summaries_per_day
+
+    start = datetime(2025, 10, 20)
+    dates, html_files, txt_dirs = [], [], []
+    for d in range(days):
+        day = start + timedelta(days=d)
+        date_str = day.strftime("%Y%m%d")
+        dates.append(date_str)
+
+        html_dir = root / "html" / date_str
+        txt_dir = root / "data" / date_str
+        html_dir.mkdir(parents=True, exist_ok=True)
+        txt_dir.mkdir(parents=True, exist_ok=True)
+        txt_dirs.append(txt_dir)
+
+        for i in range(articles_per_day):
+            article_id = f"{rng.randint(1, 999):03d}{d:04d}{i:06d}"
+            title, body, press, reporter = make_article(rng, sentences)
+            published = day + timedelta(seconds=rng.randint(0, 86399))
+            url = f"https://n.news.naver.com/mnews/article/{article_id[:3]}/{article_id[3:]}"
+            html_file = html_dir / f"{article_id}.html"
+            html_file.write_text(make_naver_html(title, body, press, reporter, published, url), encoding="utf-8")
+            html_files.append(html_file)
+            (txt_dir / f"{article_id}.txt").write_text(body, encoding="utf-8")
+
+        # rank CSV (빈도수 내림차순)
+        rank_dir = root / "res" / "rank"
+        rank_dir.mkdir(parents=True, exist_ok=True)
+        words = rng.sample(NOUNS, min(rank_words, len(NOUNS)))
+        counts = sorted((rng.randint(50, 3000) for _ in words), reverse=True)
+        with open(rank_dir / f"{date_str}.csv", "w", encoding="utf-8-sig", newline="") as f:
+            f.write("word,count\n")
+            for word, count in zip(words, counts):
+                f.write(f"{word},{count}\n")
+
+        # .sum 파일
+        summary_dir = root / "res" / "summary"
+        summary_dir.mkdir(parents=True, exist_ok=True)
+        with open(summary_dir / f"{date_str}.sum", "w", encoding="utf-8") as f:
+            for _ in range(summaries_per_day):
+                f.write(f"<분류>: {rng.choice(CATEGORIES)}\n<요약>: {make_sentence(rng)} {make_sentence(rng)}\n\n")
+
+    return {"dates": dates, "html_files": html_files, "txt_dirs": txt_dirs, "res_dir": root / "res"}
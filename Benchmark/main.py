@@ -0,0 +1,307 @@
+"""
+파이프라인 전체 벤치마크
+
+합성 코퍼스(corpus.py)를 만든 뒤 각 단계의 핵심 함수를 측정하고 결과를 JSON으로 저장한다.
+
+    Downloader : extract_title_and_body
+    Tokenizer  : gen_word_count, word_count_for_folder (cold / warm), save_word_count_to_file
+    Summarizer : TextRank 추출 요약 (기사별, 날짜 폴더 일괄)
+    Sketch     : 상위 키워드 스케치 추가 / 병합 / 조회 시간과 정확한 카운트 대비 정확도 (Zipf 합성 단어 스트림)
+    WebProgram : State.load_summary_data, 히트맵 차트 생성(build_dashboard_data + heatmap_figure)
+
+사용 예:
+    python main.py                                  # 기본 규모
+    python main.py --days 3 --articles-per-day 500  # 규모 조절
+    python main.py --compare results/20251101_120000.json   # 이전 결과와 비교
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from corpus import generate_corpus
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def load_stage_module(name: str, path: Path):
+    """각 단계의 main.py를 이름이 겹치지 않게 모듈로 로드"""
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(fn, items, repeat: int = 1, unit: str = "item") -> dict:
+    """
+    items 각각에 fn을 호출하며 시간 측정
+
+    Returns:
+        dict: {"n", "unit", "total_s", "mean_ms", "p50_ms", "p95_ms", "per_s"}
+    """
+    durations = []
+    for _ in range(repeat):
+        for item in items:
+            started = time.perf_counter()
+            fn(item)
+            durations.append(time.perf_counter() - started)
+
+    total = sum(durations)
+    durations.sort()
+    return {
+        "n": len(durations),
+        "unit": unit,
+        "total_s": round(total, 4),
+        "mean_ms": round(total / len(durations) * 1000, 3) if durations else 0.0,
+        "p50_ms": round(durations[len(durations) // 2] * 1000, 3) if durations else 0.0,
+        "p95_ms": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))] * 1000, 3) if durations else 0.0,
+        "per_s": round(len(durations) / total, 2) if total else 0.0,
+    }
+
+
+def bench_downloader(corpus: dict, results: dict):
+    downloader = load_stage_module("downloader_main", ROOT_DIR / "Downloader" / "main.py")
+    pages = [f.read_text(encoding="utf-8") for f in corpus["html_files"]]
+    results["extract_title_and_body"] = measure(downloader.extract_title_and_body, pages, unit="page")
+
+
+def bench_tokenizer(corpus: dict, results: dict):
+    tokenizer = load_stage_module("tokenizer_main", ROOT_DIR / "Tokenizer" / "main.py")
+    from kiwipiepy import Kiwi
+
+    kiwi = Kiwi()
+    texts = [f.read_text(encoding="utf-8") for d in corpus["txt_dirs"] for f in sorted(d.glob("*.txt"))]
+    kiwi.tokenize(texts[0])  # 모델 로딩은 측정에서 제외
+
+    # 문장 캐시는 모듈 전역이라 앞 측정에서 채워진 결과가 다음 측정을 빠르게 만든다.
+    # 측정마다 비운 상태(cold)에서 시작하고, 캐시가 찬 상태(warm)는 따로 기록한다.
+    tokenizer.sentence_cache = tokenizer.SentenceNounCache()
+    results["gen_word_count"] = measure(lambda text: tokenizer.gen_word_count(kiwi, text), texts, unit="article")
+
+    def measure_folders():
+        cache = tokenizer.sentence_cache
+        hits, misses = cache.hits, cache.misses
+        folder = measure(tokenizer.word_count_for_folder, corpus["txt_dirs"], unit="folder")
+        folder["articles_per_s"] = round(len(texts) / folder["total_s"], 2) if folder["total_s"] else 0.0
+        hits, misses = cache.hits - hits, cache.misses - misses
+        folder["sentence_cache_hit_ratio"] = round(hits / max(1, hits + misses), 4)
+        return folder
+
+    tokenizer.sentence_cache = tokenizer.SentenceNounCache()
+    results["word_count_for_folder"] = measure_folders()
+    results["word_count_for_folder_warm"] = measure_folders()
+
+    word_dic = tokenizer.word_count_for_folder(corpus["txt_dirs"][0])
+    # save_word_count_to_file는 Tokenizer/data에 쓰므로 벤치마크 전용 파일명 사용 후 삭제
+    bench_names = [f"bench_{os.getpid()}_{i}" for i in range(20)]
+    results["save_word_count_to_file"] = measure(
+        lambda name: tokenizer.save_word_count_to_file(name, word_dic), bench_names, unit="file"
+    )
+    results["save_word_count_to_file"]["words"] = len(word_dic)
+    for name in bench_names:
+        (ROOT_DIR / "Tokenizer" / "data" / f"{name}.csv").unlink(missing_ok=True)
+
+
+def bench_summarizer(corpus: dict, results: dict):
+    textrank = load_stage_module("summarizer_textrank", ROOT_DIR / "Summarizer" / "textrank.py")
+    summarizer = textrank.TextRankSummarizer()
+    folders = [
+        [(f.stem, f.read_text(encoding="utf-8")) for f in sorted(d.glob("*.txt"))]
+        for d in corpus["txt_dirs"]
+    ]
+    articles = [article for folder in folders for article in folder]
+    summarizer.summarize(*articles[0])  # 모델 로딩은 측정에서 제외
+
+    results["textrank_summarize"] = measure(lambda article: summarizer.summarize(*article), articles, unit="article")
+    batch = measure(summarizer.summarize_many, folders, unit="folder")
+    batch["articles_per_s"] = round(len(articles) / batch["total_s"], 2) if batch["total_s"] else 0.0
+    results["textrank_summarize_many"] = batch
+
+
+# 스케치 정확도 측정용 Zipf 단어 스트림: 어휘 수, 지수, (날짜 × 샤드)별 단어 수
+SKETCH_VOCAB = 200_000
+SKETCH_ZIPF = 1.1
+SKETCH_DAYS = 30
+SKETCH_SHARDS = 4
+SKETCH_BATCH_WORDS = 40_000
+SKETCH_TOP_K = 100
+
+
+def bench_sketch(results: dict, seed: int):
+    import numpy as np
+
+    sketch_module = load_stage_module("tokenizer_sketch", ROOT_DIR / "Tokenizer" / "sketch.py")
+    rng = np.random.default_rng(seed)
+    vocab = [f"단어{i}" for i in range(SKETCH_VOCAB)]
+    p = 1.0 / np.arange(1, SKETCH_VOCAB + 1) ** SKETCH_ZIPF
+    p /= p.sum()
+
+    # (날짜, 샤드)별 {단어: 출현횟수} 묶음과 정확한 전체 카운트
+    exact = np.zeros(SKETCH_VOCAB, dtype=np.int64)
+    batches = []
+    for _ in range(SKETCH_DAYS * SKETCH_SHARDS):
+        ids, counts = np.unique(rng.choice(SKETCH_VOCAB, size=SKETCH_BATCH_WORDS, p=p), return_counts=True)
+        exact[ids] += counts
+        batches.append({vocab[i]: int(c) for i, c in zip(ids, counts)})
+
+    # 샤드마다 스케치를 만들고 (추가), 날짜 → 전체 기간 순서로 병합
+    sketches = []
+    def add_batch(batch):
+        sketch = sketch_module.KeywordSketch()
+        sketch.add(batch)
+        sketches.append(sketch)
+    add = measure(add_batch, batches, unit="batch")
+    add["words_per_s"] = round(sum(len(b) for b in batches) / add["total_s"], 2) if add["total_s"] else 0.0
+    results["sketch_add"] = add
+
+    merged = sketch_module.KeywordSketch()
+    results["sketch_merge"] = measure(merged.merge, sketches, unit="sketch")
+
+    top = []
+    results["sketch_top_k"] = measure(lambda _: top.__setitem__(slice(None), merged.top_k(SKETCH_TOP_K)), range(10), unit="query")
+
+    # 정확도: 상위 k개 재현율 / 상위 k개 추정 오차 / 임의 단어 빈도 추정 오차 (Count-Min 보장 범위 대비)
+    true_top = {vocab[i] for i in np.argsort(-exact, kind="stable")[:SKETCH_TOP_K]}
+    top_errors = [abs(estimate - exact[int(word[2:])]) / exact[int(word[2:])] for word, estimate, _ in top]
+    sample = rng.choice(SKETCH_VOCAB, size=5000, replace=False)
+    errors = merged.frequency([vocab[i] for i in sample]) - exact[sample]
+    bound = merged.cms.error_bound()
+    exact_bytes = sys.getsizeof({}) + sum(
+        sys.getsizeof(vocab[i]) + sys.getsizeof(int(exact[i])) + 16 for i in np.flatnonzero(exact)
+    )
+    results["sketch_top_k"].update({
+        "recall_at_k": len(true_top & {word for word, _, _ in top}) / SKETCH_TOP_K,
+        "top_k_max_rel_error": round(max(top_errors), 6),
+        "frequency_max_error": int(errors.max()),
+        "frequency_mean_error": round(float(errors.mean()), 3),
+        "frequency_error_bound": round(bound, 1),
+        "frequency_over_bound_ratio": float((errors > bound).mean()),
+        "total_words": int(exact.sum()),
+        "distinct_words": int((exact > 0).sum()),
+        "sketch_bytes": merged.memory_bytes(),
+        "exact_dict_bytes": exact_bytes,
+    })
+
+
+def bench_webprogram(corpus: dict, results: dict, repeat: int):
+    # WebProgram은 res 폴더 경로를 import 시점에 정하므로 먼저 환경 변수 설정
+    os.environ["WEBPROGRAM_RES_DIR"] = str(corpus["res_dir"])
+    sys.path.insert(0, str(ROOT_DIR / "WebProgram"))
+    from WebProgram.WebProgram import State
+    from WebProgram import charts
+
+    # 이벤트 핸들러 원본 함수를 State 없이 호출 (summary_data만 채우면 됨)
+    load_summary_data = getattr(State.load_summary_data, "fn", State.load_summary_data)
+    session = SimpleNamespace(summary_data=[])
+    results["State.load_summary_data"] = measure(
+        lambda date: load_summary_data(session, date), corpus["dates"], repeat=repeat, unit="day"
+    )
+    results["State.load_summary_data"]["summaries_per_day"] = len(session.summary_data)
+
+    # 캐시를 거치지 않는 히트맵 생성 비용 (CSV 읽기 + 행렬 + figure)
+    def heatmap_cold(_):
+        charts._cache["version"] = None
+        return charts.heatmap_figure(charts.build_dashboard_data(charts.RANK_DIR))
+
+    results["heatmap_chart_config"] = measure(heatmap_cold, range(repeat * 10), unit="build")
+
+
+def compare(current: dict, previous_file: Path):
+    """이전 결과와 mean_ms 비교 출력"""
+    previous = json.loads(previous_file.read_text(encoding="utf-8"))
+    print(f"\n비교 대상: {previous_file} ({previous.get('timestamp')})")
+    for name, stats in current["benchmarks"].items():
+        before = previous.get("benchmarks", {}).get(name)
+        if not before or not before.get("mean_ms"):
+            print(f"  {name:<28} (이전 결과 없음)")
+            continue
+        ratio = stats["mean_ms"] / before["mean_ms"]
+        mark = "▲ 느려짐" if ratio > 1.1 else ("▼ 빨라짐" if ratio < 0.9 else "=")
+        print(f"  {name:<28} {before['mean_ms']:>10.3f}ms → {stats['mean_ms']:>10.3f}ms  x{ratio:.2f} {mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Article Analyser 파이프라인 벤치마크")
+    parser.add_argument("--days", type=int, default=2, help="합성 데이터 날짜 수")
+    parser.add_argument("--articles-per-day", type=int, default=200, help="날짜별 기사 수")
+    parser.add_argument("--sentences", type=int, default=12, help="기사당 문장 수")
+    parser.add_argument("--summaries-per-day", type=int, default=1000, help="날짜별 요약 수")
+    parser.add_argument("--repeat", type=int, default=5, help="WebProgram 측정 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--only", nargs="*", choices=["downloader", "tokenizer", "summarizer", "sketch", "webprogram"],
+                        help="측정할 단계만 선택 (기본: 전체)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: results/<시각>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    stages = args.only or ["downloader", "tokenizer", "summarizer", "sketch", "webprogram"]
+    corpus_dir = Path(tempfile.mkdtemp(prefix="article_bench_"))
+    benchmarks = {}
+    try:
+        print(f"합성 코퍼스 생성 중: {corpus_dir}")
+        corpus = generate_corpus(
+            corpus_dir, args.days, args.articles_per_day, args.sentences,
+            summaries_per_day=args.summaries_per_day, seed=args.seed,
+        )
+        print(f"  - 기사 {len(corpus['html_files'])}개, 날짜 {len(corpus['dates'])}개")
+
+        if "downloader" in stages:
+            print("Downloader 측정 중...")
+            bench_downloader(corpus, benchmarks)
+        if "tokenizer" in stages:
+            print("Tokenizer 측정 중...")
+            bench_tokenizer(corpus, benchmarks)
+        if "summarizer" in stages:
+            print("Summarizer 측정 중...")
+            bench_summarizer(corpus, benchmarks)
+        if "sketch" in stages:
+            print("Sketch 측정 중...")
+            bench_sketch(benchmarks, args.seed)
+        if "webprogram" in stages:
+            print("WebProgram 측정 중...")
+            bench_webprogram(corpus, benchmarks, args.repeat)
+    finally:
+        shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    result = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "days": args.days,
+            "articles_per_day": args.articles_per_day,
+            "sentences": args.sentences,
+            "summaries_per_day": args.summaries_per_day,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "benchmarks": benchmarks,
+    }
+
+    print(f"\n{'='*70}")
+    for name, stats in benchmarks.items():
+        print(f"  {name:<28} mean {stats['mean_ms']:>10.3f}ms  p95 {stats['p95_ms']:>10.3f}ms  "
+              f"{stats['per_s']:>10.2f} {stats['unit']}/s")
+    print(f"{'='*70}")
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {output}")
+
+    if args.compare:
+        compare(result, Path(args.compare))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+기사 메타데이터 (발행 시각, 언론사, 기자, 원문 URL)
+
+Downloader가 본문을 추출할 때 같은 파싱 결과에서 함께 뽑아 날짜 폴더의 metadata.jsonl에 기록한다.
+Tokenizer 등 이후 단계는 기사 페이지를 다시 받거나 파싱하지 않고 이 파일 하나만 읽는다.
+
+    data/<yyyymmdd>/metadata.jsonl
+        {"file": "기사 제목.txt", "url": "https://n.news.naver.com/...", "published": "2025-10-21T09:05:12",
+         "modified": "2025-10-21T10:12:00", "press": "연합뉴스", "reporters": ["홍길동"], "origin_url": "https://..."}
+
+시각은 기사에 적힌 시각(KST) 그대로이며 시간대 정보는 붙이지 않는다. 값을 찾지 못한 항목은 null / 빈 리스트.
+같은 파일명이 여러 번 기록되면 마지막 줄을 사용한다 (재다운로드, 재추출).
+"""
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+METADATA_NAME = "metadata.jsonl"
+
+# 다운로드 스레드들이 같은 날짜 파일에 동시에 추가하지 않도록
+_write_lock = threading.Lock()
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[str]:
+    """
+    "2025-10-21 09:05:12", "2025-10-21T09:05:12+09:00" 등 → "2025-10-21T09:05:12" (형식이 다르면 None)
+    """
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    return moment.replace(tzinfo=None).isoformat(timespec="seconds")
+
+
+def append_metadata(date_dir: Path, record: Dict[str, Any]):
+    """기사 하나의 메타데이터를 날짜 폴더 metadata.jsonl 끝에 추가"""
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _write_lock:
+        with open(Path(date_dir) / METADATA_NAME, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def write_metadata(date_dir: Path, records: Iterable[Dict[str, Any]], removed: Iterable[str] = ()):
+    """
+    여러 기사의 메타데이터를 기존 항목과 합쳐 다시 저장 (파일명 순, 임시 파일에 쓴 뒤 교체)
+
+    Args:
+        date_dir: 날짜 폴더
+        records: 메타데이터 항목 (같은 파일명의 기존 항목을 대체)
+        removed: 지울 기사 파일명 (재추출로 파일명이 바뀌어 지운 이전 파일)
+    """
+    path = Path(date_dir) / METADATA_NAME
+    with _write_lock:
+        entries = read_metadata(date_dir)
+        for name in removed:
+            entries.pop(name, None)
+        for record in records:
+            entries[record["file"]] = record
+        tmp_path = path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for name in sorted(entries):
+                f.write(json.dumps(entries[name], ensure_ascii=False) + "\n")
+        tmp_path.replace(path)
+
+
+def read_metadata(date_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """날짜 폴더 metadata.jsonl → {기사 파일명: 메타데이터} (파일이 없으면 빈 딕셔너리)"""
+    path = Path(date_dir) / METADATA_NAME
+    entries: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return entries
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # 쓰는 도중 중단된 마지막 줄 등
+                continue
+            if record.get("file"):
+                entries[record["file"]] = record
+    return entries
+
+
+def published_at(record: Optional[Dict[str, Any]]) -> Optional[datetime]:
+    """메타데이터의 발행 시각 (없거나 형식이 다르면 None)"""
+    if not record or not record.get("published"):
+        return None
+    try:
+        return datetime.fromisoformat(record["published"])
+    except ValueError:
+        return None
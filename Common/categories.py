@@ -0,0 +1,325 @@
+"""
+기사 분류 (고정 분류 체계 + 로컬 중심점 분류기)
+
+.sum 파일의 <분류>는 LLM이 기사마다 자유롭게 붙여서 "기업 사회공헌 활동" / "기업 사회공헌"처럼 흩어진다.
+여기서는 고정된 분류 체계(TAXONOMY)와 TF-IDF 중심점(centroid) 분류기로 분류를 정한다.
+
+    categorize(labels, summaries)   기존 분류 + 요약 → 고정 분류 (대시보드, Summarizer 공용)
+    get_classifier()                category_model.npz가 있으면 학습된 모델, 없으면 시드 키워드만으로 만든 모델
+
+특징은 형태소 분석 없이 단어 + 한글 음절 bigram을 해싱한 벡터라서 (조사가 붙어도 "은행은" → "은행" bigram)
+Kiwi 없이 기사 수천 개를 수 ms에 분류한다.
+
+학습 (과거 요약으로 중심점 보정):
+    python categories.py --train ../Summarizer/data
+"""
+import argparse
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 분류 → 시드 키워드. 순서가 곧 분류 번호이므로 바꾸면 모델을 다시 학습해야 함
+TAXONOMY: Dict[str, List[str]] = {
+    "은행": ["은행", "시중은행", "인터넷은행", "지방은행", "예금", "적금", "수신", "여신"],
+    "대출·가계부채": ["대출", "가계대출", "주택담보대출", "주담대", "전세대출", "신용대출", "가계부채", "DSR", "연체"],
+    "금리·통화정책": ["금리", "기준금리", "한국은행", "한은", "통화정책", "금통위", "금리인하", "금리인상"],
+    "증권·자본시장": ["증권", "증권사", "주식", "증시", "코스피", "코스닥", "주가", "펀드", "ETF", "채권", "상장", "공매도"],
+    "보험": ["보험", "보험사", "생명보험", "손해보험", "보험료", "보험금", "실손보험"],
+    "카드·결제": ["카드", "카드사", "신용카드", "결제", "간편결제", "가맹점", "페이"],
+    "가상자산": ["가상자산", "비트코인", "코인", "암호화폐", "스테이블코인", "블록체인", "가상자산거래소"],
+    "부동산": ["부동산", "주택", "아파트", "분양", "청약", "전세", "재건축", "PF"],
+    "금융당국·규제": ["금융위원회", "금융위", "금융감독원", "금감원", "금융당국", "규제", "감독", "제재", "금융정책"],
+    "소비자 보호": ["소비자", "소비자보호", "보이스피싱", "금융사기", "피해", "민원", "불완전판매"],
+    "디지털금융": ["디지털", "핀테크", "플랫폼", "인공지능", "AI", "모바일", "마이데이터", "앱"],
+    "기업·실적": ["기업", "실적", "영업이익", "순이익", "매출", "배당", "금융지주", "회장", "인사"],
+    "사회공헌·ESG": ["사회공헌", "ESG", "기부", "봉사", "후원", "상생", "나눔", "친환경"],
+    "환율·글로벌": ["환율", "달러", "원화", "미국", "연준", "글로벌", "해외", "수출", "관세", "글로벌 경제"],
+}
+OTHER_CATEGORY = "기타"
+CATEGORIES = list(TAXONOMY) + [OTHER_CATEGORY]
+
+# 분류명 / 시드 키워드와 (공백 빼고) 똑같은 분류 문자열은 분류기 없이 바로 정함
+KEYWORD_CATEGORY: Dict[str, str] = {}
+for _category, _keywords in TAXONOMY.items():
+    for _keyword in [_category] + _keywords:
+        KEYWORD_CATEGORY.setdefault(_keyword.replace(" ", "").lower(), _category)
+
+# 특징 해싱 차원 (2의 거듭제곱)
+FEATURE_DIM = 1 << 15
+# 가장 가까운 중심점과의 코사인 유사도가 이보다 낮으면 "기타"
+MIN_SCORE = 0.05
+# 기존 분류 문자열만으로 이 유사도 이상이면 요약은 보지 않고 그 분류로 정함 (분류 문자열별로 캐시)
+LABEL_MIN_SCORE = 0.3
+# 학습: 자기 학습 반복 횟수, 중심점에 섞는 시드 벡터 비중,
+# 중심점 갱신에 쓰는 최소 유사도 (애매한 요약이 중심점을 끌어당기지 않도록 MIN_SCORE보다 높게)
+TRAIN_ROUNDS = 3
+SEED_WEIGHT = 0.3
+TRAIN_MIN_SCORE = 0.15
+
+MODEL_FILE = Path(__file__).parent / "category_model.npz"
+
+_WORD = re.compile(r"[가-힣]+|[A-Za-z]+|\d+")
+_HANGUL_WORD = re.compile(r"[가-힣]{2,}")
+
+
+def _feature_counts(text: str) -> Dict[int, int]:
+    """단어 + 한글 음절 bigram 특징의 해시 → 출현 횟수"""
+    counts: Dict[int, int] = {}
+    for word in _WORD.findall(text):
+        word = word.lower()
+        features = ["w:" + word]
+        if _HANGUL_WORD.fullmatch(word):
+            features.extend("b:" + word[i:i + 2] for i in range(len(word) - 1))
+        for feature in features:
+            h = zlib.crc32(feature.encode("utf-8")) & (FEATURE_DIM - 1)
+            counts[h] = counts.get(h, 0) + 1
+    return counts
+
+
+def _row_sums(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """CSR 형태로 이어 붙인 값의 행별 합 (마지막 축 기준, 빈 행은 0)"""
+    zeros = np.zeros(values.shape[:-1] + (1,))
+    cumulative = np.concatenate([zeros, np.cumsum(values, axis=-1)], axis=-1)
+    return cumulative[..., indptr[1:]] - cumulative[..., indptr[:-1]]
+
+
+def vectorize(texts: Iterable[str], idf: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    텍스트들을 L2 정규화된 TF-IDF 희소 벡터로 변환
+
+    Args:
+        texts: 텍스트 목록
+        idf: (FEATURE_DIM,) IDF 가중치 (없으면 1)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: CSR 형식 (indices, data, indptr)
+    """
+    indptr = [0]
+    indices: List[int] = []
+    values: List[int] = []
+    for text in texts:
+        counts = _feature_counts(text)
+        indices.extend(counts.keys())
+        values.extend(counts.values())
+        indptr.append(len(indices))
+
+    indices_arr = np.asarray(indices, dtype=np.int64)
+    indptr_arr = np.asarray(indptr, dtype=np.int64)
+    data = 1.0 + np.log(np.asarray(values, dtype=np.float64))
+    if idf is not None:
+        data *= idf[indices_arr]
+    norms = np.sqrt(_row_sums(data * data, indptr_arr))
+    row_of = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr_arr))
+    data /= np.where(norms > 0, norms, 1.0)[row_of]
+    return indices_arr, data, indptr_arr
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+class CategoryClassifier:
+    """
+    최근접 중심점 분류기
+
+    Args:
+        centroids: (분류 수, FEATURE_DIM) L2 정규화된 중심점 ("기타" 제외)
+        idf: (FEATURE_DIM,) IDF 가중치
+    """
+
+    def __init__(self, centroids: np.ndarray, idf: np.ndarray):
+        self.centroids = centroids.astype(np.float32)
+        self.idf = idf
+
+    @staticmethod
+    def seed_centroids(idf: np.ndarray) -> np.ndarray:
+        """분류명 + 시드 키워드로 만든 중심점"""
+        texts = [" ".join([name] + keywords) for name, keywords in TAXONOMY.items()]
+        indices, data, indptr = vectorize(texts, idf)
+        centroids = np.zeros((len(texts), FEATURE_DIM))
+        np.add.at(centroids, (np.repeat(np.arange(len(texts)), np.diff(indptr)), indices), data)
+        return _normalize_rows(centroids)
+
+    @classmethod
+    def from_seeds(cls) -> "CategoryClassifier":
+        idf = np.ones(FEATURE_DIM)
+        return cls(cls.seed_centroids(idf), idf)
+
+    @classmethod
+    def train(cls, texts: Sequence[str], rounds: int = TRAIN_ROUNDS) -> "CategoryClassifier":
+        """
+        과거 요약으로 학습 (시드 중심점에서 출발하는 자기 학습)
+
+        라벨이 붙은 학습 데이터가 없으므로, 시드 중심점으로 분류 → 분류별 평균 벡터로 중심점 갱신을
+        rounds번 반복한다. 시드 벡터를 SEED_WEIGHT만큼 섞어서 분류가 시드 키워드에서 멀어지지 않게 한다.
+
+        Args:
+            texts: "기존 분류 + 요약" 텍스트 목록
+
+        Returns:
+            CategoryClassifier: 학습된 분류기
+        """
+        indices, data, indptr = vectorize(texts)
+        rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        # 문서 빈도 (한 문서에 같은 특징은 한 번만 있음)
+        doc_freq = np.bincount(indices, minlength=FEATURE_DIM)
+        idf = np.log((1 + len(texts)) / (1 + doc_freq)) + 1.0
+
+        seeds = cls.seed_centroids(idf)
+        model = cls(seeds, idf)
+        indices, data, indptr = vectorize(texts, idf)
+        for _ in range(rounds):
+            scores = model.scores_csr(indices, data, indptr)
+            labels = scores.argmax(axis=1)
+            assigned = scores.max(axis=1) >= TRAIN_MIN_SCORE
+            keep = assigned[rows]
+            sums = np.zeros_like(seeds)
+            np.add.at(sums, (labels[rows][keep], indices[keep]), data[keep])
+            model = cls(_normalize_rows((1 - SEED_WEIGHT) * _normalize_rows(sums) + SEED_WEIGHT * seeds), idf)
+        return model
+
+    def scores_csr(self, indices: np.ndarray, data: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+        """(문서 수, 분류 수) 코사인 유사도. 모든 문서를 한 번의 배열 연산으로 계산"""
+        return _row_sums(self.centroids[:, indices] * data, indptr).T
+
+    def scores(self, texts: Sequence[str]) -> np.ndarray:
+        return self.scores_csr(*vectorize(texts, self.idf))
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        """텍스트별 분류 (유사도가 MIN_SCORE보다 낮으면 "기타")"""
+        if not texts:
+            return []
+        scores = self.scores(texts)
+        best = scores.argmax(axis=1)
+        return [
+            CATEGORIES[b] if s >= MIN_SCORE else OTHER_CATEGORY
+            for b, s in zip(best.tolist(), scores.max(axis=1).tolist())
+        ]
+
+    def save(self, path: Path = MODEL_FILE):
+        np.savez_compressed(path, centroids=self.centroids, idf=self.idf, categories=np.array(CATEGORIES[:-1]))
+
+    @classmethod
+    def load(cls, path: Path = MODEL_FILE) -> "CategoryClassifier":
+        """저장된 모델 로드. 분류 체계가 바뀐 뒤의 모델이면 ValueError"""
+        with np.load(path) as model:
+            if model["categories"].tolist() != CATEGORIES[:-1]:
+                raise ValueError(f"분류 체계가 바뀌었습니다. 다시 학습하세요: {path}")
+            return cls(model["centroids"], model["idf"])
+
+
+_classifier: Optional[CategoryClassifier] = None
+_classifier_version: Optional[str] = None
+# 기존 분류 문자열 → 고정 분류 (분류 문자열만으로 확실한 경우만)
+_label_cache: Dict[str, Optional[str]] = {}
+
+
+def model_version() -> str:
+    """분류 결과가 바뀌는 조건 (분류 체계 + 모델 파일). 분류 결과를 저장해 두는 쪽에서 갱신 여부 판단용"""
+    try:
+        model_mtime = MODEL_FILE.stat().st_mtime_ns
+    except OSError:
+        model_mtime = 0
+    return f"{zlib.crc32(repr(TAXONOMY).encode('utf-8')):08x}:{model_mtime}"
+
+
+def get_classifier() -> CategoryClassifier:
+    """category_model.npz가 있으면 로드, 없거나 읽을 수 없으면 시드 키워드 모델 (모델 파일이 바뀔 때만 다시 생성)"""
+    global _classifier, _classifier_version
+    version = model_version()
+    if _classifier is None or version != _classifier_version:
+        _classifier = None
+        _classifier_version = version
+        _label_cache.clear()
+        if MODEL_FILE.exists():
+            try:
+                _classifier = CategoryClassifier.load(MODEL_FILE)
+            except Exception as e:
+                print(f"✗ Error loading category model {MODEL_FILE}: {e}")
+        if _classifier is None:
+            _classifier = CategoryClassifier.from_seeds()
+    return _classifier
+
+
+def categorize(labels: Sequence[str], summaries: Sequence[str]) -> List[str]:
+    """
+    기존 분류(LLM이 붙인 자유 형식 등)와 요약으로 고정 분류 결정
+
+    1. 고정 분류 이름이나 시드 키워드와 같으면 그 분류
+    2. 분류 문자열만으로 LABEL_MIN_SCORE 이상이면 그 분류 (분류 문자열별로 캐시)
+    3. 나머지는 "분류 + 요약"으로 분류
+
+    Args:
+        labels: 기존 분류 목록
+        summaries: 요약 목록 (labels와 같은 길이)
+
+    Returns:
+        List[str]: 고정 분류 목록 (CATEGORIES 중 하나)
+    """
+    classifier = get_classifier()
+
+    unknown = sorted({label for label in labels if label not in _label_cache})
+    for label in unknown:
+        _label_cache[label] = KEYWORD_CATEGORY.get(label.replace(" ", "").lower())
+    unknown = [label for label in unknown if _label_cache[label] is None]
+    if unknown:
+        scores = classifier.scores(unknown)
+        best = scores.argmax(axis=1)
+        for label, b, s in zip(unknown, best.tolist(), scores.max(axis=1).tolist()):
+            _label_cache[label] = CATEGORIES[b] if s >= LABEL_MIN_SCORE else None
+
+    result: List[Optional[str]] = [_label_cache[label] for label in labels]
+    pending = [i for i, category in enumerate(result) if category is None]
+    if pending:
+        predicted = classifier.predict([f"{labels[i]} {summaries[i]}" for i in pending])
+        for i, category in zip(pending, predicted):
+            result[i] = category
+    return result
+
+
+def read_summary_entries(summary_dir: Path) -> List[Tuple[str, str]]:
+    """summary_dir의 모든 .sum 파일에서 (분류, 요약) 목록"""
+    entries = []
+    for summary_file in sorted(summary_dir.glob("*.sum")):
+        category = ""
+        for line in summary_file.read_text(encoding="utf-8").split("\n"):
+            line = line.strip()
+            if line.startswith("<분류>:"):
+                category = line[len("<분류>:"):].strip()
+            elif line.startswith("<요약>:") and category:
+                entries.append((category, line[len("<요약>:"):].strip()))
+                category = ""
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 분류기 학습 / 확인")
+    parser.add_argument("--train", metavar="SUMMARY_DIR", help="과거 .sum 파일 폴더로 학습해서 category_model.npz 저장")
+    parser.add_argument("--show", metavar="SUMMARY_DIR", help="기존 분류 → 고정 분류 매핑 출력")
+    args = parser.parse_args()
+
+    if args.train:
+        entries = read_summary_entries(Path(args.train))
+        if not entries:
+            print(f"✗ 학습할 요약이 없습니다: {args.train}")
+            return
+        model = CategoryClassifier.train([f"{label} {summary}" for label, summary in entries])
+        model.save(MODEL_FILE)
+        print(f"✓ 요약 {len(entries)}개로 학습, 저장: {MODEL_FILE}")
+
+    if args.show:
+        entries = read_summary_entries(Path(args.show))
+        mapping: Dict[Tuple[str, str], int] = {}
+        for (label, _), category in zip(entries, categorize([e[0] for e in entries], [e[1] for e in entries])):
+            mapping[(label, category)] = mapping.get((label, category), 0) + 1
+        for (label, category), count in sorted(mapping.items(), key=lambda x: -x[1]):
+            print(f"{count:>6}  {label} → {category}")
+        print(f"기존 분류 {len({label for label, _ in mapping})}개 → 고정 분류 {len({c for _, c in mapping})}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+대시보드 사전 계산 데이터 (카드 / 히트맵 / 라인 차트)
+
+Tokenizer는 실행이 끝날 때 이 구조를 data/dashboard.json으로 저장하고,
+WebProgram은 dashboard.json이 없거나 rank 폴더의 날짜와 맞지 않을 때 rank CSV로 같은 구조를 직접 만든다.
+두 쪽이 같은 함수를 쓰므로 어느 경로로 만들어도 화면이 같다.
+
+    {"dates", "top_k", "card_data", "heatmap_matrix", "line_chart_data", "line_series"}
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+# 대시보드에 쓰는 최신 날짜 수
+MAX_DAYS = 7
+
+# 화면별로 사용하는 상위 단어 수
+CARD_TOP = 4
+LINE_TOP = 10
+HEATMAP_WORDS = 20
+LINE_SERIES_WORDS = 5
+# 날짜별로 보관하는 상위 단어 수 (상세 페이지 / 히트맵 조회 범위)
+DETAIL_TOP = 30
+
+
+def latest_rank_dates(rank_dir: Path, max_days: int = MAX_DAYS) -> List[str]:
+    """rank 폴더의 yyyymmdd.csv 중 최신 max_days개 날짜 (오름차순)"""
+    if not rank_dir.exists():
+        return []
+    dates = sorted(f.stem for f in rank_dir.glob("*.csv") if len(f.stem) == 8 and f.stem.isdigit())
+    return dates[-max_days:]
+
+
+def build_dashboard(top_by_date: Dict[str, Sequence[Tuple[str, int]]]) -> Dict[str, Any]:
+    """
+    날짜별 상위 단어로 대시보드 데이터 생성
+
+    Args:
+        top_by_date: {yyyymmdd: [(단어, 빈도수), ...]} (빈도수 내림차순, 단어가 없는 날짜는 제외)
+
+    Returns:
+        dict:
+            - dates: 날짜 리스트 (오름차순)
+            - top_k: {날짜: [[단어, 빈도수], ...]}
+            - card_data: [{"date", "words": [{"word", "count"}]}] (상위 4개, count는 문자열)
+            - heatmap_matrix: {"x": 날짜, "y": 단어, "z": 단어 × 날짜 빈도수} (첫 날짜 상위 20개 단어 기준)
+            - line_chart_data: [{"date", 단어: 빈도수, ...}] (상위 10개)
+            - line_series: [{"name", "x", "y"}] (첫 날짜 기준 상위 5개 단어)
+    """
+    dates = sorted(d for d, rows in top_by_date.items() if rows)
+    top_k = {d: [[w, int(c)] for w, c in top_by_date[d]] for d in dates}
+
+    card_data = [
+        {"date": d, "words": [{"word": w, "count": str(c)} for w, c in top_k[d][:CARD_TOP]]}
+        for d in dates
+    ]
+
+    # 히트맵: 첫 번째 날짜의 상위 20개 단어 × 전체 날짜 (날짜별 보관 범위 안에서 조회)
+    heat_words = [w for w, _ in top_k[dates[0]][:HEATMAP_WORDS]] if dates else []
+    lookup = {d: dict(top_k[d]) for d in dates}
+    z = [[lookup[d].get(w, 0) for d in dates] for w in heat_words]
+
+    line_chart_data = []
+    for d in dates:
+        line = {"date": d}
+        line.update(top_k[d][:LINE_TOP])
+        line_chart_data.append(line)
+
+    # 라인 시리즈: 첫 날짜 기준 상위 5개 단어의 날짜별 추이
+    line_words = [w for w, _ in top_k[dates[0]][:LINE_SERIES_WORDS]] if dates else []
+    line_series = [
+        {"name": w, "x": dates, "y": [line.get(w, 0) for line in line_chart_data]}
+        for w in line_words
+    ]
+
+    return {
+        "dates": dates,
+        "top_k": top_k,
+        "card_data": card_data,
+        "heatmap_matrix": {"x": dates, "y": heat_words, "z": z} if dates else {},
+        "line_chart_data": line_chart_data,
+        "line_series": line_series,
+    }
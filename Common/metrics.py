@@ -0,0 +1,251 @@
+"""
+단계 공용 경량 메트릭 (Downloader / Tokenizer / Summarizer)
+
+카운터, 히스토그램, 시간 측정 구간(span)만 제공한다. 값은 프로세스 메모리에 모아두고
+환경 변수에 따라 내보낸다.
+
+    METRICS_PORT=9100         → http://localhost:9100/metrics 에 Prometheus 텍스트 형식으로 노출
+    METRICS_HOST=0.0.0.0      → 엔드포인트를 외부 인터페이스에도 노출 (기본: 127.0.0.1, 로컬에서만 접근)
+    METRICS_JSONL=metrics.jsonl → flush() / 프로세스 종료 시 스냅샷 한 줄씩 추가
+
+둘 다 없으면 수집만 하고 report()로 콘솔 요약만 출력한다.
+
+사용 예:
+    import metrics
+    metrics.configure("downloader")
+    with metrics.span("fetch"):
+        html = fetch(url)
+    metrics.inc("bytes_downloaded_total", len(html))
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+# 메트릭 이름 접두사 (Prometheus에서 다른 서비스와 구분)
+PREFIX = "article_"
+
+# Prometheus 엔드포인트 기본 바인드 주소 (METRICS_HOST로 변경)
+DEFAULT_HOST = "127.0.0.1"
+
+# 히스토그램 기본 버킷 (초 단위, 네트워크/LLM 지연까지 포함)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_lock = threading.Lock()
+_counters: Dict[LabelKey, float] = {}
+# (이름, 라벨) → [버킷별 개수..., 합계, 개수]
+_histograms: Dict[LabelKey, List[float]] = {}
+_stage = ""
+_jsonl_path = ""
+_server = None
+
+
+def _key(name: str, labels: Dict[str, str]) -> LabelKey:
+    if not labels:
+        return (name, ())
+    return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+def inc(name: str, value: float = 1, **labels):
+    """카운터 증가 (예: inc("files_written_total", kind="csv"))"""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, value: float, **labels):
+    """히스토그램에 값 하나 기록 (초 단위 권장)"""
+    key = _key(name, labels)
+    idx = bisect_left(DEFAULT_BUCKETS, value)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = [0] * (len(DEFAULT_BUCKETS) + 2)
+        if idx < len(DEFAULT_BUCKETS):
+            hist[idx] += 1
+        hist[-2] += value
+        hist[-1] += 1
+
+
+@contextmanager
+def span(name: str, **labels):
+    """
+    with 블록의 실행 시간을 <name>_seconds 히스토그램에 기록
+
+    예외가 나도 시간은 기록하고 예외는 그대로 전달한다.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(f"{name}_seconds", time.perf_counter() - started, **labels)
+
+
+def counter_total(name: str) -> float:
+    """라벨 구분 없이 합친 카운터 값"""
+    with _lock:
+        return sum(v for (n, _), v in _counters.items() if n == name)
+
+
+def span_total(name: str) -> Tuple[int, float]:
+    """라벨 구분 없이 합친 span의 (횟수, 총 소요 초)"""
+    with _lock:
+        hists = [h for (n, _), h in _histograms.items() if n == f"{name}_seconds"]
+    return int(sum(h[-1] for h in hists)), sum(h[-2] for h in hists)
+
+
+def _escape_label_value(value: str) -> str:
+    """Prometheus 텍스트 형식의 라벨 값 이스케이프 (\\, ", 줄바꿈)"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Dict[str, str] | None = None) -> str:
+    pairs = list(labels)
+    if _stage:
+        pairs.insert(0, ("stage", _stage))
+    if extra:
+        pairs.extend(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label_value(str(v))}"' for k, v in pairs) + "}"
+
+
+def snapshot() -> Dict[str, Dict[str, float | Dict[str, float]]]:
+    """
+    현재 값 복사본
+
+    Returns:
+        dict: {"counters": {"이름{라벨}": 값}, "histograms": {"이름{라벨}": {"count", "sum", "buckets"}}}
+    """
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: list(hist) for key, hist in _histograms.items()}
+
+    result = {"counters": {}, "histograms": {}}
+    for (name, labels), value in sorted(counters.items()):
+        result["counters"][PREFIX + name + _format_labels(labels)] = value
+    for (name, labels), hist in sorted(histograms.items()):
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(DEFAULT_BUCKETS, hist):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        result["histograms"][PREFIX + name + _format_labels(labels)] = {
+            "count": hist[-1],
+            "sum": round(hist[-2], 6),
+            "buckets": buckets,
+        }
+    return result
+
+
+def prometheus_text() -> str:
+    """Prometheus text exposition 형식 (0.0.4) 문자열"""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: list(hist) for key, hist in _histograms.items()}
+
+    lines = []
+    typed = set()
+    for (name, labels), value in sorted(counters.items()):
+        if name not in typed:
+            lines.append(f"# TYPE {PREFIX}{name} counter")
+            typed.add(name)
+        lines.append(f"{PREFIX}{name}{_format_labels(labels)} {value}")
+
+    for (name, labels), hist in sorted(histograms.items()):
+        if name not in typed:
+            lines.append(f"# TYPE {PREFIX}{name} histogram")
+            typed.add(name)
+        cumulative = 0
+        for bound, count in zip(DEFAULT_BUCKETS, hist):
+            cumulative += count
+            lines.append(f"{PREFIX}{name}_bucket{_format_labels(labels, {'le': str(bound)})} {cumulative}")
+        lines.append(f"{PREFIX}{name}_bucket{_format_labels(labels, {'le': '+Inf'})} {hist[-1]}")
+        lines.append(f"{PREFIX}{name}_sum{_format_labels(labels)} {hist[-2]}")
+        lines.append(f"{PREFIX}{name}_count{_format_labels(labels)} {hist[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프마다 콘솔에 찍히지 않도록 무시
+        pass
+
+
+def configure(stage: str, port: int | None = None, jsonl_path: str | None = None, host: str | None = None):
+    """
+    단계 이름을 정하고 환경 변수(또는 인자)에 따라 내보내기 설정
+
+    Args:
+        stage: 모든 메트릭에 stage 라벨로 붙는 이름 (예: "downloader")
+        port: Prometheus 엔드포인트 포트 (기본: METRICS_PORT 환경 변수)
+        jsonl_path: JSONL 파일 경로 (기본: METRICS_JSONL 환경 변수)
+        host: Prometheus 엔드포인트 바인드 주소 (기본: METRICS_HOST 환경 변수, 없으면 127.0.0.1)
+    """
+    global _stage, _jsonl_path, _server
+    _stage = stage
+    _jsonl_path = jsonl_path or os.environ.get("METRICS_JSONL", "")
+
+    port = port or int(os.environ.get("METRICS_PORT", "0") or 0)
+    host = host or os.environ.get("METRICS_HOST", "") or DEFAULT_HOST
+    if port and _server is None:
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+            print(f"✓ Metrics endpoint: http://{host}:{port}/metrics")
+        except OSError as e:
+            print(f"✗ Metrics endpoint failed on {host}:{port}: {e}")
+            _server = None
+
+    atexit.unregister(flush)
+    if _jsonl_path:
+        atexit.register(flush)
+
+
+def flush():
+    """METRICS_JSONL이 설정되어 있으면 현재 스냅샷을 한 줄 추가"""
+    if not _jsonl_path:
+        return
+    record = {"ts": datetime.now().isoformat(timespec="seconds"), "stage": _stage}
+    record.update(snapshot())
+    try:
+        with open(_jsonl_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"✗ Error writing metrics to {_jsonl_path}: {e}")
+
+
+def report():
+    """콘솔에 카운터와 구간별 소요 시간 요약 출력"""
+    data = snapshot()
+    if not data["counters"] and not data["histograms"]:
+        return
+
+    print(f"\n{'='*60}")
+    print(f"메트릭 요약 ({_stage})")
+    print(f"{'='*60}")
+    for name, hist in data["histograms"].items():
+        mean_ms = hist["sum"] / hist["count"] * 1000 if hist["count"] else 0.0
+        print(f"  {name:<48} 횟수 {hist['count']:>7}  합계 {hist['sum']:>9.2f}s  평균 {mean_ms:>9.2f}ms")
+    for name, value in data["counters"].items():
+        print(f"  {name:<48} {value:>12g}")
+    print(f"{'='*60}")
@@ -0,0 +1,296 @@
+"""
+단계 공용 프로파일링 (--profile 모드)
+
+각 단계의 main()을 cProfile / 샘플링 프로파일러 / tracemalloc 중 하나로 감싸서 실행하고
+<단계 폴더>/profiles/ 에 결과 파일과 상위 함수(또는 할당) 요약을 남긴다.
+
+    python main.py --profile cprofile      # 함수별 호출 횟수/누적 시간 (.prof + .txt)
+    python main.py --profile sample        # 주기적 스택 샘플링, 오버헤드 적음 (.collapsed + .txt)
+    python main.py --profile tracemalloc   # 코드 위치별 메모리 할당 (.txt)
+
+.prof 는 snakeviz 등으로, .collapsed 는 flamegraph.pl / speedscope 로 열 수 있다.
+"""
+import argparse
+import cProfile
+import functools
+import io
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+PROFILE_MODES = ("cprofile", "sample", "tracemalloc")
+
+# 요약에 표시할 상위 항목 수
+TOP_N = 30
+
+# 샘플링 간격 (초)
+SAMPLE_INTERVAL = 0.005
+
+# tracemalloc 최대 사용 시점 확인 간격 (초)
+TRACEMALLOC_INTERVAL = 0.5
+
+# @sampled 호출은 한 번에 하나만 프로파일링 (Python 3.12+는 프로파일러를 동시에 둘 이상 켤 수 없음)
+_sampled_lock = threading.Lock()
+
+
+class StackSampler:
+    """
+    대상 스레드의 스택을 주기적으로 기록하는 샘플링 프로파일러
+
+    별도 스레드에서 sys._current_frames()로 스택만 읽으므로 대상 코드에는 계측이 들어가지 않는다.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        # 스택(바깥 → 안쪽 함수 튜플) → 샘플 수
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        """flamegraph 입력용 collapsed stack 형식 ("a;b;c 횟수")"""
+        return "\n".join(f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+    def top_functions(self, n: int = TOP_N) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """
+        Returns:
+            (self 샘플 상위 n개, 누적 샘플 상위 n개) - 각각 [(함수, 샘플 수)]
+        """
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            self_counts[stack[-1]] += count
+            for func in set(stack):
+                total_counts[func] += count
+        return self_counts.most_common(n), total_counts.most_common(n)
+
+
+def _output_base(output_dir: Path, mode: str) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / f"{datetime.now():%Y%m%d_%H%M%S}_{mode}"
+
+
+def _run_cprofile(fn: Callable, base: Path) -> str:
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(fn)
+    finally:
+        profiler.dump_stats(str(base.with_suffix(".prof")))
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats("cumulative").print_stats(TOP_N)
+    stream.write("\n")
+    stats.sort_stats("tottime").print_stats(TOP_N)
+    return stream.getvalue()
+
+
+def _run_sample(fn: Callable, base: Path) -> str:
+    sampler = StackSampler()
+    sampler.start()
+    started = time.perf_counter()
+    try:
+        fn()
+    finally:
+        sampler.stop()
+        base.with_suffix(".collapsed").write_text(sampler.collapsed(), encoding="utf-8")
+
+    elapsed = time.perf_counter() - started
+    self_top, total_top = sampler.top_functions()
+    lines = [f"샘플 {sampler.samples}개 / {elapsed:.1f}초 (간격 {sampler.interval * 1000:.0f}ms)", ""]
+    for title, rows in (("[self] 직접 실행 중이던 함수", self_top), ("[total] 스택에 포함된 함수", total_top)):
+        lines.append(title)
+        for func, count in rows:
+            lines.append(f"  {count / max(sampler.samples, 1):>6.1%}  {count:>7}  {func}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _run_tracemalloc(fn: Callable, base: Path) -> str:
+    # main()이 끝나면 지역 변수가 해제되므로, 실행 중 메모리가 가장 많았던 시점의 스냅샷을 보관
+    best = {"size": -1, "snapshot": None}
+    stop = threading.Event()
+
+    def watch():
+        while not stop.wait(TRACEMALLOC_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > best["size"]:
+                best["size"] = current
+                best["snapshot"] = tracemalloc.take_snapshot()
+
+    tracemalloc.start(25)
+    watcher = threading.Thread(target=watch, name="tracemalloc-watch", daemon=True)
+    watcher.start()
+    try:
+        fn()
+    finally:
+        stop.set()
+        watcher.join()
+        current, peak = tracemalloc.get_traced_memory()
+        if current > best["size"]:
+            best["size"] = current
+            best["snapshot"] = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    snapshot = best["snapshot"].filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    lines = [
+        f"종료 시 {current / 1024 / 1024:.1f}MB / 최대 {peak / 1024 / 1024:.1f}MB",
+        "",
+        f"[코드 위치별 할당 (스냅샷 시점 {best['size'] / 1024 / 1024:.1f}MB)]",
+    ]
+    for stat in snapshot.statistics("lineno")[:TOP_N]:
+        lines.append(f"  {stat.size / 1024:>10.1f}KB  {stat.count:>8}개  {stat.traceback[0]}")
+    return "\n".join(lines) + "\n"
+
+
+_RUNNERS = {
+    "cprofile": _run_cprofile,
+    "sample": _run_sample,
+    "tracemalloc": _run_tracemalloc,
+}
+
+
+def profile_call(fn: Callable, mode: str, output_dir: Path) -> Path:
+    """
+    fn()을 지정한 방식으로 프로파일링하고 요약을 저장
+
+    Args:
+        fn: 인자 없이 호출할 함수 (보통 main)
+        mode: "cprofile" | "sample" | "tracemalloc"
+        output_dir: 결과 파일을 저장할 폴더
+
+    Returns:
+        Path: 요약 텍스트 파일 경로
+    """
+    base = _output_base(output_dir, mode)
+    summary = _RUNNERS[mode](fn, base)
+
+    summary_path = base.with_suffix(".txt")
+    summary_path.write_text(summary, encoding="utf-8")
+    print(f"\n{'='*60}")
+    print(f"프로파일 ({mode}) 요약: {summary_path}")
+    print(f"{'='*60}")
+    print("\n".join(summary.splitlines()[:TOP_N + 5]))
+    return summary_path
+
+
+def run_main(main: Callable, stage_dir: Path):
+    """
+    --profile 옵션을 확인해서 main()을 그대로 실행하거나 프로파일링해서 실행
+
+    Args:
+        main: 단계의 main 함수
+        stage_dir: 단계 폴더 (결과는 stage_dir/profiles 에 저장)
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", choices=PROFILE_MODES, default=None,
+                        help="프로파일링 방식 (결과: profiles/)")
+    args, _ = parser.parse_known_args()
+
+    if not args.profile:
+        main()
+        return
+    profile_call(main, args.profile, stage_dir / "profiles")
+
+
+def _profiler_active() -> bool:
+    """다른 프로파일러(--profile cprofile 등)가 이미 켜져 있는지"""
+    if sys.getprofile() is not None:
+        return True
+    monitoring = getattr(sys, "monitoring", None)
+    return monitoring is not None and monitoring.get_tool(monitoring.PROFILER_ID) is not None
+
+
+def sampled(fn: Callable) -> Callable:
+    """
+    호출 중 일부만 cProfile로 기록하는 데코레이터 (Reflex State 이벤트 핸들러, 단계별 핫패스 함수용)
+
+    PROFILE_SAMPLE_RATE 환경 변수(0~1)가 0보다 클 때만 동작하며, 선택된 호출은
+    PROFILE_DIR(기본: 현재 폴더/profiles)에 <핸들러>_<시각>.prof 와 .txt 로 저장된다.
+    설정이 없으면 원래 함수를 그대로 반환하므로 오버헤드가 없다.
+
+    다른 sampled 호출(다른 스레드, 중첩 호출)이 프로파일링 중이거나 다른 프로파일러가 켜져 있으면
+    기록하지 않고 그냥 실행한다. 프로파일링 여부가 함수 동작을 바꾸지 않도록 하기 위함.
+    """
+    rate = float(os.environ.get("PROFILE_SAMPLE_RATE", "0") or 0)
+    if rate <= 0:
+        return fn
+
+    output_dir = Path(os.environ.get("PROFILE_DIR") or Path.cwd() / "profiles")
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if random.random() >= rate:
+            return fn(*args, **kwargs)
+        if not _sampled_lock.acquire(blocking=False):
+            return fn(*args, **kwargs)
+        try:
+            if _profiler_active():
+                return fn(*args, **kwargs)
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # 확인 직후 다른 프로파일러가 켜진 경우
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.disable()
+                elapsed = time.perf_counter() - started
+                _save_sampled(profiler, fn, elapsed, output_dir)
+        finally:
+            _sampled_lock.release()
+
+    return wrapper
+
+
+def _save_sampled(profiler: cProfile.Profile, fn: Callable, elapsed: float, output_dir: Path):
+    """sampled 호출 한 번의 프로파일을 .prof / .txt로 저장"""
+    try:
+        base = _output_base(output_dir, f"{fn.__name__}_{time.time_ns() % 1_000_000:06d}")
+        profiler.dump_stats(str(base.with_suffix(".prof")))
+        stream = io.StringIO()
+        stream.write(f"{fn.__qualname__}: {elapsed * 1000:.1f}ms\n")
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(TOP_N)
+        base.with_suffix(".txt").write_text(stream.getvalue(), encoding="utf-8")
+        print(f"✓ Profiled {fn.__qualname__}: {elapsed * 1000:.1f}ms → {base.with_suffix('.prof')}")
+    except Exception as e:
+        print(f"✗ Error saving profile for {fn.__qualname__}: {e}")
@@ -0,0 +1,189 @@
+"""
+기사 본문 정리 (상용구 제거 + 토큰 예산 자르기)
+
+Summarizer는 LLM에 보내기 전에 모든 규칙으로 정리한다. Downloader는 저장한 본문을 되돌릴 수 없으므로
+본문을 지울 위험이 없는 사진 설명 / 바이라인 규칙만 적용한다.
+
+    strip_captions_and_bylines(text)         사진 설명, 발신지 / 바이라인, 바이라인만 있는 줄 제거 (Downloader 저장 전)
+    strip_boilerplate(text)                  바이라인, 저작권 문구, 사진 설명, 관련 기사 링크, 구독 안내 줄 제거
+    learn_boilerplate({언론사: [본문, ...]})  언론사별로 여러 기사에 반복되는 줄을 학습
+    strip_boilerplate(text, learned, 언론사)  고정 규칙 + 학습한 줄 제거
+    truncate_to_budget(text, max_tokens)     앞 문단부터 토큰 예산 안에서 자르기 (뉴스는 앞부분이 핵심)
+    estimate_tokens(text)                    토크나이저 없이 빠르게 추정한 토큰 수
+"""
+import math
+import re
+from typing import Dict, Iterable, List, Set
+
+# 기자 바이라인 / 이메일만 있는 줄 (줄 전체가 일치해야 하므로 본문을 지우지 않음)
+BYLINE_LINE_PATTERNS = [
+    re.compile(r"^[가-힣]{2,4}\s*(기자|특파원|선임기자|객원기자|인턴기자)(\s*[=/·]?\s*\S+@\S+)?\s*$"),
+    re.compile(r"^\S+@\S+\.\S+$"),
+]
+
+# 줄 전체를 지우는 패턴 (해당 줄에 이 패턴이 있으면 제거)
+# 네이버 본문은 문단 하나가 한 줄이므로, 본문에도 나올 수 있는 문구는 짧은 줄(80자 이하)에서만 지움
+BOILERPLATE_LINE_PATTERNS = BYLINE_LINE_PATTERNS + [
+    # 저작권 문구 (짧은 줄만)
+    re.compile(r"^(?=.{0,80}$).*(무단\s*전재|재배포\s*금지|무단\s*복제|ⓒ|©|copyright|all rights reserved)", re.IGNORECASE),
+    # 관련 기사 / 링크 안내
+    re.compile(r"^(▶|☞|◆관련|■\s*관련|\[관련\s*기사\]|관련\s*기사)"),
+    # 구독 / 채널 안내 (짧은 줄만)
+    re.compile(r"^.{0,80}(구독\s*(하고|하기|하세요)|네이버\s*메인에서|채널\s*추가|카카오톡\s*채널).{0,80}$"),
+]
+
+# 줄 안에서 해당 부분만 지우는 패턴 (사진 설명 등)
+BOILERPLATE_INLINE_PATTERNS = [
+    re.compile(r"[\[(]\s*(사진|그래픽|자료|이미지|영상)\s*[=:][^\])]*[\])]"),
+    # 줄 앞의 발신지 / 바이라인: "(서울=연합뉴스) 홍길동 기자 = "
+    re.compile(r"^\([^()]{1,20}=[^()]{1,20}\)\s*([가-힣]{2,4}\s*(기자|특파원)\s*=\s*)?"),
+]
+
+# 학습: 같은 언론사 기사 중 이 비율 이상, 최소 LEARN_MIN_DOCS개 기사에 나온 줄을 상용구로 본다
+LEARN_MIN_DOCS = 3
+LEARN_MIN_RATIO = 0.3
+# 이보다 긴 줄은 본문일 가능성이 높으므로 학습하지 않음
+LEARN_MAX_LINE = 120
+
+# 토큰 추정: 한글 음절은 약 0.7토큰, 나머지 공백이 아닌 문자는 약 4자당 1토큰
+HANGUL_TOKENS_PER_CHAR = 0.7
+OTHER_CHARS_PER_TOKEN = 4.0
+
+_HANGUL = re.compile(r"[가-힣]")
+_SPACE = re.compile(r"\s")
+_MULTI_SPACE = re.compile(r"[ \t]+")
+_MULTI_NEWLINE = re.compile(r"\n{3,}")
+_PARAGRAPH_SPLIT = re.compile(r"\n+|(?<=[.!?])\s+")
+
+
+def normalize_line(line: str) -> str:
+    """줄 비교용 정규화 (앞뒤 공백 제거, 연속 공백 하나로)"""
+    return _MULTI_SPACE.sub(" ", line.strip())
+
+
+def is_boilerplate_line(line: str, patterns: List[re.Pattern] = BOILERPLATE_LINE_PATTERNS) -> bool:
+    """고정 규칙에 걸리는 줄인지"""
+    return any(p.search(line) for p in patterns)
+
+
+def learn_boilerplate(docs_by_group: Dict[str, Iterable[str]],
+                      min_docs: int = LEARN_MIN_DOCS, min_ratio: float = LEARN_MIN_RATIO) -> Dict[str, Set[str]]:
+    """
+    그룹(언론사)별로 여러 기사에 반복되는 줄을 학습
+
+    Args:
+        docs_by_group: {그룹: [본문, ...]}
+        min_docs: 최소 기사 수
+        min_ratio: 그룹 기사 중 최소 비율
+
+    Returns:
+        Dict[str, Set[str]]: {그룹: 정규화된 상용구 줄 집합}
+    """
+    learned = {}
+    for group, docs in docs_by_group.items():
+        doc_freq: Dict[str, int] = {}
+        n_docs = 0
+        for text in docs:
+            n_docs += 1
+            lines = {normalize_line(line) for line in text.splitlines()}
+            for line in lines:
+                if line and len(line) <= LEARN_MAX_LINE:
+                    doc_freq[line] = doc_freq.get(line, 0) + 1
+        threshold = max(min_docs, math.ceil(n_docs * min_ratio))
+        lines = {line for line, df in doc_freq.items() if df >= threshold}
+        if lines:
+            learned[group] = lines
+    return learned
+
+
+def strip_boilerplate(text: str, learned: Dict[str, Set[str]] | None = None, group: str | None = None) -> str:
+    """
+    상용구 줄 / 사진 설명 제거
+
+    Args:
+        text: 기사 본문
+        learned: learn_boilerplate() 결과 (없으면 고정 규칙만)
+        group: 기사의 그룹(언론사). learned에 "*" 그룹이 있으면 모든 기사에 적용
+
+    Returns:
+        str: 정리된 본문 (학습한 줄을 지워서 본문이 모두 사라지면 고정 규칙만 적용한 결과)
+    """
+    learned_lines = set()
+    if learned:
+        learned_lines = learned.get(group, set()) | learned.get("*", set())
+
+    cleaned = _strip_lines(text, learned_lines)
+    if not cleaned and learned_lines:
+        # 같은 기사가 여러 번 저장된 경우 등, 학습 결과가 본문까지 덮은 경우
+        cleaned = _strip_lines(text, set())
+    return cleaned
+
+
+def strip_captions_and_bylines(text: str) -> str:
+    """
+    사진 설명, 줄 앞 발신지 / 바이라인, 바이라인 / 이메일만 있는 줄만 제거 (Downloader 저장 전)
+
+    저작권 / 관련 기사 / 구독 안내 규칙과 학습한 줄은 본문 문단을 지울 수 있으므로
+    원본을 보존하는 저장 단계에서는 쓰지 않고 Summarizer(strip_boilerplate)에서만 적용한다.
+    """
+    return _strip_lines(text, set(), BYLINE_LINE_PATTERNS)
+
+
+def _strip_lines(text: str, learned_lines: Set[str],
+                 line_patterns: List[re.Pattern] = BOILERPLATE_LINE_PATTERNS) -> str:
+    kept = []
+    for line in text.splitlines():
+        normalized = normalize_line(line)
+        if not normalized:
+            kept.append("")
+            continue
+        if normalized in learned_lines or is_boilerplate_line(normalized, line_patterns):
+            continue
+        for pattern in BOILERPLATE_INLINE_PATTERNS:
+            normalized = pattern.sub("", normalized)
+        normalized = normalize_line(normalized)
+        if normalized:
+            kept.append(normalized)
+    return _MULTI_NEWLINE.sub("\n\n", "\n".join(kept)).strip()
+
+
+def estimate_tokens(text: str) -> int:
+    """LLM 입력 토큰 수 추정 (토크나이저 없이 문자 종류별 비율로 계산)"""
+    hangul = len(_HANGUL.findall(text))
+    other = len(text) - hangul - len(_SPACE.findall(text))
+    return math.ceil(hangul * HANGUL_TOKENS_PER_CHAR + other / OTHER_CHARS_PER_TOKEN)
+
+
+def truncate_to_budget(text: str, max_tokens: int | None) -> str:
+    """
+    앞에서부터 문장 단위로 max_tokens 안에 들어가는 만큼만 남김
+
+    Args:
+        text: 본문
+        max_tokens: 토큰 예산 (None 또는 0 이하면 자르지 않음)
+
+    Returns:
+        str: 잘린 본문 (첫 문장이 예산보다 길면 첫 문장만)
+    """
+    if not max_tokens or max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+
+    kept: List[str] = []
+    used = 0
+    position = 0
+    for match in _PARAGRAPH_SPLIT.finditer(text + "\n"):
+        piece = text[position:match.start()]
+        separator = match.group()
+        position = match.end()
+        cost = estimate_tokens(piece)
+        if kept and used + cost > max_tokens:
+            break
+        kept.append(piece + ("\n" if "\n" in separator else " "))
+        used += cost
+    return "".join(kept).strip()
+
+
+def clean_article(text: str, learned: Dict[str, Set[str]] | None = None, group: str | None = None,
+                  max_tokens: int | None = None) -> str:
+    """상용구 제거 후 토큰 예산만큼 자르기"""
+    return truncate_to_budget(strip_boilerplate(text, learned, group), max_tokens)
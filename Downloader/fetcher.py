@@ -0,0 +1,291 @@
+"""
+재시도 / 백오프 / 서킷 브레이커 / 실패 URL 보관(dead-letter)을 갖춘 HTTP 요청 계층
+
+    fetch_html(url)
+      ├─ 호스트 서킷이 열려 있으면 바로 CircuitOpenError (타임아웃을 기다리지 않음)
+      ├─ 일시적 오류(타임아웃, 연결 오류, 응답 중 끊김, 429/5xx 등)는 지터를 넣은 지수 백오프로 재시도
+      │    (Retry-After 헤더가 있으면 그 시간을 우선)
+      └─ 끝내 실패하면 FetchError → 호출 측에서 DeadLetterQueue에 기록, 나중에 --redrive로 재시도
+"""
+import json
+import random
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+# (연결, 읽기) 타임아웃 (초). 연결이 안 되는 호스트에서 오래 기다리지 않도록 연결은 짧게
+TIMEOUT = (3.05, 10)
+
+# 재시도 설정
+MAX_ATTEMPTS = 4          # 첫 시도 포함
+BACKOFF_BASE = 0.5        # 초, 시도마다 2배
+BACKOFF_MAX = 30.0        # 초, 백오프 / Retry-After 상한
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# 재시도하고 서킷에 실패로 기록할 예외 (부분 장애 중에 나는 일시적 오류). 그 밖의 RequestException은 바로 실패
+TRANSIENT_ERRORS = (
+    requests.Timeout,
+    requests.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ContentDecodingError,
+    requests.TooManyRedirects,
+)
+
+# 서킷 브레이커 설정 (호스트별)
+BREAKER_FAILURES = 5      # 연속 실패 횟수가 이만큼 되면 서킷 열림
+BREAKER_COOLDOWN = 30.0   # 초, 열린 뒤 이 시간이 지나면 한 번 시험 요청 허용
+
+
+class FetchError(Exception):
+    """재시도 후에도 실패한 요청"""
+
+    def __init__(self, message: str, status: int | None = None, retryable: bool = True):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+
+
+class CircuitOpenError(FetchError):
+    """서킷이 열려 있어 요청하지 않음"""
+
+
+class CircuitBreaker:
+    """
+    호스트 하나의 서킷 브레이커 (closed → open → half-open → closed)
+
+    연속 실패가 BREAKER_FAILURES번이면 열리고, BREAKER_COOLDOWN초 뒤 시험 요청 하나만 통과시킨다.
+    시험 요청이 성공하면 닫히고, 실패하면 다시 쿨다운만큼 열린다.
+    """
+
+    def __init__(self, failures: int = BREAKER_FAILURES, cooldown: float = BREAKER_COOLDOWN):
+        self.failures = failures
+        self.cooldown = cooldown
+        self.consecutive = 0
+        self.opened_at = 0.0
+        self.trial_running = False
+        self.trial_owner = None
+        self.lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.consecutive < self.failures:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return "open"
+        return "half-open"
+
+    def allow(self) -> bool:
+        with self.lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self.trial_running:
+                self.trial_running = True
+                self.trial_owner = threading.get_ident()
+                return True
+            return False
+
+    def release_trial(self):
+        """시험 요청을 맡은 스레드가 결과를 기록하지 못하고 끝난 경우 (예상 못 한 예외 등) 다음 시험 요청 허용"""
+        with self.lock:
+            if self.trial_running and self.trial_owner == threading.get_ident():
+                self.trial_running = False
+
+    def record_success(self):
+        with self.lock:
+            self.consecutive = 0
+            self.trial_running = False
+
+    def record_failure(self):
+        with self.lock:
+            self.consecutive += 1
+            self.trial_running = False
+            if self.consecutive >= self.failures:
+                if self.consecutive == self.failures:
+                    print(f"✗ Circuit opened after {self.consecutive} consecutive failures")
+                self.opened_at = time.monotonic()
+                metrics.inc("circuit_open_total")
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
+
+
+def get_session() -> requests.Session:
+    """스레드별 세션 (연결 재사용)"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _local.session = session
+    return session
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_seconds(attempt: int) -> float:
+    """attempt번째 실패 후 대기 시간 (full jitter: 0 ~ base * 2^(attempt-1))"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)))
+
+
+def fetch_html(url: str, max_attempts: int = MAX_ATTEMPTS) -> requests.Response:
+    """
+    재시도 / 서킷 브레이커를 거쳐 GET 요청
+
+    Args:
+        url: 요청 URL
+        max_attempts: 최대 시도 횟수 (첫 시도 포함)
+
+    Returns:
+        requests.Response: 2xx 응답
+
+    Raises:
+        CircuitOpenError: 호스트 서킷이 열려 있음
+        FetchError: 재시도해도 실패했거나 재시도할 수 없는 오류 (404 등)
+    """
+    host = urlparse(url).netloc
+    breaker = get_breaker(host)
+    last_error = None
+
+    for attempt in range(1, max_attempts + 1):
+        if not breaker.allow():
+            metrics.inc("fetch_circuit_rejected_total")
+            raise CircuitOpenError(f"circuit open for {host}")
+
+        wait = None
+        try:
+            with metrics.span("fetch"):
+                resp = get_session().get(url, timeout=TIMEOUT)
+            metrics.inc("fetch_requests_total", status=resp.status_code)
+            metrics.inc("bytes_downloaded_total", len(resp.content))
+
+            if resp.status_code < 400:
+                breaker.record_success()
+                return resp
+
+            if resp.status_code not in RETRY_STATUS:
+                # 404 등은 서버 상태 문제가 아니므로 서킷에 반영하지 않고 바로 실패
+                breaker.record_success()
+                raise FetchError(f"HTTP {resp.status_code}", status=resp.status_code, retryable=False)
+
+            breaker.record_failure()
+            last_error = FetchError(f"HTTP {resp.status_code}", status=resp.status_code)
+            wait = retry_after_seconds(resp.headers.get("Retry-After"))
+        except FetchError:
+            raise
+        except TRANSIENT_ERRORS as e:
+            breaker.record_failure()
+            metrics.inc("fetch_requests_total", status=type(e).__name__)
+            last_error = FetchError(f"{type(e).__name__}: {e}")
+        except requests.RequestException as e:
+            # 잘못된 URL 등은 호스트 상태와 관계없으므로 서킷에 반영하지 않고 바로 실패 (시험 요청은 finally에서 반납)
+            metrics.inc("fetch_requests_total", status=type(e).__name__)
+            raise FetchError(f"{type(e).__name__}: {e}", retryable=False) from e
+        finally:
+            # 시험 요청 중 어떤 예외가 나도 서킷이 half-open에 묶이지 않도록
+            breaker.release_trial()
+
+        if attempt < max_attempts:
+            wait = min(BACKOFF_MAX, wait) if wait is not None else backoff_seconds(attempt)
+            metrics.inc("fetch_retries_total")
+            time.sleep(wait)
+
+    raise last_error
+
+
+class DeadLetterQueue:
+    """
+    끝내 실패한 URL을 JSONL 파일에 보관 (data/dead_letter.jsonl)
+
+    한 줄에 {"url", "date", "error", "ts"} 하나. take_all()로 꺼내서 다시 시도하고,
+    모두 다시 시도한 뒤 acknowledge()로 꺼낸 파일을 지운다 (main.py --redrive).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def add(self, url: str, date_str: str, error: str):
+        entry = {"url": url, "date": date_str, "error": error, "ts": datetime.now().isoformat(timespec="seconds")}
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        metrics.inc("dead_letter_total")
+
+    def entries(self) -> List[Dict[str, str]]:
+        if not self.path.exists():
+            return []
+        with self.lock:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        return [json.loads(line) for line in lines if line.strip()]
+
+    @property
+    def taking_path(self) -> Path:
+        return self.path.with_suffix(".redrive")
+
+    def take_all(self) -> List[Dict[str, str]]:
+        """
+        보관된 URL을 모두 꺼냄 (같은 URL은 마지막 항목만)
+
+        꺼낸 항목은 .redrive 파일로 옮겨 두고 acknowledge() 전까지 지우지 않는다.
+        재시도가 중단되면(오류, Ctrl-C) 다음 take_all()이 남은 .redrive 항목을 다시 꺼낸다.
+        재시도 중 다시 실패한 URL은 add()로 새 파일에 다시 기록된다.
+        """
+        taking = self.taking_path
+        with self.lock:
+            if self.path.exists():
+                if taking.exists():
+                    # 이전 재시도가 중단되어 남은 항목 뒤에 이어 붙임 (중복은 아래에서 URL로 합침)
+                    with open(taking, "a", encoding="utf-8") as f:
+                        f.write(self.path.read_text(encoding="utf-8"))
+                    self.path.unlink()
+                else:
+                    self.path.replace(taking)
+            if not taking.exists():
+                return []
+            lines = taking.read_text(encoding="utf-8").splitlines()
+        unique: Dict[str, Dict[str, str]] = {}
+        for line in lines:
+            if line.strip():
+                entry = json.loads(line)
+                unique[entry["url"]] = entry
+        return list(unique.values())
+
+    def acknowledge(self):
+        """take_all()로 꺼낸 항목을 모두 다시 시도(성공 또는 add()로 재기록)한 뒤 .redrive 파일 삭제"""
+        with self.lock:
+            self.taking_path.unlink(missing_ok=True)
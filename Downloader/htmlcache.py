@@ -0,0 +1,138 @@
+"""
+원본 HTML 캐시 (날짜별 zstd 샤드 + 오프셋 인덱스)
+
+추출 로직(extract_title_and_body)을 고친 뒤 지난 날짜에 다시 적용할 때, 다시 크롤하지 않고
+캐시에서 HTML을 읽어 재추출한다 (main.py --re-extract).
+
+    cache/<date>/<pid>-<seq>.zst      기사 하나가 독립된 zstd 프레임 하나 (이어 붙임)
+    cache/<date>/<pid>.idx.jsonl      {"id", "url", "shard", "offset", "length", "written"} 한 줄에 기사 하나
+
+프로세스마다 자기 샤드 / 인덱스 파일에만 쓰므로 여러 프로세스(Backfill 워커 등)가 같은 날짜를
+동시에 캐시해도 잠금이 필요 없다. 같은 기사 ID가 여러 번 기록되면 가장 나중에 쓴 항목("written",
+기록 시각 ns)을 사용한다. 인덱스 파일 이름(pid) 순서는 쓴 순서와 관계없으므로 쓰지 않는다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import zstandard
+
+from scheduler import article_id
+
+# 샤드 하나의 최대 크기. 넘으면 다음 번호 샤드에 씀
+SHARD_MAX_BYTES = 256 * 1024 * 1024
+COMPRESSION_LEVEL = 3
+
+
+def cache_key(url: str) -> str:
+    """기사 ID("언론사ID/기사ID"), 형식이 다른 URL이면 URL 해시"""
+    return article_id(url) or hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+class HtmlCache:
+    """
+    날짜별 원본 HTML 캐시
+
+    Args:
+        root: 캐시 폴더 (예: Downloader/cache)
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.lock = threading.Lock()
+        self.compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+        # 날짜 → 현재 쓰는 샤드 번호
+        self.shard_seq: Dict[str, int] = {}
+
+    def _shard_path(self, date_str: str) -> Path:
+        day_dir = self.root / date_str
+        seq = self.shard_seq.get(date_str)
+        if seq is None:
+            # 이전 실행에서 같은 pid로 만든 샤드가 있으면 마지막 것부터 이어서 씀
+            existing = sorted(day_dir.glob(f"{os.getpid()}-*.zst"))
+            seq = int(existing[-1].stem.split("-")[1]) if existing else 0
+        path = day_dir / f"{os.getpid()}-{seq:05d}.zst"
+        if path.exists() and path.stat().st_size >= SHARD_MAX_BYTES:
+            seq += 1
+            path = day_dir / f"{os.getpid()}-{seq:05d}.zst"
+        self.shard_seq[date_str] = seq
+        return path
+
+    def put(self, date_str: str, url: str, html: str):
+        """기사 HTML 하나를 날짜 샤드 끝에 추가하고 인덱스에 위치 기록"""
+        frame = self.compressor.compress(html.encode("utf-8"))
+        with self.lock:
+            day_dir = self.root / date_str
+            day_dir.mkdir(parents=True, exist_ok=True)
+            shard = self._shard_path(date_str)
+            with open(shard, "ab") as f:
+                offset = f.tell()
+                f.write(frame)
+            entry = {"id": cache_key(url), "url": url, "shard": shard.name, "offset": offset, "length": len(frame),
+                     "written": time.time_ns()}
+            with open(day_dir / f"{os.getpid()}.idx.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def dates(self) -> List[str]:
+        """캐시가 있는 날짜 목록 (오름차순)"""
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir() and any(p.glob("*.idx.jsonl")))
+
+    def index(self, date_str: str) -> List[Dict]:
+        """
+        날짜의 기사 위치 목록 (기사 ID당 가장 나중에 쓴 항목, 샤드 / 오프셋 순)
+
+        Returns:
+            list: [{"id", "url", "shard", "offset", "length", "written"}, ...]
+        """
+        entries: Dict[str, Dict] = {}
+        for idx_file in sorted((self.root / date_str).glob("*.idx.jsonl")):
+            for line in idx_file.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    previous = entries.get(entry["id"])
+                    # "written"이 없는 예전 항목은 0 (같으면 파일 안에서 뒤에 나온 항목)
+                    if previous is None or entry.get("written", 0) >= previous.get("written", 0):
+                        entries[entry["id"]] = entry
+        return sorted(entries.values(), key=lambda e: (e["shard"], e["offset"]))
+
+    def get(self, date_str: str, key: str) -> str | None:
+        """기사 ID로 HTML 하나 읽기 (없으면 None)"""
+        for entry in self.index(date_str):
+            if entry["id"] == key:
+                return next(read_entries(self.root / date_str, [entry]))[1]
+        return None
+
+
+def read_entries(day_dir: Path, entries: List[Dict]) -> Iterator[Tuple[Dict, str]]:
+    """
+    인덱스 항목들의 HTML을 차례로 읽기 (샤드 파일은 한 번씩만 엶)
+
+    Args:
+        day_dir: 날짜 캐시 폴더
+        entries: HtmlCache.index() 항목 (같은 샤드끼리 모여 있으면 효율적)
+
+    Returns:
+        Iterator: (항목, HTML) 튜플
+    """
+    decompressor = zstandard.ZstdDecompressor()
+    handle = None
+    handle_name = None
+    try:
+        for entry in entries:
+            if entry["shard"] != handle_name:
+                if handle:
+                    handle.close()
+                handle = open(day_dir / entry["shard"], "rb")
+                handle_name = entry["shard"]
+            handle.seek(entry["offset"])
+            frame = handle.read(entry["length"])
+            yield entry, decompressor.decompress(frame).decode("utf-8")
+    finally:
+        if handle:
+            handle.close()
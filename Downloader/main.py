@@ -1,6 +1,7 @@
-import requests
 from bs4 import BeautifulSoup
 from pathlib import Path
+import functools
+import os
 import re
 import sys
 from datetime import datetime, timedelta
@@ -11,7 +12,26 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
 
-HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Common"))
+import metrics
+import profiling
+from textclean import strip_captions_and_bylines
+from scheduler import CrawlScheduler, load_config, update_manifest_files
+from fetcher import DeadLetterQueue, FetchError, fetch_html
+from htmlcache import HtmlCache, cache_key, read_entries
+from article_meta import append_metadata, parse_timestamp, read_metadata, write_metadata
+
+# 재시도 후에도 실패한 기사 URL 보관 (python main.py --redrive 로 재시도)
+DEAD_LETTER_FILE = Path(__file__).resolve().parent / "data" / "dead_letter.jsonl"
+dead_letters = DeadLetterQueue(DEAD_LETTER_FILE)
+
+# 원본 HTML 캐시 (--cache-html 또는 HTML_CACHE=1 일 때만 저장, --re-extract 로 재추출)
+CACHE_DIR = Path(__file__).resolve().parent / "cache"
+html_cache = HtmlCache(CACHE_DIR) if os.environ.get("HTML_CACHE") else None
+
+# 재추출 시 프로세스 하나에 넘길 기사 수
+REEXTRACT_CHUNK = 200
 
 def sanitize_filename(name: str, max_length: int = 200) -> str:
     # Windows 금지 문자 제거
@@ -21,13 +41,82 @@ def sanitize_filename(name: str, max_length: int = 200) -> str:
     return name or "article"
 
 def fetch(url: str) -> str:
-    resp = requests.get(url, headers=HEADERS, timeout=10)
-    resp.raise_for_status()
-    return resp.text
+    # 일시적 오류는 fetcher에서 백오프 재시도, 호스트 장애 시 서킷 브레이커로 즉시 실패
+    return fetch_html(url).text
 
-def extract_title_and_body(html: str):
+def extract_metadata(soup) -> dict:
+    """
+    파싱된 기사 페이지에서 메타데이터 추출 (본문 추출과 같은 트리를 사용, 다시 파싱하지 않음)
+    
+    Args:
+        soup: 기사 페이지 BeautifulSoup
+    
+    Returns:
+        dict: {"url", "published", "modified", "press", "reporters", "origin_url"} (찾지 못한 값은 None / 빈 리스트)
+    """
+    # <meta>는 한 번만 훑어서 property / name → content
+    metas = {}
+    for tag in (soup.head or soup).find_all("meta"):
+        key = tag.get("property") or tag.get("name")
+        content = (tag.get("content") or "").strip()
+        if key and content:
+            metas.setdefault(key, content)
+
+    # 발행 시각 / 언론사 / 기자 / 원문 링크는 네이버 기사 헤더 안에만 있으므로 헤더만 검색 (없으면 문서 전체)
+    header = soup.find("div", class_="media_end_head") or soup
+
+    # 발행 / 수정 시각: 헤더의 data-date-time 속성, 없으면 article:published_time 메타 태그
+    stamp = header.find(attrs={"data-date-time": True})
+    modify_stamp = header.find(attrs={"data-modify-date-time": True})
+    published = parse_timestamp(stamp["data-date-time"] if stamp else None) \
+        or parse_timestamp(metas.get("article:published_time"))
+    modified = parse_timestamp(modify_stamp["data-modify-date-time"] if modify_stamp else None) \
+        or parse_timestamp(metas.get("article:modified_time"))
+
+    # 언론사: og:article:author ("연합뉴스 | 네이버" 형태도 있음), 없으면 헤더 로고 이미지 설명
+    press = metas.get("og:article:author") or metas.get("twitter:creator")
+    if not press:
+        logo = header.find(class_="media_end_head_top_logo")
+        image = logo.find("img") if logo else None
+        if image:
+            press = (image.get("title") or image.get("alt") or "").strip()
+    press = press.split("|")[0].strip() or None if press else None
+
+    # 기자: 헤더의 기자 이름 ("홍길동 기자" → "홍길동"), 여러 명이면 모두
+    reporters = []
+    for name_tag in header.find_all(class_="media_end_head_journalist_name"):
+        name = re.sub(r"\s*(기자|특파원|선임기자|논설위원)$", "", name_tag.get_text(strip=True))
+        if name and name not in reporters:
+            reporters.append(name)
+
+    # 원문 URL: 네이버 페이지의 "기사원문" 링크 (언론사 사이트), 페이지 자체 URL은 og:url / canonical
+    origin = header.find("a", class_="media_end_head_origin_link")
+    url = metas.get("og:url")
+    if not url:
+        canonical = (soup.head or soup).find("link", rel="canonical")
+        url = canonical.get("href") if canonical else None
+    return {
+        "url": url,
+        "published": published,
+        "modified": modified,
+        "press": press,
+        "reporters": reporters,
+        "origin_url": origin.get("href") if origin and origin.get("href") else None,
+    }
+
+@profiling.sampled
+def extract_article(html: str):
+    """
+    기사 페이지 HTML을 한 번만 파싱해서 제목, 본문, 메타데이터 추출
+    
+    Returns:
+        tuple: (제목, 본문 또는 None, extract_metadata() 결과)
+    """
     soup = BeautifulSoup(html, "html.parser")
 
+    # 본문 추출 중 일부 노드를 지우므로 메타데이터를 먼저 읽음
+    metadata = extract_metadata(soup)
+
     # 제목 추출: og:title 우선, 없으면 <title>
     title_tag = soup.find("meta", property="og:title")
     if title_tag and title_tag.get("content"):
@@ -82,6 +171,11 @@ def extract_title_and_body(html: str):
         body_text = re.sub(r"\n{2,}", "\n\n", body_text)
         body_text = body_text.strip()
 
+    return title, body_text, metadata
+
+def extract_title_and_body(html: str):
+    """제목과 본문만 필요할 때 (extract_article()과 같은 추출)"""
+    title, body_text, _ = extract_article(html)
     return title, body_text
 
 def save_article(title: str, body: str, date_str: str) -> Path:
@@ -115,10 +209,11 @@ def save_article(title: str, body: str, date_str: str) -> Path:
     filename = sanitize_filename(title) + ".txt"
     file_path = date_folder / filename
     file_path.write_text(body, encoding="utf-8")
+    metrics.inc("files_written_total", kind="article")
     
     return file_path
 
-def get_all_article_urls_with_selenium(section_num: str, group_num: str, date_str: str) -> list:
+def get_all_article_urls_with_selenium(section_num: str, group_num: str, date_str: str, raise_errors: bool = False) -> list:
     """
     네이버 뉴스 페이지에서 모든 기사 URL을 수집
     
@@ -126,6 +221,8 @@ def get_all_article_urls_with_selenium(section_num: str, group_num: str, date_st
         section_num: 섹션 번호 (예: "101")
         group_num: 그룹 번호 (예: "259")
         date_str: 날짜 문자열 (예: "20251029")
+        raise_errors: True면 페이지 로드 / 파싱 오류를 그대로 던짐 (스케줄러가 목록 실패로 집계).
+            False면 오류를 출력하고 그때까지 모은 URL을 반환
     
     Returns:
         list: 기사 URL 리스트
@@ -141,6 +238,7 @@ def get_all_article_urls_with_selenium(section_num: str, group_num: str, date_st
     
     driver = webdriver.Chrome(options=options)
     article_urls = []
+    list_started = time.perf_counter()
     
     try:
         # 페이지 로드
@@ -193,14 +291,18 @@ def get_all_article_urls_with_selenium(section_num: str, group_num: str, date_st
         
     except Exception as e:
         print(f"Error occurred: {e}")
+        if raise_errors:
+            raise
     
     finally:
         # 드라이버 종료
         driver.quit()
+        metrics.observe("list_urls_seconds", time.perf_counter() - list_started)
+        metrics.inc("article_urls_total", len(article_urls))
     
     return article_urls
 
-def download_article(url: str, date_str: str) -> bool:
+def download_article(url: str, date_str: str) -> Path | None:
     """
     URL에 있는 기사를 다운로드해서 파일로 저장
     
@@ -209,33 +311,53 @@ def download_article(url: str, date_str: str) -> bool:
         date_str: 날짜 문자열 (yyyymmdd 형식)
     
     Returns:
-        bool: 성공 시 True, 실패 시 False
+        Path | None: 성공 시 저장된 파일 경로, 실패 시 None
     """
     try:
         # 1. fetch()를 사용하여 HTML 가져오기
         html = fetch(url)
         
-        # 2. extract_title_and_body()를 사용하여 제목과 본문 추출
-        title, body = extract_title_and_body(html)
+        # 추출 실패 여부와 관계없이 원본을 캐시 (추출 로직을 고친 뒤 재추출용)
+        if html_cache:
+            html_cache.put(date_str, url, html)
+        
+        # 2. extract_article()을 사용하여 제목, 본문, 메타데이터를 한 번에 추출
+        with metrics.span("parse"):
+            title, body, metadata = extract_article(html)
+            # 사진 설명, 바이라인만 제거 (저작권 문구 등 본문을 지울 수 있는 규칙은 Summarizer에서만 적용)
+            if body:
+                body = strip_captions_and_bylines(body)
         
         # 제목 검증
         if not title:
             print(f"Failed to extract title from {url}")
-            return False
+            metrics.inc("articles_total", result="no_title")
+            return None
         
         # 본문 검증
         if not body:
             print(f"Failed to extract body from {url}")
-            return False
+            metrics.inc("articles_total", result="no_body")
+            return None
         
         # 3. save_article()로 파일 저장
         saved_path = save_article(title, body, date_str)
+        # 발행 시각 / 언론사 등은 날짜 폴더 metadata.jsonl 에 기록 (이후 단계는 페이지를 다시 받지 않음)
+        append_metadata(saved_path.parent, {"file": saved_path.name, **metadata, "url": metadata["url"] or url})
         print(f"Saved: {saved_path}")
-        return True
+        metrics.inc("articles_total", result="success")
+        return saved_path
         
+    except FetchError as e:
+        print(f"Error downloading article from {url}: {e}")
+        metrics.inc("articles_total", result="error")
+        if e.retryable:
+            dead_letters.add(url, date_str, str(e))
+        return None
     except Exception as e:
         print(f"Error downloading article from {url}: {e}")
-        return False
+        metrics.inc("articles_total", result="error")
+        return None
 
 def get_all_articles_by_date(section_num: str, date_str: str) -> list:
     """
@@ -324,6 +446,49 @@ def get_articles_by_date_range(section_num: str, group_num: str, start_date: str
     
     return unique_urls
 
+def download_articles_for_date(date_str: str, section_num: str, group_num: str) -> dict:
+    """
+    하루치 기사 URL을 수집해서 모두 다운로드 (data/date_str 폴더에 저장)
+    
+    Args:
+        date_str: 날짜 문자열 (yyyymmdd 형식)
+        section_num: 섹션 번호 (예: "101")
+        group_num: 그룹 번호 (예: "259")
+    
+    Returns:
+        dict: 해당 날짜의 다운로드 통계 (성공 개수, 실패 개수, 총 개수)
+    """
+    # 1. 해당 날짜의 기사 URL 수집
+    article_urls = get_all_article_urls_with_selenium(section_num, group_num, date_str)
+    
+    if not article_urls:
+        print(f"{date_str}: 수집된 기사가 없습니다.")
+        return {"success": 0, "fail": 0, "total": 0}
+    print(f"\n{date_str}: {len(article_urls)}개 기사 다운로드 시작")
+    
+    # 2. 해당 날짜의 기사들을 다운로드 (해당 날짜 폴더에 저장)
+    success_count = 0
+    fail_count = 0
+    
+    for i, url in enumerate(article_urls, 1):
+        print(f"  [{i}/{len(article_urls)}] 다운로드 중...")
+        if download_article(url, date_str):  # 해당 날짜 폴더에 저장
+            success_count += 1
+        else:
+            fail_count += 1
+        time.sleep(0.5)  # 서버 부하 방지
+    
+    print(f"\n{date_str} 완료:")
+    print(f"  - 성공: {success_count}개")
+    print(f"  - 실패: {fail_count}개")
+    print(f"  - 총: {len(article_urls)}개")
+    
+    return {
+        "success": success_count,
+        "fail": fail_count,
+        "total": len(article_urls)
+    }
+
 def download_articles_by_date_range(start_date: str, end_date: str, section_num: str, group_num: str) -> dict:
     """
     날짜 기간 동안의 모든 기사를 날짜별로 다운로드
@@ -366,37 +531,10 @@ def download_articles_by_date_range(start_date: str, end_date: str, section_num:
         print(f"{'='*60}")
         
         try:
-            # 1. 해당 날짜의 기사 URL 수집
-            article_urls = get_all_article_urls_with_selenium(section_num, group_num, date_str)
-            
-            if not article_urls:
-                print(f"{date_str}: 수집된 기사가 없습니다.")
-                current_date += timedelta(days=1)
-                continue
-            print(f"\n{date_str}: {len(article_urls)}개 기사 다운로드 시작")
-            
-            # 2. 해당 날짜의 기사들을 다운로드 (해당 날짜 폴더에 저장)
-            success_count = 0
-            fail_count = 0
-            
-            for i, url in enumerate(article_urls, 1):
-                print(f"  [{i}/{len(article_urls)}] 다운로드 중...")
-                if download_article(url, date_str):  # 해당 날짜 폴더에 저장
-                    success_count += 1
-                else:
-                    fail_count += 1
-                time.sleep(0.5)  # 서버 부하 방지
-            
-            # 날짜별 통계
-            total_success += success_count
-            total_fail += fail_count
-            total_articles += len(article_urls)
-            
-            print(f"\n{date_str} 완료:")
-            print(f"  - 성공: {success_count}개")
-            print(f"  - 실패: {fail_count}개")
-            print(f"  - 총: {len(article_urls)}개")
-            
+            result = download_articles_for_date(date_str, section_num, group_num)
+            total_success += result["success"]
+            total_fail += result["fail"]
+            total_articles += result["total"]
         except Exception as e:
             print(f"{date_str} 처리 중 오류 발생: {e}")
         
@@ -421,7 +559,208 @@ def download_articles_by_date_range(start_date: str, end_date: str, section_num:
         "total": total_articles
     }
 
+def crawl_with_config(config_file: Path) -> dict:
+    """
+    설정 파일의 여러 섹션/그룹/기간을 공유 워커 풀로 수집 (scheduler.py)
+    
+    Args:
+        config_file: 크롤 설정 JSON 경로 (예: crawl_config.json)
+    
+    Returns:
+        dict: 수집 통계 (목록 수, 중복 수, 성공/실패 개수 등)
+    """
+    config = load_config(config_file)
+    scheduler = CrawlScheduler(
+        config,
+        list_urls=functools.partial(get_all_article_urls_with_selenium, raise_errors=True),
+        download=download_article,
+        data_dir=Path(__file__).resolve().parent / "data",
+    )
+    return scheduler.run()
+
+def redrive_dead_letters() -> dict:
+    """
+    dead_letter.jsonl 에 보관된 기사 URL을 다시 다운로드 (다시 실패한 URL은 다시 보관)
+    
+    Returns:
+        dict: 재시도 결과 통계 (성공 개수, 실패 개수, 총 개수)
+    """
+    entries = dead_letters.take_all()
+    print(f"보관된 실패 URL {len(entries)}개 재시도")
+    
+    success_count = 0
+    for i, entry in enumerate(entries, 1):
+        print(f"  [{i}/{len(entries)}] {entry['date']} {entry['url']}")
+        if download_article(entry["url"], entry["date"]):
+            success_count += 1
+    # 모두 다시 시도한 뒤에만 꺼낸 목록을 지움 (중간에 중단되면 다음 --redrive 에서 다시 시도)
+    dead_letters.acknowledge()
+    
+    return {
+        "success": success_count,
+        "fail": len(entries) - success_count,
+        "total": len(entries)
+    }
+
+def reextract_chunk(date_str: str, entries: list) -> list:
+    """
+    캐시 항목 묶음의 HTML을 다시 추출해서 저장 (프로세스 풀 작업 단위)
+    
+    Args:
+        date_str: 날짜 문자열 (yyyymmdd 형식)
+        entries: HtmlCache.index() 항목 리스트
+    
+    Returns:
+        list: (기사 ID, 저장된 파일명 또는 None, 메타데이터 또는 None) 리스트
+            (metadata.jsonl 은 여러 프로세스가 같은 파일을 쓰지 않도록 부모 프로세스에서 저장)
+    """
+    results = []
+    for entry, html in read_entries(CACHE_DIR / date_str, entries):
+        title, body, metadata = extract_article(html)
+        if body:
+            body = strip_captions_and_bylines(body)
+        if title and body:
+            name = save_article(title, body, date_str).name
+            results.append((entry["id"], name, {"file": name, **metadata, "url": metadata["url"] or entry.get("url")}))
+        else:
+            results.append((entry["id"], None, None))
+    return results
+
+def remove_replaced_files(date_dir: Path, previous: dict, files: dict) -> list:
+    """
+    재추출로 파일명(제목)이 바뀐 기사의 이전 .txt 삭제 (Tokenizer / Summarizer가 같은 기사를 두 번 세지 않도록)
+    
+    Args:
+        date_dir: 날짜 기사 폴더
+        previous: 기사 ID → 재추출 전 파일명
+        files: 기사 ID → 재추출로 저장한 파일명 (None이면 추출 실패, 이전 파일 유지)
+    
+    Returns:
+        list: 삭제한 파일명
+    """
+    # 다른 기사가 쓰는 파일명은 지우지 않음 (이번에 저장한 파일, 재추출하지 않은 기사의 파일)
+    in_use = {name for name in files.values() if name}
+    in_use |= {name for key, name in previous.items() if not files.get(key)}
+    removed = []
+    for key, old_name in previous.items():
+        new_name = files.get(key)
+        if new_name and new_name != old_name and old_name not in in_use:
+            (date_dir / old_name).unlink(missing_ok=True)
+            removed.append(old_name)
+    return removed
+
+def reextract_from_cache(start_date: str | None = None, end_date: str | None = None, workers: int | None = None) -> dict:
+    """
+    캐시된 원본 HTML로 기사를 다시 추출 (네트워크 요청 없음, 프로세스 풀로 병렬 처리)
+    
+    Args:
+        start_date: 시작 날짜 (yyyymmdd 형식, None이면 처음부터)
+        end_date: 종료 날짜 (yyyymmdd 형식, None이면 끝까지)
+        workers: 프로세스 수 (None이면 CPU 수)
+    
+    Returns:
+        dict: 재추출 결과 통계 (날짜 수, 성공 개수, 실패 개수, 총 개수, 소요 시간)
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    started = time.perf_counter()
+    cache = HtmlCache(CACHE_DIR)
+    dates = [d for d in cache.dates()
+             if (start_date is None or d >= start_date) and (end_date is None or d <= end_date)]
+    
+    # 날짜를 섞어서 REEXTRACT_CHUNK개씩 나눠 작업 크기를 고르게 함
+    chunks = []
+    for date_str in dates:
+        entries = cache.index(date_str)
+        for i in range(0, len(entries), REEXTRACT_CHUNK):
+            chunks.append((date_str, entries[i:i + REEXTRACT_CHUNK]))
+    total = sum(len(entries) for _, entries in chunks)
+    print(f"캐시 {len(dates)}일, 기사 {total}개 재추출 ({len(chunks)}개 묶음)")
+    
+    files_by_date = {date_str: {} for date_str in dates}
+    metadata_by_date = {date_str: [] for date_str in dates}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(reextract_chunk, date_str, entries): date_str for date_str, entries in chunks}
+        for future in as_completed(futures):
+            date_str = futures[future]
+            for key, name, metadata in future.result():
+                files_by_date[date_str][key] = name
+                if metadata:
+                    metadata_by_date[date_str].append(metadata)
+    
+    data_dir = Path(__file__).resolve().parent / "data"
+    success_count = 0
+    for date_str, files in files_by_date.items():
+        date_dir = data_dir / date_str
+        # 재추출 전 기사 ID → 파일명: manifest(--config 수집)를 우선, 없으면 metadata.jsonl 의 URL로 찾음
+        previous = {cache_key(record["url"]): name
+                    for name, record in read_metadata(date_dir).items() if record.get("url")}
+        previous.update(update_manifest_files(data_dir, date_str, files))
+        removed = remove_replaced_files(date_dir, previous, files)
+        if metadata_by_date[date_str] or removed:
+            write_metadata(date_dir, metadata_by_date[date_str], removed)
+        saved = sum(1 for name in files.values() if name)
+        success_count += saved
+        print(f"✓ {date_str}: {saved}/{len(files)}개" + (f" (이전 파일 {len(removed)}개 삭제)" if removed else ""))
+    metrics.inc("articles_total", success_count, result="reextracted")
+    
+    return {
+        "dates": len(dates),
+        "success": success_count,
+        "fail": total - success_count,
+        "total": total,
+        "elapsed_s": round(time.perf_counter() - started, 1)
+    }
+
 def main():
+    import argparse
+
+    metrics.configure("downloader")
+
+    parser = argparse.ArgumentParser(description="네이버 뉴스 기사 다운로드")
+    parser.add_argument("--config", default=None, help="크롤 설정 JSON (여러 섹션/그룹/기간, 예: crawl_config.json)")
+    parser.add_argument("--redrive", action="store_true", help="data/dead_letter.jsonl 에 보관된 실패 URL 재시도")
+    parser.add_argument("--cache-html", action="store_true", help="원본 HTML을 cache/ 에 저장 (HTML_CACHE=1 과 같음)")
+    parser.add_argument("--re-extract", action="store_true", help="cache/ 의 원본 HTML로 기사 재추출 (네트워크 요청 없음)")
+    parser.add_argument("--start", default=None, help="--re-extract 시작 날짜 (yyyymmdd)")
+    parser.add_argument("--end", default=None, help="--re-extract 종료 날짜 (yyyymmdd)")
+    parser.add_argument("--workers", type=int, default=None, help="--re-extract 프로세스 수 (기본: CPU 수)")
+    args, _ = parser.parse_known_args()
+
+    global html_cache
+    if args.cache_html and html_cache is None:
+        html_cache = HtmlCache(CACHE_DIR)
+
+    if args.re_extract:
+        result = reextract_from_cache(args.start, args.end, args.workers)
+        print(f"\n재추출 결과:")
+        print(f"  - 날짜: {result['dates']}일")
+        print(f"  - 성공: {result['success']}개")
+        print(f"  - 실패: {result['fail']}개")
+        print(f"  - 소요 시간: {result['elapsed_s']}초")
+        metrics.report()
+        return
+
+    if args.redrive:
+        result = redrive_dead_letters()
+        print(f"\n재시도 결과:")
+        print(f"  - 성공: {result['success']}개")
+        print(f"  - 실패: {result['fail']}개")
+        print(f"  - 총: {result['total']}개")
+        metrics.report()
+        return
+
+    if args.config:
+        result = crawl_with_config(Path(args.config))
+        print(f"\n최종 결과:")
+        print(f"  - 목록: {result['lists']}개 (실패 {result['list_errors']}개)")
+        print(f"  - 기사 URL: {result['urls']}개, 그룹 간 중복 {result['duplicates']}개")
+        print(f"  - 성공: {result['success']}개")
+        print(f"  - 실패: {result['fail']}개")
+        print(f"  - 소요 시간: {result['elapsed_s']}초")
+        metrics.report()
+        return
+
     # 기간 설정
     start_date = "20251020"
     end_date = "20251024"
@@ -436,5 +775,8 @@ def main():
     print(f"  - 실패: {result['fail']}개")
     print(f"  - 총: {result['total']}개")
 
-if __name__ == "__main__":    
-    main()
+    metrics.report()
+
+if __name__ == "__main__":
+    # --profile {cprofile,sample,tracemalloc} 지정 시 profiles/ 에 결과 저장
+    profiling.run_main(main, Path(__file__).resolve().parent)
@@ -0,0 +1,269 @@
+"""
+여러 섹션 / 그룹 / 기간을 한 번에 수집하는 크롤 스케줄러
+
+설정 파일(crawl_config.json)의 소스마다 (날짜, 그룹) 목록 수집 작업을 만들고,
+소스끼리 번갈아 가며 공유 워커 풀에서 실행한다. 목록에서 나온 기사는 기사 ID(언론사ID/기사ID)로
+전체 그룹에 걸쳐 한 번만 다운로드하고, 기사가 나온 모든 (섹션, 그룹)을 태그로 남긴다.
+
+    목록 수집 (Selenium, list_workers개) ──새 기사──▶ 기사 다운로드 (workers개)
+                       └─ 이미 본 기사 ─▶ 태그만 추가
+
+소스별 rate(초당 요청 수) 안에서만 요청하므로 소스를 늘려도 한 사이트에 부하가 몰리지 않는다.
+"""
+import json
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import metrics
+
+# 네이버 뉴스 기사 URL에서 (언론사ID, 기사ID) 추출
+ARTICLE_ID_PATTERN = re.compile(r"/article/(\d+)/(\d+)")
+
+# 날짜 폴더별 기사 목록 (기사 ID, URL, 파일, 태그)
+MANIFEST_NAME = "articles.jsonl"
+
+
+def article_id(url: str) -> str | None:
+    """기사 URL → "언론사ID/기사ID" (형식이 다르면 None)"""
+    match = ARTICLE_ID_PATTERN.search(url)
+    return f"{match.group(1)}/{match.group(2)}" if match else None
+
+
+class RateLimiter:
+    """
+    초당 rate회까지 허용하는 토큰 버킷 (여러 스레드가 공유)
+
+    Args:
+        rate: 초당 허용 요청 수 (0 이하면 제한 없음)
+        burst: 한 번에 몰아서 허용할 최대 요청 수
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+def load_config(config_file: Path) -> Dict[str, Any]:
+    """
+    크롤 설정 파일 로드
+
+    {
+      "workers": 4,          # 기사 다운로드 동시 실행 수
+      "list_workers": 2,     # 목록 수집(Selenium) 동시 실행 수
+      "sources": [
+        {"name": "금융", "section": "101", "groups": ["259", "258"],
+         "start": "20251020", "end": "20251024", "rate": 2.0}
+      ]
+    }
+    """
+    with open(config_file, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    for source in config.get("sources", []):
+        source.setdefault("name", source["section"])
+        source["groups"] = [str(g) for g in source.get("groups", [])]
+        source.setdefault("rate", 2.0)
+    return config
+
+
+def date_strings(start_date: str, end_date: str) -> List[str]:
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    dates = []
+    while start <= end:
+        dates.append(start.strftime("%Y%m%d"))
+        start += timedelta(days=1)
+    return dates
+
+
+class CrawlScheduler:
+    """
+    목록 수집과 기사 다운로드를 공유 워커 풀에서 실행하는 스케줄러
+
+    Args:
+        config: load_config() 결과
+        list_urls: (section, group, date) → 기사 URL 리스트
+        download: (url, date) → 저장된 파일 Path (실패 시 None)
+        data_dir: 기사 저장 폴더 (날짜별 manifest 위치)
+    """
+
+    def __init__(self, config: Dict[str, Any], list_urls: Callable[[str, str, str], List[str]],
+                 download: Callable[[str, str], Path | None], data_dir: Path):
+        self.sources = config.get("sources", [])
+        self.workers = int(config.get("workers", 4))
+        self.list_workers = int(config.get("list_workers", 2))
+        self.list_urls = list_urls
+        self.download = download
+        self.data_dir = data_dir
+
+        self.limiters = {s["name"]: RateLimiter(float(s["rate"])) for s in self.sources}
+        self.lock = threading.Lock()
+        # 기사 ID → {"id", "url", "date", "tags": set, "file"}
+        self.articles: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"lists": 0, "list_errors": 0, "urls": 0, "duplicates": 0, "success": 0, "fail": 0}
+
+    def list_jobs(self) -> List[Tuple[Dict[str, Any], str, str]]:
+        """
+        (소스, 날짜, 그룹) 목록 수집 작업을 소스끼리 번갈아 가며 정렬
+
+        한 소스의 작업이 앞쪽에 몰리지 않게 해서, 소스별 rate 제한이 있어도 워커가 놀지 않게 한다.
+        """
+        per_source = [
+            [(source, date_str, group) for date_str in date_strings(source["start"], source["end"])
+             for group in source["groups"]]
+            for source in self.sources
+        ]
+        return [job for jobs in zip_longest(*per_source) for job in jobs if job is not None]
+
+    def _register(self, url: str, date_str: str, tag: str) -> Dict[str, Any] | None:
+        """기사를 전역 목록에 등록. 처음 본 기사면 등록된 항목, 이미 본 기사면 태그만 추가하고 None"""
+        key = article_id(url) or url
+        with self.lock:
+            self.stats["urls"] += 1
+            article = self.articles.get(key)
+            if article is not None:
+                article["tags"].add(tag)
+                self.stats["duplicates"] += 1
+                metrics.inc("crawl_duplicates_total")
+                return None
+            article = {"id": key, "url": url, "date": date_str, "tags": {tag}, "file": None}
+            self.articles[key] = article
+            return article
+
+    def _list(self, source: Dict[str, Any], date_str: str, group: str) -> List[str]:
+        self.limiters[source["name"]].acquire()
+        with metrics.span("crawl_list"):
+            return self.list_urls(source["section"], group, date_str)
+
+    def _download(self, source: Dict[str, Any], article: Dict[str, Any]):
+        self.limiters[source["name"]].acquire()
+        saved_path = self.download(article["url"], article["date"])
+        with self.lock:
+            if saved_path:
+                article["file"] = Path(saved_path).name
+                self.stats["success"] += 1
+            else:
+                self.stats["fail"] += 1
+
+    def run(self) -> Dict[str, Any]:
+        """
+        전체 수집 실행
+
+        Returns:
+            dict: {"lists", "list_errors", "urls", "duplicates", "articles", "success", "fail", "elapsed_s"}
+        """
+        started = time.perf_counter()
+        jobs = self.list_jobs()
+        print(f"목록 수집 작업 {len(jobs)}개 (소스 {len(self.sources)}개), "
+              f"목록 워커 {self.list_workers}개 / 다운로드 워커 {self.workers}개")
+
+        download_futures: List[Future] = []
+        with ThreadPoolExecutor(self.list_workers, thread_name_prefix="list") as list_pool, \
+                ThreadPoolExecutor(self.workers, thread_name_prefix="fetch") as fetch_pool:
+            list_futures = {list_pool.submit(self._list, *job): job for job in jobs}
+
+            # 목록이 끝나는 대로 새 기사를 바로 다운로드 풀에 넣음
+            pending = set(list_futures)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    source, date_str, group = list_futures[future]
+                    tag = f"{source['section']}/{group}"
+                    try:
+                        urls = future.result()
+                    except Exception as e:
+                        print(f"✗ 목록 수집 실패 {tag} {date_str}: {e}")
+                        with self.lock:
+                            self.stats["list_errors"] += 1
+                        continue
+                    with self.lock:
+                        self.stats["lists"] += 1
+
+                    new_count = 0
+                    for url in urls:
+                        article = self._register(url, date_str, tag)
+                        if article is not None:
+                            new_count += 1
+                            download_futures.append(fetch_pool.submit(self._download, source, article))
+                    print(f"✓ {tag} {date_str}: {len(urls)}개 중 새 기사 {new_count}개")
+
+            wait(download_futures)
+
+        self.save_manifests()
+        result = dict(self.stats, articles=len(self.articles), elapsed_s=round(time.perf_counter() - started, 1))
+        return result
+
+    def save_manifests(self):
+        """날짜 폴더마다 articles.jsonl 저장 (기존 항목과 태그 병합, 기사 ID 순)"""
+        by_date: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for article in self.articles.values():
+            if article["file"]:
+                by_date.setdefault(article["date"], {})[article["id"]] = article
+
+        for date_str, articles in by_date.items():
+            manifest = self.data_dir / date_str / MANIFEST_NAME
+            entries: Dict[str, Dict[str, Any]] = {}
+            if manifest.exists():
+                for line in manifest.read_text(encoding="utf-8").splitlines():
+                    if line.strip():
+                        entry = json.loads(line)
+                        entries[entry["id"]] = entry
+            for key, article in articles.items():
+                tags = set(entries.get(key, {}).get("tags", [])) | article["tags"]
+                entries[key] = {"id": key, "url": article["url"], "file": article["file"], "tags": sorted(tags)}
+
+            manifest.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = manifest.with_suffix(".jsonl.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                for key in sorted(entries):
+                    f.write(json.dumps(entries[key], ensure_ascii=False) + "\n")
+            tmp_file.replace(manifest)
+
+
+def update_manifest_files(data_dir: Path, date_str: str, files: Dict[str, str | None]) -> Dict[str, str]:
+    """
+    날짜 manifest의 기사별 파일명 갱신 (재추출로 제목 → 파일명이 바뀐 경우)
+
+    Args:
+        data_dir: 기사 저장 폴더
+        date_str: 날짜 문자열 (yyyymmdd)
+        files: 기사 ID → 새 파일명 (None이면 그대로 둠)
+
+    Returns:
+        Dict[str, str]: manifest에 있던 기사 ID → 갱신 전 파일명 (manifest가 없으면 빈 딕셔너리)
+    """
+    manifest = data_dir / date_str / MANIFEST_NAME
+    if not manifest.exists():
+        return {}
+    entries = [json.loads(line) for line in manifest.read_text(encoding="utf-8").splitlines() if line.strip()]
+    previous = {entry["id"]: entry["file"] for entry in entries if entry.get("file")}
+    tmp_file = manifest.with_suffix(".jsonl.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        for entry in entries:
+            if files.get(entry["id"]):
+                entry["file"] = files[entry["id"]]
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    tmp_file.replace(manifest)
+    return previous
@@ -1,9 +1,61 @@
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+import argparse
+import json
 import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+import metrics
+import profiling
+from categories import categorize
+from textclean import clean_article, estimate_tokens, learn_boilerplate, strip_boilerplate
 
 NEWS_DATA_DIR = "./Downloader/data/"
 SUMMARIZED_DATA_DIR = "./Summarizer/data/"
 
+# 기사 하나당 LLM 입력 토큰 예산 (추정치 기준). 뉴스는 앞부분이 핵심이므로 넘치면 뒤를 자른다
+ARTICLE_TOKEN_BUDGET = 1024
+
+# LLM 요청 재시도: 최대 시도 횟수(첫 시도 포함)와 백오프 (초, 시도마다 2배, full jitter)
+LLM_MAX_ATTEMPTS = 3
+LLM_BACKOFF_BASE = 2.0
+LLM_BACKOFF_MAX = 30.0
+# 다시 시도하면 성공할 수 있는 오류 (요청 한도 초과, 일시적 서버 오류, 시간 초과)
+LLM_TRANSIENT_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
+# Downloader --config 수집 시 날짜 폴더에 남는 기사 목록 (파일명 → 언론사ID/기사ID)
+MANIFEST_NAME = "articles.jsonl"
+
+# 요약 방식
+#   llm      : Gemini로 기사마다 요약 (기본)
+#   textrank : TextRank 추출 요약만 (API 키 / 네트워크 불필요)
+#   draft    : TextRank 요약을 먼저 .sum으로 저장한 뒤 LLM 결과로 교체 (LLM이 실패한 기사는 TextRank 요약 유지)
+SUMMARY_MODES = ("llm", "textrank", "draft")
+
+_textrank = None
+
+CATEGORY_LINE = re.compile(r"^(\s*<분류>:)[ \t]*(.*)$", re.MULTILINE)
+SUMMARY_LINE = re.compile(r"^\s*<요약>:[ \t]*(.*)$", re.MULTILINE)
+
+# TextRank 요약기를 처음 쓸 때 만든다 (Kiwi 모델 로딩이 오래 걸리므로 llm 방식에서는 만들지 않음)
+def get_textrank_summarizer():
+    global _textrank
+    if _textrank is None:
+        from textrank import TextRankSummarizer
+        _textrank = TextRankSummarizer()
+    return _textrank
+
 # Gemini의 모델을 생성한다.
 def get_single_summary_model():
     # 1. API 키 설정
@@ -28,29 +80,54 @@ def get_single_summary_model():
 
     return model
 
+# 일시적인 오류면 백오프 후 다시 요청한다 (재시도마다 llm_retries_total 증가).
+# 마지막 시도까지 실패하거나 일시적이지 않은 오류면 그대로 예외를 던진다.
+def generate_with_retry(model, prompt, max_attempts=LLM_MAX_ATTEMPTS):
+    for attempt in range(1, max_attempts + 1):
+        try:
+            with metrics.span("llm_request"):
+                return model.generate_content(prompt)
+        except LLM_TRANSIENT_ERRORS as e:
+            if attempt == max_attempts:
+                raise
+            wait = random.uniform(0, min(LLM_BACKOFF_MAX, LLM_BACKOFF_BASE * 2 ** (attempt - 1)))
+            print(f"✗ LLM 요청 실패 ({attempt}/{max_attempts}), {wait:.1f}초 후 재시도: {e}")
+            metrics.inc("llm_retries_total", error=type(e).__name__)
+            time.sleep(wait)
+
 # 파라미터로 주어진 텍스트파일에 대해 Gemini에 요약을 요청하고 결과를 반환한다.
 # model: Gemini 모델 객체
 # file_path: 요약할 텍스트 파일 경로
-# def summarize_article(model, file_path):
-def summarize_article(model, file_path):
+# learned: learn_boilerplate() 결과 (언론사별 상용구 줄). 없으면 고정 규칙만 적용
+# group: 기사의 언론사ID (learned 조회용)
+def summarize_article(model, file_path, learned=None, group=None):
     try:
         # 텍스트 파일 읽기
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
 
+        # 상용구를 지우고 토큰 예산만큼만 보냄
+        prompt = clean_article(content, learned, group, ARTICLE_TOKEN_BUDGET)
+        metrics.inc("llm_input_tokens_raw_total", estimate_tokens(content))
+        metrics.inc("llm_input_tokens_total", estimate_tokens(prompt))
+
         # Gemini 모델을 사용하여 요약 생성
-        response = model.generate_content(content)
+        metrics.inc("llm_input_chars_total", len(prompt))
+        response = generate_with_retry(model, prompt)
 
         summary = response.text.strip()
+        metrics.inc("llm_requests_total", result="success")
 
         return summary    
     
     
     except FileNotFoundError:
         print(f"오류: {file_path}에서 파일을 찾을 수 없습니다")
+        metrics.inc("llm_requests_total", result="not_found")
         return None
     except Exception as e:
         print(f"기사 처리 중 오류 발생: {str(e)}")
+        metrics.inc("llm_requests_total", result="error")
         return None
 
 # 요약들을 모아서 Gemini에 종합 요약을 요청한다.
@@ -86,14 +163,173 @@ def summarize_all_articles(summaries):
         print(f"종합 요약 생성 중 오류 발생: {str(e)}")
         return None
 
-def main():
-    # 1. API 키 확인
-    if not os.getenv("GOOGLE_API_KEY"):
-        print("GOOGLE_API_KEY 환경 변수가 설정되지 않았습니다.")
+# 날짜 폴더의 manifest(articles.jsonl)에서 파일명 → 언론사ID 매핑을 읽는다. 없으면 빈 딕셔너리
+def press_by_file(date_path):
+    manifest = os.path.join(date_path, MANIFEST_NAME)
+    if not os.path.exists(manifest):
+        return {}
+    press = {}
+    with open(manifest, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                if entry.get("file"):
+                    press[entry["file"]] = entry["id"].split("/")[0]
+    return press
+
+# 하루치 기사에서 언론사별로 반복되는 상용구 줄을 학습한다 (언론사를 모르면 "*" 한 그룹)
+def learn_date_boilerplate(date_path, file_names, press):
+    docs_by_group = {}
+    for file_name in file_names:
+        try:
+            with open(os.path.join(date_path, file_name), 'r', encoding='utf-8') as f:
+                docs_by_group.setdefault(press.get(file_name, "*"), []).append(f.read())
+        except OSError:
+            continue
+    return learn_boilerplate(docs_by_group)
+
+# 요약 항목들의 <분류>를 고정 분류 체계(Common/categories.py)로 바꾼다.
+# LLM / TextRank가 붙인 분류는 요약과 함께 분류기의 입력으로만 쓴다. 형식이 다른 항목은 그대로 둔다
+def assign_categories(summaries):
+    parsed = [(CATEGORY_LINE.search(s), SUMMARY_LINE.search(s)) for s in summaries]
+    targets = [i for i, (category, summary) in enumerate(parsed) if category and summary]
+    categories = categorize(
+        [parsed[i][0].group(2).strip() for i in targets],
+        [parsed[i][1].group(1).strip() for i in targets],
+    )
+    result = list(summaries)
+    for i, category in zip(targets, categories):
+        result[i] = CATEGORY_LINE.sub(lambda m: f"{m.group(1)} {category}", summaries[i], count=1)
+    return result
+
+# 요약 항목 뒤에 원본 기사 파일명을 붙인다 (WebProgram이 클러스터 / 기사와 연결할 때 사용, 없어도 읽을 수 있음)
+def with_article(summary, file_name):
+    return f"{summary.rstrip()}\n<기사>: {file_name}"
+
+# 요약 리스트를 .sum 파일로 저장한다. 대시보드가 읽는 도중에 바뀌어도 깨지지 않도록 임시 파일에 쓴 뒤 교체
+def write_summary_file(output_file, summaries):
+    tmp_file = output_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        for summary in summaries:
+            f.write(summary)
+            f.write('\n\n')  # 각 요약 뒤에 한 줄 띄기
+    os.replace(tmp_file, output_file)
+
+# 기사들을 TextRank로 요약한다. 반환값: file_names 순서대로의 요약 (요약할 문장이 없으면 None)
+def textrank_summaries(date_path, file_names, learned, press):
+    articles = []
+    for file_name in file_names:
+        try:
+            with open(os.path.join(date_path, file_name), 'r', encoding='utf-8') as f:
+                body = strip_boilerplate(f.read(), learned, press.get(file_name, "*"))
+        except OSError:
+            body = ""
+        # 파일명이 기사 제목 (Downloader가 제목으로 저장)
+        articles.append((os.path.splitext(file_name)[0], body))
+
+    started = time.perf_counter()
+    with metrics.span("textrank"):
+        summaries = get_textrank_summarizer().summarize_many(articles)
+    elapsed = time.perf_counter() - started
+    metrics.inc("textrank_articles_total", len(articles))
+    if articles:
+        print(f"TextRank 요약 {len(articles)}개 기사, {elapsed:.2f}초 ({len(articles) / max(elapsed, 1e-9):,.0f} articles/s)")
+    return summaries
+
+# 날짜 폴더 하나(하루치)의 모든 기사를 요약해서 output_dir/yyyymmdd.sum 으로 저장한다.
+# model: Gemini 모델 객체 (textrank 방식에서는 None 가능)
+# date_path: 기사 텍스트 파일들이 있는 날짜 폴더 경로 (폴더명은 yyyymmdd)
+# output_dir: 요약 파일을 저장할 폴더
+# mode: 요약 방식 (SUMMARY_MODES)
+# 반환값: 요약 문자열 리스트 (요약할 기사가 없으면 빈 리스트)
+def summarize_date_folder(model, date_path, output_dir=SUMMARIZED_DATA_DIR, mode="llm"):
+    date_folder = os.path.basename(os.path.normpath(date_path))
+    # 파일명 생성: yyyymmdd.sum
+    output_file = os.path.join(output_dir, f"{date_folder}.sum")
+
+    file_names = sorted(f for f in os.listdir(date_path) if f.endswith('.txt'))
+    press = press_by_file(date_path)
+    learned = learn_date_boilerplate(date_path, file_names, press)
+
+    # TextRank 요약 (draft 방식에서는 LLM 결과가 나오기 전까지 먼저 보여줄 초안)
+    drafts = [None] * len(file_names)
+    if mode in ("textrank", "draft"):
+        drafts = textrank_summaries(date_path, file_names, learned, press)
+        if mode == "draft" and any(drafts):
+            os.makedirs(output_dir, exist_ok=True)
+            write_summary_file(output_file, assign_categories(
+                [with_article(d, name) for name, d in zip(file_names, drafts) if d]))
+            print(f"{date_folder}의 초안 요약을 {output_file}에 저장했습니다. LLM 요약으로 교체합니다...")
+
+    raw_tokens = metrics.counter_total("llm_input_tokens_raw_total")
+    sent_tokens = metrics.counter_total("llm_input_tokens_total")
+    _, llm_seconds = metrics.span_total("llm_request")
+
+    if mode == "textrank":
+        daily_summaries = [with_article(d, name) for name, d in zip(file_names, drafts) if d]
+    else:
+        daily_summaries = []
+        # 각 폴더의 모든 텍스트파일에 대해 요약. 하루치
+        for file_name, draft in zip(file_names, drafts):
+            file_path = os.path.join(date_path, file_name)
+            summary = summarize_article(model, file_path, learned, press.get(file_name, "*"))
+
+            if summary:
+                daily_summaries.append(with_article(summary, file_name))
+                print(f"'{file_name}' 요약 완료")
+            elif draft:
+                daily_summaries.append(with_article(draft, file_name))
+                metrics.inc("textrank_fallback_total")
+                print(f"'{file_name}' LLM 요약 실패, TextRank 요약 사용")
+
+    # daily_summaries를 파일로 저장
+    if daily_summaries:
+        daily_summaries = assign_categories(daily_summaries)
+        # output_dir 폴더가 없으면 생성
+        os.makedirs(output_dir, exist_ok=True)
+        write_summary_file(output_file, daily_summaries)
+        metrics.inc("files_written_total", kind="summary")
+        
+        print(f"{date_folder}의 요약이 {output_file}에 저장되었습니다. (총 {len(daily_summaries)}개)")
+    else:
+        print(f"{date_folder} 폴더에서 요약할 기사를 찾을 수 없습니다.")
+
+    report_input_reduction(
+        date_folder,
+        metrics.counter_total("llm_input_tokens_raw_total") - raw_tokens,
+        metrics.counter_total("llm_input_tokens_total") - sent_tokens,
+        metrics.span_total("llm_request")[1] - llm_seconds,
+    )
+
+    return daily_summaries
+
+# 하루치 입력 토큰 감소량과 절약한 시간 추정을 출력한다.
+# 절약 시간은 요청 시간이 입력 토큰 수에 비례한다고 보고 (줄인 토큰 수 × 보낸 토큰당 평균 시간)으로 추정
+def report_input_reduction(date_folder, raw_tokens, sent_tokens, llm_seconds):
+    if not raw_tokens:
         return
-    
-    # 2. 각 기사별 요약용 모델 생성
-    model = get_single_summary_model()
+    saved_tokens = raw_tokens - sent_tokens
+    saved_seconds = saved_tokens * llm_seconds / sent_tokens if sent_tokens else 0.0
+    print(f"{date_folder} 입력 토큰(추정): {raw_tokens:,.0f} → {sent_tokens:,.0f} "
+          f"({saved_tokens / raw_tokens:.1%} 감소), 절약 시간 추정 {saved_seconds:.1f}초")
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜별 기사 요약 (.sum) 생성")
+    parser.add_argument("--mode", choices=SUMMARY_MODES, default="llm",
+                        help="llm: Gemini 요약, textrank: 로컬 추출 요약, draft: TextRank 초안 저장 후 LLM 요약으로 교체")
+    args, _ = parser.parse_known_args()
+
+    metrics.configure("summarizer")
+
+    # 1. API 키 확인 (textrank 방식은 필요 없음)
+    model = None
+    if args.mode != "textrank":
+        if not os.getenv("GOOGLE_API_KEY"):
+            print("GOOGLE_API_KEY 환경 변수가 설정되지 않았습니다. (로컬 요약만 하려면 --mode textrank)")
+            return
+
+        # 2. 각 기사별 요약용 모델 생성
+        model = get_single_summary_model()
 
     # 3. 소스폴더 경로 설정. 없으면 에러
     if not os.path.exists(NEWS_DATA_DIR):
@@ -106,43 +342,11 @@ def main():
         if not os.path.isdir(date_path):
             continue
 
+        # 5. 하루치 기사 요약 후 .sum 파일로 저장
         print(f"\n{date_folder} 폴더 처리 중...")
-        daily_summaries = []
-
-        # 5. 각 폴더의 모든 텍스트파일에 대해 요약. 하루치
-        for file_name in os.listdir(date_path):
-            if not file_name.endswith('.txt'):
-                continue
-                
-            file_path = os.path.join(date_path, file_name)
-            summary = summarize_article(model, file_path)
-            
-            if summary:
-                daily_summaries.append(summary)
-                print(f"'{file_name}' 요약 완료")
+        daily_summaries = summarize_date_folder(model, date_path, mode=args.mode)
 
-        # 6. daily_summaries를 파일로 저장
-        if daily_summaries:
-            # SUMMARIZED_DATA_DIR 폴더가 없으면 생성
-            os.makedirs(SUMMARIZED_DATA_DIR, exist_ok=True)
-            
-            # date_path에서 yyyymmdd 추출 (예: "data/20251025" -> "20251025")
-            date_str = os.path.basename(date_path)
-            
-            # 파일명 생성: yyyymmdd.sum
-            output_file = os.path.join(SUMMARIZED_DATA_DIR, f"{date_str}.sum")
-            
-            # 파일에 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for summary in daily_summaries:
-                    f.write(summary)
-                    f.write('\n\n')  # 각 요약 뒤에 한 줄 띄기
-            
-            print(f"{date_folder}의 요약이 {output_file}에 저장되었습니다. (총 {len(daily_summaries)}개)")
-        else:
-            print(f"{date_folder} 폴더에서 요약할 기사를 찾을 수 없습니다.")
-
-        # 7. 해당 날짜의 요약들을 종합 (주석 처리된 부분)
+        # 6. 해당 날짜의 요약들을 종합 (주석 처리된 부분)
         # if daily_summaries:
         #     final_summary = summarize_all_articles(daily_summaries)
             
@@ -158,5 +362,8 @@ def main():
         # else:
         #     print(f"{date_folder} 폴더에서 요약할 기사를 찾을 수 없습니다.")
 
+    metrics.report()
+
 if __name__ == "__main__":
-    main()
+    # --profile {cprofile,sample,tracemalloc} 지정 시 profiles/ 에 결과 저장
+    profiling.run_main(main, Path(__file__).resolve().parent)
@@ -0,0 +1,179 @@
+"""
+TextRank 추출 요약 (LLM 없이 CPU만으로 동작)
+
+기사 문장마다 Kiwi로 명사를 뽑고, 두 문장이 공유하는 명사 수로 문장 그래프를 만든 뒤
+PageRank 점수가 높은 문장을 원래 순서대로 골라 요약으로 쓴다.
+LLM과 같은 "<분류>: ... / <요약>: ..." 형식으로 돌려주므로 .sum 파일에 그대로 저장할 수 있다.
+
+    summarizer = TextRankSummarizer()
+    summarizer.summarize_many([(제목, 본문), ...])   하루치 기사를 한 번에 분석 (문장 분석을 한 번의 Kiwi 호출로)
+"""
+import os
+import re
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from kiwipiepy import Kiwi
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from textclean import strip_boilerplate
+
+# 요약으로 뽑을 문장 수
+SUMMARY_SENTENCES = 2
+# 요약 한 줄의 최대 길이 (넘치면 잘라서 "…" 붙임)
+MAX_SUMMARY_CHARS = 300
+# 명사가 이보다 적은 문장은 요약 후보에서 제외 (바이라인, 짧은 인용 등)
+MIN_SENTENCE_NOUNS = 2
+
+DAMPING = 0.85
+MAX_ITERATIONS = 100
+TOLERANCE = 1e-6
+# 제목과 겹치는 명사 하나당 재시작 확률 가중치 (뉴스는 제목이 핵심을 요약하므로)
+TITLE_WEIGHT = 1.0
+
+SENTENCE_SPLIT = re.compile(r'\n+|(?<=[.!?])\s+')
+
+
+def split_sentences(text: str) -> List[str]:
+    """텍스트를 문장 단위로 나눔 (앞뒤 공백 제거, 빈 문장 제외)"""
+    return [s for s in (part.strip() for part in SENTENCE_SPLIT.split(text)) if s]
+
+
+def textrank_scores(incidence: np.ndarray, bias: Optional[np.ndarray] = None,
+                    damping: float = DAMPING) -> np.ndarray:
+    """
+    문장 × 명사 출현 행렬로 문장 TextRank 점수 계산
+
+    유사도는 TextRank 논문과 같이 공유 명사 수 / (log|Si| + log|Sj|) 이며,
+    (문장 수 × 문장 수) 행렬 연산과 거듭제곱법으로 한 번에 계산한다.
+
+    Args:
+        incidence: (문장 수, 명사 수) 0/1 행렬
+        bias: 문장별 재시작 가중치 (없으면 균등)
+        damping: 감쇠 계수
+
+    Returns:
+        np.ndarray: 문장별 점수 (합 1)
+    """
+    n = incidence.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    overlap = incidence @ incidence.T
+    log_sizes = np.log1p(incidence.sum(axis=1))
+    denom = log_sizes[:, None] + log_sizes[None, :]
+    similarity = np.divide(overlap, denom, out=np.zeros((n, n)), where=denom > 0)
+    np.fill_diagonal(similarity, 0.0)
+
+    out_weight = similarity.sum(axis=1)
+    transition = np.divide(similarity, out_weight[:, None], out=np.zeros((n, n)), where=out_weight[:, None] > 0)
+    dangling = out_weight == 0
+
+    if bias is None or bias.sum() <= 0:
+        teleport = np.full(n, 1.0 / n)
+    else:
+        teleport = bias / bias.sum()
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITERATIONS):
+        # 다른 문장과 겹치는 명사가 없는 문장의 점수는 재시작 분포로 나눠 줌
+        updated = (1 - damping) * teleport + damping * (transition.T @ scores + scores[dangling].sum() * teleport)
+        converged = np.abs(updated - scores).sum() < TOLERANCE
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def keyword_category(nouns: Sequence[str]) -> str:
+    """기사에서 가장 많이 나온 명사 (같으면 먼저 나온 명사)를 분류로 사용"""
+    counts = {}
+    for noun in nouns:
+        counts[noun] = counts.get(noun, 0) + 1
+    return max(counts, key=counts.get) if counts else "기타"
+
+
+def format_summary(category: str, summary: str) -> str:
+    """LLM 출력과 같은 .sum 항목 형식"""
+    if len(summary) > MAX_SUMMARY_CHARS:
+        summary = summary[:MAX_SUMMARY_CHARS].rstrip() + "…"
+    return f"<분류>: {category}\n<요약>: {summary}"
+
+
+class TextRankSummarizer:
+    """
+    TextRank 추출 요약기
+
+    Args:
+        kiwi: Kiwi 인스턴스 (없으면 새로 생성)
+        sentences: 요약으로 뽑을 문장 수
+    """
+
+    def __init__(self, kiwi: Optional[Kiwi] = None, sentences: int = SUMMARY_SENTENCES):
+        self.kiwi = kiwi or Kiwi()
+        self.sentences = sentences
+
+    def _nouns(self, texts: List[str]) -> List[List[str]]:
+        """여러 텍스트의 명사 목록 (Kiwi 한 번 호출)"""
+        if not texts:
+            return []
+        return [
+            [t.form for t in tokens if t.tag.startswith('N') and len(t.form) >= 2]
+            for tokens in self.kiwi.tokenize(texts)
+        ]
+
+    def summarize_many(self, articles: Sequence[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        기사 여러 개를 요약
+
+        Args:
+            articles: [(제목, 본문), ...]
+
+        Returns:
+            List[Optional[str]]: 기사 순서대로의 .sum 항목 문자열 (문장이 없는 기사는 None)
+        """
+        sentences_by_article = [split_sentences(strip_boilerplate(body)) for _, body in articles]
+
+        # 하루치 모든 제목 + 문장을 한 번에 분석
+        flat = [title for title, _ in articles]
+        for sentences in sentences_by_article:
+            flat.extend(sentences)
+        nouns = self._nouns(flat)
+        title_nouns, sentence_nouns = nouns[:len(articles)], nouns[len(articles):]
+
+        results = []
+        position = 0
+        for sentences, title in zip(sentences_by_article, title_nouns):
+            article_nouns = sentence_nouns[position:position + len(sentences)]
+            position += len(sentences)
+            results.append(self._summarize_one(sentences, article_nouns, title))
+        return results
+
+    def summarize(self, title: str, body: str) -> Optional[str]:
+        """기사 하나 요약"""
+        return self.summarize_many([(title, body)])[0]
+
+    def _summarize_one(self, sentences: List[str], nouns: List[List[str]], title_nouns: List[str]) -> Optional[str]:
+        candidates = [i for i, words in enumerate(nouns) if len(words) >= MIN_SENTENCE_NOUNS]
+        if not candidates:
+            return None
+
+        vocab = {}
+        for i in candidates:
+            for word in nouns[i]:
+                vocab.setdefault(word, len(vocab))
+        incidence = np.zeros((len(candidates), len(vocab)))
+        for row, i in enumerate(candidates):
+            incidence[row, [vocab[w] for w in nouns[i]]] = 1.0
+
+        title_columns = [vocab[w] for w in set(title_nouns) if w in vocab]
+        bias = 1.0 + TITLE_WEIGHT * incidence[:, title_columns].sum(axis=1)
+
+        scores = textrank_scores(incidence, bias)
+        # 점수 내림차순, 같으면 앞 문장 우선. 요약은 원래 문장 순서대로
+        top = sorted(np.lexsort((np.arange(len(candidates)), -scores))[:self.sentences])
+        summary = " ".join(sentences[candidates[row]] for row in top)
+
+        all_nouns = [w for words in nouns for w in words]
+        return format_summary(keyword_category(title_nouns + all_nouns), summary)
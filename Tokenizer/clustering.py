@@ -0,0 +1,280 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# 어휘: 이 기사 수 이상에 나오고, 전체 기사의 이 비율 이하에 나오는 명사만 사용
+MIN_DF = 2
+MAX_DF_RATIO = 0.5
+# 클러스터 수: 기사 수 / ARTICLES_PER_CLUSTER (2 ~ MAX_CLUSTERS)
+ARTICLES_PER_CLUSTER = 25
+MAX_CLUSTERS = 100
+# 미니배치 k-means
+BATCH_SIZE = 1024
+MAX_STEPS = 100
+# 가장 가까운 중심점과의 코사인 유사도가 이보다 낮은 기사는 미분류 (-1)
+MIN_SIMILARITY = 0.1
+# 클러스터별로 저장하는 대표 단어 / 대표 기사 수
+KEYWORDS = 5
+REPRESENTATIVES = 3
+# 늦게 들어온 기사 배정용으로 저장하는 중심점별 상위 단어 수
+CENTROID_TERMS = 300
+
+CLUSTER_DIR = Path(__file__).parent / 'data' / 'clusters'
+
+
+def fit_vocabulary(docs: Sequence[dict]) -> Tuple[List[str], np.ndarray]:
+    """
+    하루치 기사로 어휘와 IDF 계산
+
+    Args:
+        docs: 기사별 {명사: 출현횟수}
+
+    Returns:
+        Tuple[List[str], np.ndarray]: (단어 목록 (정렬됨), 단어별 IDF)
+    """
+    doc_freq: Dict[str, int] = {}
+    for doc in docs:
+        for word in doc:
+            doc_freq[word] = doc_freq.get(word, 0) + 1
+    max_df = max(MIN_DF, int(len(docs) * MAX_DF_RATIO))
+    words = sorted(w for w, df in doc_freq.items() if MIN_DF <= df <= max_df)
+    idf = np.array([np.log((1 + len(docs)) / (1 + doc_freq[w])) + 1.0 for w in words])
+    return words, idf
+
+
+def tfidf_matrix(docs: Sequence[dict], vocab: Dict[str, int], idf: np.ndarray) -> sparse.csr_matrix:
+    """
+    기사 × 단어 TF-IDF 행렬 (tf는 1 + log(출현횟수), 행마다 L2 정규화)
+
+    Args:
+        docs: 기사별 {명사: 출현횟수}
+        vocab: {단어: 열 번호}
+        idf: 열 번호별 IDF
+
+    Returns:
+        sparse.csr_matrix: (기사 수, 단어 수). 어휘에 있는 명사가 없는 기사는 0 행
+    """
+    indptr = [0]
+    indices: List[int] = []
+    counts: List[int] = []
+    for doc in docs:
+        for word, count in doc.items():
+            column = vocab.get(word)
+            if column is not None:
+                indices.append(column)
+                counts.append(count)
+        indptr.append(len(indices))
+    indices_arr = np.asarray(indices, dtype=np.int32)
+    data = (1.0 + np.log(np.asarray(counts, dtype=np.float64))) * idf[indices_arr]
+    matrix = sparse.csr_matrix((data, indices_arr, np.asarray(indptr, dtype=np.int64)),
+                               shape=(len(docs), len(vocab)))
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    return sparse.diags(1.0 / np.where(norms > 0, norms, 1.0)) @ matrix
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def init_centroids(matrix: sparse.csr_matrix, k: int, rng: np.random.Generator) -> np.ndarray:
+    """k-means++ 초기 중심점 (코사인 거리, 표본 위에서 선택)"""
+    sample = rng.choice(matrix.shape[0], size=min(matrix.shape[0], 20 * k), replace=False)
+    rows = matrix[sample]
+    chosen = [int(rng.integers(len(sample)))]
+    best = (rows @ rows[chosen[0]].T).toarray().ravel()
+    for _ in range(1, k):
+        distance = np.maximum(1.0 - best, 0.0)
+        total = distance.sum()
+        if total <= 0:
+            break
+        pick = int(rng.choice(len(sample), p=distance / total))
+        chosen.append(pick)
+        best = np.maximum(best, (rows @ rows[pick].T).toarray().ravel())
+    return _normalize_rows(rows[chosen].toarray())
+
+
+def minibatch_kmeans(matrix: sparse.csr_matrix, k: int, seed: int = 0,
+                     batch_size: int = BATCH_SIZE, steps: int = MAX_STEPS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    구면(코사인) 미니배치 k-means (Sculley, 2010)
+
+    스텝마다 기사 batch_size개를 뽑아 가장 가까운 중심점에 배정하고, 중심점을 지금까지 배정된
+    기사 수에 반비례하는 학습률로 옮긴다. 시드가 같으면 항상 같은 결과.
+
+    Args:
+        matrix: L2 정규화된 (기사 수, 단어 수) 행렬 (0 행 없음)
+        k: 클러스터 수
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (L2 정규화된 (k', 단어 수) 중심점, 중심점별 배정 기사 수)
+    """
+    rng = np.random.default_rng(seed)
+    centroids = init_centroids(matrix, k, rng)
+    k = centroids.shape[0]
+    counts = np.zeros(k)
+    n = matrix.shape[0]
+    for _ in range(steps):
+        batch = matrix[rng.choice(n, size=min(batch_size, n), replace=False)]
+        labels = np.asarray((batch @ centroids.T).argmax(axis=1)).ravel()
+        # 중심점별 배치 합과 개수
+        assign = sparse.csr_matrix((np.ones(len(labels)), (labels, np.arange(len(labels)))), shape=(k, len(labels)))
+        batch_sums = np.asarray((assign @ batch).todense())
+        batch_counts = np.bincount(labels, minlength=k)
+        counts += batch_counts
+        updated = batch_counts > 0
+        rate = (batch_counts[updated] / counts[updated])[:, None]
+        centroids[updated] = (1 - rate) * centroids[updated] + rate * batch_sums[updated] / batch_counts[updated][:, None]
+        centroids = _normalize_rows(centroids)
+    return centroids, counts
+
+
+def cluster_articles(docs: Sequence[dict], names: Sequence[str], seed: int = 0) -> Optional[dict]:
+    """
+    하루치 기사를 이야기(사건) 단위로 묶음
+
+    Args:
+        docs: 기사별 {명사: 출현횟수}
+        names: 기사 파일명 (docs와 같은 순서)
+
+    Returns:
+        Optional[dict]: {"view": 화면용 결과, "model": 늦게 들어온 기사 배정용 모델}. 묶을 기사가 없으면 None
+            view: {"articles", "clusters": [{"id", "size", "keywords", "representatives"}], "assignments": {파일명: id}}
+                  (id는 크기 내림차순 0부터, 미분류는 -1)
+            model: {"vocab", "idf", "centroids": [{단어: 가중치}], "counts"}
+    """
+    words, idf = fit_vocabulary(docs)
+    vocab = {w: i for i, w in enumerate(words)}
+    matrix = tfidf_matrix(docs, vocab, idf)
+    nonempty = np.flatnonzero(matrix.getnnz(axis=1) > 0)
+    if len(nonempty) < 2:
+        return None
+
+    k = int(np.clip(len(nonempty) // ARTICLES_PER_CLUSTER, 2, MAX_CLUSTERS))
+    centroids, _ = minibatch_kmeans(matrix[nonempty], k, seed)
+
+    # 전체 기사 최종 배정
+    similarity = np.asarray((matrix @ centroids.T))
+    labels = similarity.argmax(axis=1)
+    best = similarity[np.arange(len(labels)), labels]
+    labels[best < MIN_SIMILARITY] = -1
+
+    # 빈 클러스터는 버리고 크기 내림차순으로 번호를 다시 붙임
+    sizes = np.bincount(labels[labels >= 0], minlength=centroids.shape[0])
+    order = [int(c) for c in np.lexsort((np.arange(len(sizes)), -sizes)) if sizes[c] > 0]
+    renumber = {old: new for new, old in enumerate(order)}
+
+    # 중심점을 최종 배정 기사들의 평균으로 다시 계산 (미니배치 근사 보정)
+    final = np.zeros((len(order), len(words)))
+    clusters = []
+    assignments = {}
+    for i, name in enumerate(names):
+        assignments[name] = renumber.get(int(labels[i]), -1)
+    for new, old in enumerate(order):
+        members = np.flatnonzero(labels == old)
+        final[new] = np.asarray(matrix[members].mean(axis=0)).ravel()
+        top_members = members[np.argsort(-best[members], kind="stable")[:REPRESENTATIVES]]
+        clusters.append({
+            "id": new,
+            "size": int(len(members)),
+            "keywords": [words[j] for j in np.argsort(-final[new], kind="stable")[:KEYWORDS]],
+            "representatives": [names[m] for m in top_members],
+        })
+    final = _normalize_rows(final)
+
+    return {
+        "view": {"articles": len(names), "clusters": clusters, "assignments": assignments},
+        "model": {
+            "vocab": words,
+            "idf": [round(float(x), 6) for x in idf],
+            "centroids": [_top_terms(row, words) for row in final],
+            "counts": [c["size"] for c in clusters],
+        },
+    }
+
+
+def _top_terms(row: np.ndarray, words: List[str]) -> Dict[str, float]:
+    """중심점의 상위 CENTROID_TERMS개 단어 (다시 L2 정규화)"""
+    top = np.argsort(-row, kind="stable")[:CENTROID_TERMS]
+    top = top[row[top] > 0]
+    weights = row[top] / (np.linalg.norm(row[top]) or 1.0)
+    return {words[j]: round(float(w), 6) for j, w in zip(top, weights)}
+
+
+def assign_late_articles(result: dict, docs: Sequence[dict], names: Sequence[str]) -> int:
+    """
+    클러스터링 이후에 들어온 기사를 기존 클러스터에 배정 (다시 클러스터링하지 않음)
+
+    저장된 어휘 / IDF로 벡터를 만들어 가장 가까운 중심점에 배정하고, 배정된 클러스터의 중심점은
+    배정 기사 수에 반비례하는 학습률로 옮긴다 (미니배치 k-means와 같은 갱신).
+
+    Args:
+        result: cluster_articles() 결과 (load_clusters()로 읽은 것). 제자리에서 갱신됨
+        docs: 새 기사별 {명사: 출현횟수}
+        names: 새 기사 파일명
+
+    Returns:
+        int: 클러스터에 배정된 기사 수 (미분류 제외)
+    """
+    view, model = result["view"], result["model"]
+    words = model["vocab"]
+    vocab = {w: i for i, w in enumerate(words)}
+    matrix = tfidf_matrix(docs, vocab, np.asarray(model["idf"]))
+
+    centroids = np.zeros((len(model["centroids"]), len(words)))
+    for c, terms in enumerate(model["centroids"]):
+        for word, weight in terms.items():
+            centroids[c, vocab[word]] = weight
+
+    assigned = 0
+    counts = model["counts"]
+    for i, name in enumerate(names):
+        row = matrix[i]
+        similarity = np.asarray(row @ centroids.T).ravel() if row.nnz else np.zeros(len(centroids))
+        c = int(similarity.argmax()) if len(similarity) else -1
+        if c < 0 or similarity[c] < MIN_SIMILARITY:
+            view["assignments"][name] = -1
+            continue
+        counts[c] += 1
+        rate = 1.0 / counts[c]
+        centroids[c] = (1 - rate) * centroids[c] + rate * row.toarray().ravel()
+        centroids[c] /= np.linalg.norm(centroids[c]) or 1.0
+        view["assignments"][name] = c
+        view["clusters"][c]["size"] += 1
+        assigned += 1
+
+    view["articles"] = len(view["assignments"])
+    model["centroids"] = [_top_terms(row, words) for row in centroids]
+    return assigned
+
+
+def load_clusters(date_str: str, output_dir: Path = CLUSTER_DIR) -> Optional[dict]:
+    """save_clusters()로 저장한 결과 읽기 (없으면 None)"""
+    view_path = output_dir / f"{date_str}.json"
+    model_path = output_dir / f"{date_str}.model.json"
+    if not view_path.exists() or not model_path.exists():
+        return None
+    with view_path.open('r', encoding='utf-8') as f:
+        view = json.load(f)
+    with model_path.open('r', encoding='utf-8') as f:
+        model = json.load(f)
+    return {"view": view, "model": model}
+
+
+def save_clusters(date_str: str, result: dict, output_dir: Path = CLUSTER_DIR) -> Path:
+    """
+    클러스터 결과를 data/clusters/yyyymmdd.json (화면용), yyyymmdd.model.json (배정용) 으로 저장
+    (yyyymmdd.json 만 WebProgram/WebProgram/res/clusters/ 로 복사해서 사용)
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    view_path = output_dir / f"{date_str}.json"
+    for path, data in ((output_dir / f"{date_str}.model.json", result["model"]),
+                       (view_path, dict(result["view"], date=date_str))):
+        tmp_path = path.with_suffix('.json.tmp')
+        with tmp_path.open('w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        tmp_path.replace(path)
+    return view_path
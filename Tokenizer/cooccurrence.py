@@ -0,0 +1,93 @@
+import csv
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# 네트워크에 포함할 상위 명사 수 (rank CSV와 같은 기준: 빈도수 내림차순, 같으면 단어 오름차순)
+TOP_K = 100
+# 날짜별로 저장할 최대 간선 수
+MAX_EDGES = 300
+# 이 횟수보다 적게 함께 나온 쌍은 저장하지 않음
+MIN_COUNT = 2
+
+NETWORK_DIR = Path(__file__).parent / 'data' / 'network'
+
+
+def build_incidence(docs: List[Iterable[str]], vocab: dict) -> sparse.csr_matrix:
+    """
+    기사 × 단어 출현 여부 희소 행렬 (0/1)
+
+    Args:
+        docs: 기사별 명사 목록 (기사 하나에 같은 명사가 여러 번 있어도 됨)
+        vocab: {단어: 열 번호}
+
+    Returns:
+        sparse.csr_matrix: (기사 수, 단어 수) int32 행렬
+    """
+    indptr = [0]
+    indices = []
+    for doc in docs:
+        columns = {vocab[w] for w in doc if w in vocab}
+        indices.extend(columns)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(docs), len(vocab)),
+    )
+
+
+def cooccurrence_edges(
+    docs: List[Iterable[str]],
+    word_counts: dict,
+    top_k: int = TOP_K,
+    max_edges: int = MAX_EDGES,
+    min_count: int = MIN_COUNT,
+) -> List[Tuple[str, str, int]]:
+    """
+    상위 top_k개 명사 중 같은 기사에 함께 나온 쌍과 기사 수
+
+    기사 × 단어 출현 행렬 X에 대해 C = XᵀX 의 (i, j) 원소가 단어 i, j가 함께 나온 기사 수이므로,
+    희소 행렬 곱 한 번으로 모든 쌍을 센다.
+
+    Args:
+        docs: 기사별 명사 목록
+        word_counts: 하루치 {단어: 출현횟수} (상위 단어 선택용)
+        top_k: 네트워크에 포함할 상위 명사 수
+        max_edges: 반환할 최대 간선 수
+        min_count: 최소 동시 출현 기사 수
+
+    Returns:
+        List[Tuple[str, str, int]]: (순위가 높은 단어, 낮은 단어, 기사 수), 기사 수 내림차순
+    """
+    words = [w for w, _ in sorted(word_counts.items(), key=lambda x: (-x[1], x[0]))[:top_k]]
+    if len(words) < 2 or not docs:
+        return []
+    vocab = {w: i for i, w in enumerate(words)}
+
+    incidence = build_incidence(docs, vocab)
+    co = sparse.triu(incidence.T @ incidence, k=1).tocoo()
+
+    keep = co.data >= min_count
+    rows, cols, counts = co.row[keep], co.col[keep], co.data[keep]
+    # 기사 수 내림차순, 같으면 단어 순위 순 (항상 같은 순서로 저장)
+    order = np.lexsort((cols, rows, -counts))[:max_edges]
+    return [(words[rows[i]], words[cols[i]], int(counts[i])) for i in order]
+
+
+def save_network(date_str: str, edges: List[Tuple[str, str, int]], output_dir: Path = NETWORK_DIR) -> Path:
+    """
+    간선 목록을 data/network/yyyymmdd.csv 로 저장 (word_a,word_b,count, utf-8-sig)
+    (WebProgram/WebProgram/res/network/ 로 복사해서 사용)
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{date_str}.csv"
+    tmp_path = path.with_suffix('.csv.tmp')
+    with tmp_path.open('w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['word_a', 'word_b', 'count'])
+        writer.writerows(edges)
+    tmp_path.replace(path)
+    return path
@@ -0,0 +1,230 @@
+"""
+당일 실시간 키워드 순위 (1시간 / 6시간 / 24시간 이동 구간)
+
+기사를 발행 시각의 시간(hour) 버킷에 더하고, 구간별 합계를 바로 갱신한다.
+시간이 지나 버킷이 구간 밖으로 나가면 그 버킷만 합계에서 뺀다.
+기사 하나를 처리하는 비용은 기사 명사 수에 비례하며(구간마다 한 번 더하고, 나중에 한 번 뺌) 하루치를 다시 세지 않는다.
+
+구간의 기준 시각("now")은 지금까지 들어온 기사 중 가장 늦은 발행 시각의 시간이다 (벽시계가 아님).
+그래서 같은 기사를 다시 넣으면 언제 실행해도 같은 순위가 나온다.
+
+저장 (data/intraday/):
+    state.json          최근 24시간 버킷과 이미 처리한 기사 파일명 (다음 실행에서 이어서 갱신)
+    yyyymmddHH.json     시간별 순위 스냅샷 (WebProgram/WebProgram/res/intraday/ 로 복사해서 대시보드에 표시)
+"""
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+INTRADAY_DIR = Path(__file__).parent / 'data' / 'intraday'
+
+# 구간 이름 → 시간 수
+WINDOWS = {"1h": 1, "6h": 6, "24h": 24}
+# 스냅샷에 저장할 구간별 상위 단어 수
+SNAPSHOT_TOP_K = 30
+# 보관할 시간별 스냅샷 수 (7일)
+SNAPSHOT_KEEP = 24 * 7
+
+HOUR_FORMAT = "%Y%m%d%H"
+_EPOCH = datetime(2000, 1, 1)
+
+
+def hour_index(moment: datetime) -> int:
+    """시각 → 2000-01-01 00시부터의 시간 수 (시간대 정보는 무시하고 적힌 시각 그대로)"""
+    return int((moment.replace(tzinfo=None) - _EPOCH).total_seconds() // 3600)
+
+
+def hour_label(index: int) -> str:
+    """hour_index() → yyyymmddHH"""
+    return (_EPOCH + timedelta(hours=index)).strftime(HOUR_FORMAT)
+
+
+def parse_hour(label: str) -> int:
+    """yyyymmddHH → hour_index()"""
+    return hour_index(datetime.strptime(label, HOUR_FORMAT))
+
+
+def _add_into(target: Dict[str, int], counts: Dict[str, int], sign: int = 1):
+    for word, count in counts.items():
+        value = target.get(word, 0) + sign * count
+        if value:
+            target[word] = value
+        else:
+            del target[word]
+
+
+class SlidingWindowCounts:
+    """
+    시간 버킷 + 구간별 이동 합계
+
+    Args:
+        windows: {구간 이름: 시간 수}
+    """
+
+    def __init__(self, windows: Dict[str, int] = WINDOWS):
+        self.windows = dict(windows)
+        self.span = max(self.windows.values())
+        self.now: Optional[int] = None
+        # 시간 → {단어: 출현횟수}, 시간 → 기사 수
+        self.buckets: Dict[int, Dict[str, int]] = {}
+        self.bucket_articles: Dict[int, int] = {}
+        # 구간 이름 → {단어: 출현횟수}, 기사 수
+        self.totals: Dict[str, Dict[str, int]] = {name: {} for name in self.windows}
+        self.articles: Dict[str, int] = {name: 0 for name in self.windows}
+
+    def _in_window(self, hour: int, hours: int) -> bool:
+        return self.now - hours < hour <= self.now
+
+    def advance(self, hour: int):
+        """기준 시각을 hour로 옮기고, 구간 밖으로 나간 버킷만 합계에서 뺌"""
+        if self.now is not None and hour <= self.now:
+            return
+        previous = self.now
+        self.now = hour
+        if previous is None:
+            return
+        for name, hours in self.windows.items():
+            # (previous - hours, hour - hours] 사이 버킷이 구간에서 빠짐
+            for expired in range(max(previous - hours + 1, min(self.buckets, default=hour)), hour - hours + 1):
+                if expired in self.buckets:
+                    _add_into(self.totals[name], self.buckets[expired], -1)
+                    self.articles[name] -= self.bucket_articles[expired]
+        for expired in [h for h in self.buckets if h <= hour - self.span]:
+            del self.buckets[expired]
+            del self.bucket_articles[expired]
+
+    def add(self, counts: Dict[str, int], published: datetime) -> bool:
+        """
+        기사 하나의 {명사: 출현횟수}를 발행 시각 버킷과 해당 구간 합계에 더함
+
+        Returns:
+            bool: 반영했으면 True (가장 긴 구간보다 오래된 기사면 False)
+        """
+        hour = hour_index(published)
+        self.advance(hour)
+        if hour <= self.now - self.span:
+            return False
+        _add_into(self.buckets.setdefault(hour, {}), counts)
+        self.bucket_articles[hour] = self.bucket_articles.get(hour, 0) + 1
+        for name, hours in self.windows.items():
+            if self._in_window(hour, hours):
+                _add_into(self.totals[name], counts)
+                self.articles[name] += 1
+        return True
+
+    def top(self, name: str, k: int = SNAPSHOT_TOP_K) -> List[Tuple[str, int]]:
+        """구간 상위 k개 (빈도수 내림차순, 같으면 단어 오름차순)"""
+        return sorted(self.totals[name].items(), key=lambda item: (-item[1], item[0]))[:k]
+
+    def snapshot(self, k: int = SNAPSHOT_TOP_K) -> dict:
+        """현재 기준 시각의 구간별 순위"""
+        return {
+            "hour": hour_label(self.now),
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "windows": {
+                name: {"hours": hours, "articles": self.articles[name], "words": [list(item) for item in self.top(name, k)]}
+                for name, hours in self.windows.items()
+            },
+        }
+
+    def to_json(self) -> dict:
+        return {
+            "now": hour_label(self.now) if self.now is not None else None,
+            "buckets": {
+                hour_label(hour): {"articles": self.bucket_articles[hour], "counts": counts}
+                for hour, counts in sorted(self.buckets.items())
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: dict, windows: Dict[str, int] = WINDOWS) -> "SlidingWindowCounts":
+        """저장한 버킷으로 복원 (구간 합계는 버킷을 더해서 다시 계산)"""
+        sliding = cls(windows)
+        if data.get("now"):
+            sliding.now = parse_hour(data["now"])
+        for label, bucket in data.get("buckets", {}).items():
+            hour = parse_hour(label)
+            if sliding.now is None or hour <= sliding.now - sliding.span:
+                continue
+            sliding.buckets[hour] = bucket["counts"]
+            sliding.bucket_articles[hour] = bucket["articles"]
+            for name, hours in sliding.windows.items():
+                if sliding._in_window(hour, hours):
+                    _add_into(sliding.totals[name], bucket["counts"])
+                    sliding.articles[name] += bucket["articles"]
+        return sliding
+
+
+class IntradayStore:
+    """
+    data/intraday/ 의 이동 구간 상태와 시간별 스냅샷
+
+    Args:
+        store_dir: 저장 폴더
+    """
+
+    def __init__(self, store_dir: Path = INTRADAY_DIR):
+        self.store_dir = Path(store_dir)
+        self.state_file = self.store_dir / 'state.json'
+        self.seen: Dict[str, set] = {}
+        self.sliding = SlidingWindowCounts()
+        if self.state_file.exists():
+            with self.state_file.open('r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.sliding = SlidingWindowCounts.from_json(state)
+            self.seen = {date: set(names) for date, names in state.get("seen", {}).items()}
+
+    def is_new(self, date_str: str, name: str) -> bool:
+        return name not in self.seen.get(date_str, ())
+
+    def mark_seen(self, date_str: str, name: str):
+        self.seen.setdefault(date_str, set()).add(name)
+
+    def _write_json(self, path: Path, data: dict):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.json.tmp')
+        with tmp_path.open('w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        tmp_path.replace(path)
+
+    def publish_snapshot(self) -> Optional[Path]:
+        """현재 기준 시각의 순위를 yyyymmddHH.json 으로 저장 (같은 시간이면 덮어씀)"""
+        if self.sliding.now is None:
+            return None
+        snapshot = self.sliding.snapshot()
+        path = self.store_dir / f"{snapshot['hour']}.json"
+        self._write_json(path, snapshot)
+
+        snapshots = sorted(p for p in self.store_dir.glob('*.json') if len(p.stem) == 10 and p.stem.isdigit())
+        for old in snapshots[:-SNAPSHOT_KEEP]:
+            old.unlink(missing_ok=True)
+        return path
+
+    def save(self):
+        """상태 저장 (기준 시각 이틀 전보다 오래된 날짜의 처리 기록은 버림)"""
+        state = self.sliding.to_json()
+        if self.sliding.now is not None:
+            oldest = hour_label(self.sliding.now - 48)[:8]
+            self.seen = {date: names for date, names in self.seen.items() if date >= oldest}
+        state["seen"] = {date: sorted(names) for date, names in sorted(self.seen.items())}
+        self._write_json(self.state_file, state)
+
+    def ingest(self, articles: Iterable[Tuple[str, str, datetime, Dict[str, int]]]) -> int:
+        """
+        새 기사들을 발행 시각 순서로 반영하고, 기준 시각이 다음 시간으로 넘어갈 때마다 직전 시간 스냅샷 저장
+
+        Args:
+            articles: [(날짜 폴더, 기사 파일명, 발행 시각, {명사: 출현횟수})]
+
+        Returns:
+            int: 구간에 반영한 기사 수
+        """
+        added = 0
+        for date_str, name, published, counts in sorted(articles, key=lambda a: (a[2], a[0], a[1])):
+            if self.sliding.now is not None and hour_index(published) > self.sliding.now:
+                self.publish_snapshot()
+            added += self.sliding.add(counts, published)
+            self.mark_seen(date_str, name)
+        self.publish_snapshot()
+        return added
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Common"))
+from postings import INDEX_SUFFIX, write_index_file
+
+KEYWORD_INDEX_DIR = Path(__file__).parent / 'data' / 'keyword_index'
+
+
+def save_keyword_index(date_str: str, positions: Sequence[Dict[str, List[int]]], names: Sequence[str],
+                       output_dir: Path = KEYWORD_INDEX_DIR) -> Path:
+    """
+    하루치 명사 → 기사 역색인을 data/keyword_index/yyyymmdd.kidx 로 저장
+    (WebProgram/WebProgram/res/keyword_index/ 로 복사해서 사용, 형식은 Common/postings.py 참고)
+
+    Args:
+        date_str: yyyymmdd
+        positions: 기사별 {명사: [본문 안 문자 위치, ...]} (names와 같은 순서)
+        names: 기사 파일명 (기사 번호 = 이 리스트의 순서)
+
+    Returns:
+        Path: 저장한 파일 경로
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return write_index_file(output_dir / f"{date_str}{INDEX_SUFFIX}", date_str, names, positions)
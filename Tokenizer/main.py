@@ -1,54 +1,87 @@
 import os
+import sys
 from kiwipiepy import Kiwi
 from pathlib import Path
 import json
 from datetime import datetime
+from timeseries import TermTimeSeries
+from cooccurrence import cooccurrence_edges, save_network
+from clustering import assign_late_articles, cluster_articles, load_clusters, save_clusters
+from keyword_index import save_keyword_index
+from sketch import save_day_sketch
+from intraday import IntradayStore, hour_label
+from sentence_cache import SentenceNounCache
 
-def gen_word_count(kiwi: Kiwi, text: str) -> dict:    
-    # tokenize로 형태소 분석
-    tokens = kiwi.tokenize(text)
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Common"))
+import metrics
+import profiling
+from article_meta import published_at, read_metadata
+from dashboard import DETAIL_TOP, MAX_DAYS, build_dashboard, latest_rank_dates
+
+# 문장 해시 → 명사 목록 캐시 (프로세스마다 하나). 기사마다 반복되는 상용구 문장은 Kiwi를 건너뜀
+sentence_cache = SentenceNounCache()
+
+@profiling.sampled
+def gen_word_count(kiwi: Kiwi, text: str, positions: dict = None) -> dict:
+    """
+    기사 본문의 {명사: 출현횟수}
+
+    positions가 주어지면 {명사: [본문 안 문자 위치, ...]} 를 채움 (명사 → 기사 역색인용)
+    """
+    hits, misses = sentence_cache.hits, sentence_cache.misses
+    tokens, kiwi_seconds = sentence_cache.tokens, sentence_cache.miss_seconds
+    
+    # 문장 단위로 나눠 처음 보는 문장만 형태소 분석 (2음절 이상 명사만 남김)
+    with metrics.span("tokenize"):
+        sentences = sentence_cache.analyze(kiwi, text)
+    metrics.inc("kiwi_tokens_total", sentence_cache.tokens - tokens)
+    metrics.inc("kiwi_seconds_total", sentence_cache.miss_seconds - kiwi_seconds)
+    metrics.inc("sentence_cache_hits_total", sentence_cache.hits - hits)
+    metrics.inc("sentence_cache_misses_total", sentence_cache.misses - misses)
     
     # 명사 카운트를 저장할 딕셔너리
     noun_counts = {}
-    
-    # 각 토큰에 대해 명사인 경우만 카운트
-    for token in tokens:
-        # 품사가 N으로 시작하면 명사
-        if token.tag.startswith('N'):
-            noun = token.form
-            # 2음절 이상인 명사만 카운트 (한글 한 글자는 보통 1음절)
-            if len(noun) >= 2:
-                noun_counts[noun] = noun_counts.get(noun, 0) + 1
+    for start, nouns, offsets in sentences:
+        for noun in nouns:
+            noun_counts[noun] = noun_counts.get(noun, 0) + 1
+        if positions is not None:
+            for noun, offset in zip(nouns, offsets):
+                positions.setdefault(noun, []).append(start + offset)
     
     return noun_counts
 
-# 주어진 폴더 내 모든 텍스트 파일의 워드 카운트를 생성
-# data_dir: 텍스트 파일이 들어있는 경로. yymmdd 형식의 폴더.
-# 이 폴더 내 여러 텍스트 파일을 모두 처리함.
-def word_count_for_folder(data_dir: Path) -> dict:
+def word_count_for_files(kiwi: Kiwi, files: list, docs: list = None, positions: list = None) -> dict:
     """
-    폴더 내 모든 텍스트 파일의 통합 워드 카운트를 생성
+    텍스트 파일들의 통합 워드 카운트를 생성 (주어진 파일 순서대로 병합)
 
     Args:
-        data_dir (Path): 텍스트 파일들이 있는 폴더 경로
+        kiwi (Kiwi): 형태소 분석기
+        files (list): 텍스트 파일 경로 리스트
+        docs (list): 주어지면 기사별 {명사: 출현횟수}를 files와 같은 순서로 추가
+            (동시 출현 네트워크 / 클러스터링용, 읽지 못한 파일은 빈 딕셔너리)
+        positions (list): 주어지면 기사별 {명사: [본문 안 문자 위치, ...]}를 files와 같은 순서로 추가
+            (명사 → 기사 역색인용, 읽지 못한 파일은 빈 딕셔너리)
 
     Returns:
         dict: 통합된 {단어: 출현횟수} 딕셔너리
     """
-    # Kiwi 초기화
-    kiwi = Kiwi()
-    
     # 통합 워드 카운트 딕셔너리
     merged_counts = {}
     
-    # 폴더 내 모든 .txt 파일 처리
-    for txt_file in data_dir.glob('*.txt'):
+    for txt_file in files:
         try:
             # 파일 읽기
-            text = txt_file.read_text(encoding='utf-8')
+            text = Path(txt_file).read_text(encoding='utf-8')
+            metrics.inc("articles_total")
             
             # 현재 파일의 워드 카운트 추출
-            current_counts = gen_word_count(kiwi, text)
+            current_positions = {} if positions is not None else None
+            current_counts = gen_word_count(kiwi, text, current_positions)
+            if docs is not None:
+                docs.append(current_counts)
+            if positions is not None:
+                positions.append(current_positions)
             
             # 현재 파일의 카운트를 통합 딕셔너리에 병합
             for word, count in current_counts.items():
@@ -56,10 +89,180 @@ def word_count_for_folder(data_dir: Path) -> dict:
                 
         except Exception as e:
             print(f"Error processing {txt_file}: {e}")
+            if docs is not None:
+                docs.append({})
+            if positions is not None:
+                positions.append({})
             continue
     
     return merged_counts
 
+# 주어진 폴더 내 모든 텍스트 파일의 워드 카운트를 생성
+# data_dir: 텍스트 파일이 들어있는 경로. yymmdd 형식의 폴더.
+# 이 폴더 내 여러 텍스트 파일을 모두 처리함.
+def word_count_for_folder(data_dir: Path, docs: list = None, names: list = None, positions: list = None) -> dict:
+    """
+    폴더 내 모든 텍스트 파일의 통합 워드 카운트를 생성
+
+    Args:
+        data_dir (Path): 텍스트 파일들이 있는 폴더 경로
+        docs (list): 주어지면 기사별 {명사: 출현횟수}를 추가 (동시 출현 네트워크 / 클러스터링용)
+        names (list): 주어지면 docs와 같은 순서로 기사 파일명을 추가
+        positions (list): 주어지면 기사별 {명사: [본문 안 문자 위치, ...]}를 추가 (역색인용)
+
+    Returns:
+        dict: 통합된 {단어: 출현횟수} 딕셔너리
+    """
+    # 파일명 순으로 처리 (병렬 실행과 결과 / 단어 순서를 맞추기 위해)
+    files = sorted(data_dir.glob('*.txt'))
+    if names is not None:
+        names.extend(f.name for f in files)
+    return word_count_for_files(Kiwi(), files, docs, positions)
+
+# 병렬 실행 시 워커 프로세스마다 하나씩 만드는 Kiwi
+_worker_kiwi = None
+
+def _init_worker():
+    global _worker_kiwi
+    _worker_kiwi = Kiwi()
+
+# 워커 프로세스에서 부모 프로세스로 옮겨 합치는 카운터
+WORKER_COUNTERS = (
+    "articles_total",
+    "kiwi_tokens_total",
+    "kiwi_seconds_total",
+    "sentence_cache_hits_total",
+    "sentence_cache_misses_total",
+)
+
+def count_files_in_worker(files: list) -> tuple:
+    """
+    워커 프로세스에서 파일 묶음의 워드 카운트 생성
+
+    Returns:
+        tuple: ({단어: 출현횟수}, 기사별 {명사: 출현횟수}, 기사별 {명사: [위치, ...]},
+            {카운터: 증가량}, 형태소 분석 시간(초))
+    """
+    before = {name: metrics.counter_total(name) for name in WORKER_COUNTERS}
+    _, seconds = metrics.span_total("tokenize")
+    docs = []
+    positions = []
+    counts = word_count_for_files(_worker_kiwi, files, docs, positions)
+    deltas = {name: metrics.counter_total(name) - before[name] for name in WORKER_COUNTERS}
+    return counts, docs, positions, deltas, metrics.span_total("tokenize")[1] - seconds
+
+def plan_folder_jobs(folders: list, split_bytes: int = 0) -> tuple:
+    """
+    날짜 폴더들을 병렬 작업으로 나누고 큰 작업부터 정렬 (LPT 스케줄링)
+
+    큰 날짜를 먼저 시작해야 작은 날짜들이 남은 코어를 채우면서 마지막에 큰 날짜 하나만
+    남아 기다리는 일이 줄어든다.
+
+    Args:
+        folders (list): 날짜 폴더 리스트
+        split_bytes (int): 0보다 크면 한 날짜를 파일명 순서대로 약 이 크기씩 나눔 (기사 단위 병렬)
+
+    Returns:
+        tuple: ([(날짜, 묶음 번호, 파일 리스트, 바이트 수)], {날짜: 묶음 수})
+    """
+    jobs = []
+    chunk_counts = {}
+    for sub in folders:
+        chunks = [[]]
+        chunk_sizes = [0]
+        for txt_file in sorted(sub.glob('*.txt')):
+            size = txt_file.stat().st_size
+            if split_bytes > 0 and chunks[-1] and chunk_sizes[-1] + size > split_bytes:
+                chunks.append([])
+                chunk_sizes.append(0)
+            chunks[-1].append(str(txt_file))
+            chunk_sizes[-1] += size
+        chunk_counts[sub.name] = len(chunks)
+        for idx, (chunk, size) in enumerate(zip(chunks, chunk_sizes)):
+            jobs.append((sub.name, idx, chunk, size))
+    jobs.sort(key=lambda job: (-job[3], job[0], job[1]))
+    return jobs, chunk_counts
+
+def iter_folder_counts(folders: list, workers: int = 1, split_bytes: int = 0):
+    """
+    날짜 폴더별 워드 카운트를 날짜 순서대로 생성
+
+    workers가 2 이상이면 프로세스 풀에서 병렬로 계산하되, 결과는 앞 날짜가 모두 끝난 순서대로
+    내보내고 묶음은 파일명 순서대로 병합하므로 순차 실행과 같은 결과(단어 순서 포함)가 나온다.
+
+    Args:
+        folders (list): 날짜 폴더 리스트 (날짜 오름차순)
+        workers (int): 프로세스 수 (1 이하면 순차 실행)
+        split_bytes (int): 한 날짜를 나눌 크기 (plan_folder_jobs 참고)
+
+    Returns:
+        Iterator: (폴더, {단어: 출현횟수} 또는 오류 시 None, 기사별 {명사: 출현횟수}, 기사 파일명,
+            기사별 {명사: [본문 안 문자 위치, ...]})
+    """
+    if workers <= 1:
+        for sub in folders:
+            print(f"Processing date folder: {sub.name}")
+            docs = []
+            names = []
+            positions = []
+            try:
+                with metrics.span("folder"):
+                    merged_counts = word_count_for_folder(sub, docs, names, positions)
+            except Exception as e:
+                print(f"Error counting words in {sub}: {e}")
+                merged_counts = None
+            yield sub, merged_counts, docs, names, positions
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    jobs, chunk_counts = plan_folder_jobs(folders, split_bytes)
+    print(f"Processing {len(folders)} date folders in {len(jobs)} jobs with {workers} workers")
+
+    results = {sub.name: {} for sub in folders}
+    chunk_names = {(data_str, idx): [Path(f).name for f in files] for data_str, idx, files, _ in jobs}
+    failed = set()
+    next_index = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(count_files_in_worker, files): (data_str, idx) for data_str, idx, files, _ in jobs}
+        for future in as_completed(futures):
+            data_str, idx = futures[future]
+            try:
+                counts, docs, positions, deltas, seconds = future.result()
+                results[data_str][idx] = (counts, docs, positions)
+                for name, value in deltas.items():
+                    metrics.inc(name, value)
+                metrics.observe("tokenize_seconds", seconds)
+            except Exception as e:
+                print(f"Error counting words in {data_str} (chunk {idx}): {e}")
+                failed.add(data_str)
+                results[data_str][idx] = None
+
+            # 앞 날짜부터 모든 묶음이 끝난 날짜를 차례로 내보냄
+            while next_index < len(folders):
+                sub = folders[next_index]
+                chunks = results[sub.name]
+                if len(chunks) < chunk_counts[sub.name]:
+                    break
+                next_index += 1
+                if sub.name in failed:
+                    yield sub, None, [], [], []
+                    continue
+                merged_counts = {}
+                merged_docs = []
+                merged_names = []
+                merged_positions = []
+                for i in range(chunk_counts[sub.name]):
+                    counts, docs, positions = chunks[i]
+                    for word, count in counts.items():
+                        merged_counts[word] = merged_counts.get(word, 0) + count
+                    merged_docs.extend(docs)
+                    merged_names.extend(chunk_names[(sub.name, i)])
+                    merged_positions.extend(positions)
+                print(f"Processed date folder: {sub.name}")
+                yield sub, merged_counts, merged_docs, merged_names, merged_positions
+                del results[sub.name]
+
 # 딕셔너리를 받아서 파일로 저장하는 함수
 # data_str: 날짜 문자열 (yymmdd 형식)
 # word_dic: 단어 카운트 딕셔너리
@@ -85,16 +288,162 @@ def save_word_count_to_file(data_str: str, word_dic: dict, max_rank: int = None)
     if isinstance(max_rank, int) and max_rank > 0:
         items = items[:max_rank]
 
-    with path.open('w', encoding='utf-8-sig', newline='') as f:
+    # 임시 파일에 쓴 뒤 교체 (중간에 중단돼도 읽는 쪽에 반쯤 쓴 CSV가 보이지 않도록)
+    tmp_path = path.with_suffix('.csv.tmp')
+    with tmp_path.open('w', encoding='utf-8-sig', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['word', 'count'])
         for word, count in items:
             writer.writerow([word, count])
+    tmp_path.replace(path)
+    metrics.inc("files_written_total", kind="csv")
 
     return path
 
+def build_dashboard_artifact(rank_dir: Path, max_days: int = MAX_DAYS, top_k: int = DETAIL_TOP) -> dict:
+    """
+    rank CSV들로부터 대시보드용 사전 계산 데이터를 생성
+
+    Args:
+        rank_dir: yyyymmdd.csv 파일들이 있는 폴더
+        max_days: 포함할 최신 날짜 수 (기본값: 7)
+        top_k: 날짜별로 보관할 상위 단어 수 (기본값: 30, 상세 페이지 기준)
+
+    Returns:
+        dict: Common/dashboard.py build_dashboard() 구조 + "version", "generated_at"
+    """
+    import csv
+
+    # 날짜별 상위 top_k개 (단어, 빈도수)
+    top_by_date = {}
+    for date in latest_rank_dates(rank_dir, max_days):
+        rows = []
+        with (rank_dir / f"{date}.csv").open('r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # 헤더 건너뛰기
+            for row in reader:
+                if len(rows) >= top_k:
+                    break
+                if row and len(row) >= 2:
+                    rows.append((row[0], int(row[1])))
+        top_by_date[date] = rows
+
+    artifact = {
+        "version": 1,
+        "generated_at": datetime.now().isoformat(timespec='seconds'),
+    }
+    artifact.update(build_dashboard(top_by_date))
+    return artifact
+
+def save_dashboard_artifact(max_days: int = MAX_DAYS, top_k: int = DETAIL_TOP) -> Path:
+    """
+    Tokenizer/data 의 CSV들로 대시보드 데이터를 만들어 data/dashboard.json 으로 저장
+    (WebProgram/WebProgram/res/dashboard.json 으로 복사해서 사용)
+    """
+    output_dir = Path(__file__).parent / 'data'
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    artifact = build_dashboard_artifact(output_dir, max_days, top_k)
+
+    path = output_dir / 'dashboard.json'
+    tmp_path = path.with_suffix('.json.tmp')
+    with tmp_path.open('w', encoding='utf-8') as f:
+        json.dump(artifact, f, ensure_ascii=False, separators=(',', ':'))
+    tmp_path.replace(path)
+    metrics.inc("files_written_total", kind="dashboard")
+
+    return path
+
+def assign_late_for_date(date_dir: Path, data_str: str) -> int:
+    """
+    날짜 폴더에서 클러스터 결과에 없는 기사만 분석해서 기존 클러스터에 배정하고 저장
+
+    Returns:
+        int: 새로 배정한 기사 수 (미분류 포함)
+    """
+    result = load_clusters(data_str)
+    if result is None:
+        print(f"No clusters for {data_str}, run the full tokenizer first.")
+        return 0
+    known = result["view"]["assignments"]
+    files = [f for f in sorted(date_dir.glob('*.txt')) if f.name not in known]
+    if not files:
+        print(f"No late articles for {data_str}")
+        return 0
+
+    docs = []
+    with metrics.span("folder"):
+        word_count_for_files(Kiwi(), files, docs)
+    with metrics.span("clustering"):
+        assigned = assign_late_articles(result, docs, [f.name for f in files])
+    save_clusters(data_str, result)
+    metrics.inc("files_written_total", kind="clusters")
+    print(f"Assigned {assigned} / {len(files)} late articles to clusters for {data_str}")
+    return len(files)
+
+# 실시간 순위에서 새 기사를 찾을 최근 날짜 폴더 수 (24시간 구간이 이틀에 걸칠 수 있으므로 2)
+INTRADAY_FOLDERS = 2
+
+def article_published_at(path: Path, metadata: dict = None) -> datetime:
+    """기사 발행 시각 (Downloader가 metadata.jsonl 에 기록한 값, 없으면 저장(다운로드) 시각으로 대신함)"""
+    return published_at((metadata or {}).get(path.name)) or datetime.fromtimestamp(path.stat().st_mtime)
+
+def run_intraday(article_dir: Path, store: IntradayStore, kiwi: Kiwi) -> int:
+    """
+    최근 날짜 폴더에서 아직 반영하지 않은 기사만 분석해서 1h/6h/24h 이동 구간 순위를 갱신하고 저장
+
+    Returns:
+        int: 구간에 반영한 기사 수
+    """
+    folders = [
+        sub for sub in sorted(article_dir.iterdir())
+        if sub.is_dir() and len(sub.name) == 8 and sub.name.isdigit()
+    ][-INTRADAY_FOLDERS:]
+    new_files = [
+        (sub.name, txt_file) for sub in folders for txt_file in sorted(sub.glob('*.txt'))
+        if store.is_new(sub.name, txt_file.name)
+    ]
+    if not new_files:
+        print("No new articles for intraday ranking")
+        return 0
+
+    # 날짜 폴더마다 metadata.jsonl 한 번만 읽음 (기사 페이지를 다시 받지 않음)
+    metadata = {sub.name: read_metadata(sub) for sub in folders}
+    articles = []
+    with metrics.span("intraday"):
+        for date_str, txt_file in new_files:
+            try:
+                text = txt_file.read_text(encoding='utf-8')
+                metrics.inc("articles_total")
+                published = article_published_at(txt_file, metadata[date_str])
+                articles.append((date_str, txt_file.name, published, gen_word_count(kiwi, text)))
+            except Exception as e:
+                print(f"Error processing {txt_file}: {e}")
+        added = store.ingest(articles)
+        store.save()
+    metrics.inc("files_written_total", kind="intraday")
+    if store.sliding.now is not None:
+        windows = ", ".join(f"{name}: {n}" for name, n in store.sliding.articles.items())
+        print(f"Intraday ranking updated with {added} / {len(new_files)} new articles "
+              f"as of {hour_label(store.sliding.now)} ({windows} articles)")
+    return added
+
 def main():
-    import sys
+    import argparse
+
+    metrics.configure("tokenizer")
+
+    parser = argparse.ArgumentParser(description="날짜별 명사 빈도수 CSV 생성")
+    parser.add_argument("--workers", type=int, default=1, help="날짜 폴더를 병렬 처리할 프로세스 수 (기본: 1, 순차)")
+    parser.add_argument("--split-bytes", type=int, default=0,
+                        help="병렬 실행 시 한 날짜를 약 이 크기(바이트)씩 나눠 기사 단위로도 분산 (기본: 0, 나누지 않음)")
+    parser.add_argument("--assign-late", metavar="YYYYMMDD", nargs="+",
+                        help="클러스터링 이후에 추가된 기사만 분석해서 기존 클러스터에 배정 (날짜 전체를 다시 세지 않음)")
+    parser.add_argument("--intraday", action="store_true",
+                        help="새 기사만 분석해서 1h/6h/24h 이동 구간 순위 갱신 (data/intraday/)")
+    parser.add_argument("--watch", type=int, default=0, metavar="SECONDS",
+                        help="--intraday를 이 간격(초)마다 반복 (기본: 0, 한 번만)")
+    args, _ = parser.parse_known_args()
 
     max_rank = 30   
 
@@ -104,22 +453,39 @@ def main():
         print(f"Article data dir not found: {article_dir}")
         return
 
-    # 2. 소스폴더 내 모든 폴더 순회 (폴더명은 yyyymmdd 형식)
-    for sub in sorted(article_dir.iterdir()):
-        if not sub.is_dir():
-            continue
-        data_str = sub.name
-        # 폴더명이 yyyymmdd 형식이 아니면 건너뜀
-        if not (len(data_str) == 8 and data_str.isdigit()):
-            continue
+    if args.assign_late:
+        for data_str in args.assign_late:
+            assign_late_for_date(article_dir / data_str, data_str)
+        metrics.report()
+        return
 
-        print(f"Processing date folder: {data_str}")
+    if args.intraday:
+        import time
 
-        # 3. 각 폴더별로 word_count_for_folder 실행하고 CSV로 저장
-        try:
-            merged_counts = word_count_for_folder(sub)
-        except Exception as e:
-            print(f"Error counting words in {sub}: {e}")
+        # 이동 구간 상태는 프로세스 안에 유지하므로, 반복 실행 중에는 새 기사 분석 비용만 듦
+        store = IntradayStore()
+        kiwi = Kiwi()
+        while True:
+            run_intraday(article_dir, store, kiwi)
+            if args.watch <= 0:
+                break
+            time.sleep(args.watch)
+        metrics.report()
+        return
+
+    # 날짜별 전체 단어 카운트를 누적하는 시계열 저장소 (data/timeseries)
+    timeseries = TermTimeSeries()
+
+    # 2. 소스폴더 내 모든 폴더 (폴더명은 yyyymmdd 형식, 아니면 건너뜀)
+    folders = [
+        sub for sub in sorted(article_dir.iterdir())
+        if sub.is_dir() and len(sub.name) == 8 and sub.name.isdigit()
+    ]
+
+    # 3. 각 폴더별 워드 카운트를 날짜 순서대로 받아 CSV로 저장
+    for sub, merged_counts, docs, names, positions in iter_folder_counts(folders, args.workers, args.split_bytes):
+        data_str = sub.name
+        if merged_counts is None:
             continue
 
         if not merged_counts:
@@ -132,5 +498,70 @@ def main():
         except Exception as e:
             print(f"Error saving CSV for {data_str}: {e}")
 
+        try:
+            timeseries.add_day(data_str, merged_counts)
+        except Exception as e:
+            print(f"Error updating time series for {data_str}: {e}")
+
+        # 고정 크기 상위 키워드 스케치 (data/sketch/yyyymmdd.npz, 기간 조회 시 병합: python sketch.py)
+        try:
+            with metrics.span("sketch"):
+                save_day_sketch(data_str, merged_counts)
+            metrics.inc("files_written_total", kind="sketch")
+        except Exception as e:
+            print(f"Error saving keyword sketch for {data_str}: {e}")
+
+        # 상위 명사들의 기사 단위 동시 출현 네트워크 (data/network/yyyymmdd.csv)
+        try:
+            with metrics.span("cooccurrence"):
+                edges = cooccurrence_edges(docs, merged_counts)
+            network_path = save_network(data_str, edges)
+            metrics.inc("files_written_total", kind="network")
+            print(f"Saved {len(edges)} co-occurrence edges to: {network_path}")
+        except Exception as e:
+            print(f"Error saving co-occurrence network for {data_str}: {e}")
+
+        # 기사 이야기(사건) 클러스터 (data/clusters/yyyymmdd.json)
+        try:
+            with metrics.span("clustering"):
+                clusters = cluster_articles(docs, names)
+            if clusters:
+                cluster_path = save_clusters(data_str, clusters)
+                metrics.inc("files_written_total", kind="clusters")
+                print(f"Saved {len(clusters['view']['clusters'])} article clusters to: {cluster_path}")
+        except Exception as e:
+            print(f"Error clustering articles for {data_str}: {e}")
+
+        # 명사 → 기사 / 출현 위치 역색인 (data/keyword_index/yyyymmdd.kidx)
+        try:
+            with metrics.span("keyword_index"):
+                index_path = save_keyword_index(data_str, positions, names)
+            metrics.inc("files_written_total", kind="keyword_index")
+            print(f"Saved keyword index ({index_path.stat().st_size:,} bytes) to: {index_path}")
+        except Exception as e:
+            print(f"Error saving keyword index for {data_str}: {e}")
+
+    # 4. 대시보드용 사전 계산 데이터 저장
+    try:
+        dashboard_path = save_dashboard_artifact()
+        print(f"Saved dashboard artifact to: {dashboard_path}")
+    except Exception as e:
+        print(f"Error saving dashboard artifact: {e}")
+
+    # Kiwi 처리량 (토큰/초)
+    _, tokenize_seconds = metrics.span_total("tokenize")
+    if tokenize_seconds:
+        print(f"Kiwi throughput: {metrics.counter_total('kiwi_tokens_total') / tokenize_seconds:,.0f} tokens/s")
+
+    # 문장 캐시 적중률과 절약한 시간 (적중 수 × 처음 보는 문장의 평균 분석 시간)
+    hits = metrics.counter_total("sentence_cache_hits_total")
+    misses = metrics.counter_total("sentence_cache_misses_total")
+    if hits + misses:
+        saved = hits * metrics.counter_total("kiwi_seconds_total") / misses if misses else 0.0
+        print(f"Sentence cache: {hits / (hits + misses):.1%} hit rate "
+              f"({hits:,.0f} / {hits + misses:,.0f} sentences), ~{saved:.1f}s Kiwi time saved")
+    metrics.report()
+
 if __name__ == "__main__":
-    main()
+    # --profile {cprofile,sample,tracemalloc} 지정 시 profiles/ 에 결과 저장
+    profiling.run_main(main, Path(__file__).resolve().parent)
@@ -0,0 +1,122 @@
+import re
+import time
+from collections import OrderedDict
+from typing import List, Tuple
+
+# 캐시에 보관할 최대 문장 수 (넘치면 가장 오래 쓰이지 않은 문장부터 제거)
+SENTENCE_CACHE_SIZE = 200_000
+
+# 줄바꿈, 또는 문장 부호 뒤의 공백에서 문장을 나눔
+SENTENCE_SPLIT = re.compile(r'\n+|(?<=[.!?。])\s+')
+
+
+def split_sentences(text: str) -> List[str]:
+    """텍스트를 문장 단위로 나눔 (앞뒤 공백 제거, 빈 문장 제외)"""
+    return [s for _, s in split_sentence_spans(text)]
+
+
+def split_sentence_spans(text: str) -> List[Tuple[int, str]]:
+    """split_sentences()와 같은 문장을 (본문 안 시작 위치, 문장) 으로"""
+    spans = []
+    position = 0
+    for match in SENTENCE_SPLIT.finditer(text + "\n"):
+        part = text[position:match.start()]
+        sentence = part.strip()
+        if sentence:
+            spans.append((position + len(part) - len(part.lstrip()), sentence))
+        position = match.end()
+    return spans
+
+
+def sentence_nouns(tokens) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """형태소 분석 결과에서 2음절 이상 명사와 문장 안 시작 위치 (등장 순서대로)"""
+    nouns = [t for t in tokens if t.tag.startswith('N') and len(t.form) >= 2]
+    return tuple(t.form for t in nouns), tuple(t.start for t in nouns)
+
+
+class SentenceNounCache:
+    """
+    문장 해시 → (명사 목록, 문장 안 명사 위치) LRU 캐시
+
+    네이버 기사 본문에는 기자 바이라인, "무단전재 및 재배포 금지", 사진 설명, 언론사 꼬리말처럼
+    기사마다 반복되는 문장이 많다. 문장 단위로 나눠서 이미 분석한 문장은 Kiwi를 건너뛰고,
+    처음 보는 문장만 모아서 한 번에 분석한다.
+
+    문장마다 따로 분석하므로 결과는 캐시 적중 여부와 관계없이 같다.
+
+    Args:
+        max_size: 최대 문장 수 (0이면 캐시하지 않음)
+    """
+
+    def __init__(self, max_size: int = SENTENCE_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries: "OrderedDict[int, Tuple[Tuple[str, ...], Tuple[int, ...]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.tokens = 0
+        self.miss_seconds = 0.0
+
+    def nouns(self, kiwi, text: str) -> List[Tuple[str, ...]]:
+        """
+        텍스트의 문장별 명사 목록
+
+        Args:
+            kiwi: Kiwi 인스턴스
+            text: 기사 본문
+
+        Returns:
+            List[Tuple[str, ...]]: 문장 순서대로의 명사 튜플 리스트
+        """
+        return [nouns for _, nouns, _ in self.analyze(kiwi, text)]
+
+    def analyze(self, kiwi, text: str) -> List[Tuple[int, Tuple[str, ...], Tuple[int, ...]]]:
+        """
+        텍스트의 문장별 명사와 위치
+
+        Returns:
+            List[Tuple[int, Tuple[str, ...], Tuple[int, ...]]]: 문장 순서대로의
+                (본문 안 문장 시작 위치, 명사 튜플, 문장 안 명사 시작 위치 튜플)
+        """
+        spans = split_sentence_spans(text)
+        sentences = [sentence for _, sentence in spans]
+        keys = [hash(s) for s in sentences]
+
+        # 캐시에 없는 문장만 (같은 기사 안의 중복도 한 번만) 모아서 한 번에 분석
+        missing = {}
+        for key, sentence in zip(keys, sentences):
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            elif key in missing:
+                self.hits += 1
+            else:
+                missing[key] = sentence
+                self.misses += 1
+
+        analyzed = {}
+        if missing:
+            started = time.perf_counter()
+            for key, tokens in zip(missing, kiwi.tokenize(list(missing.values()))):
+                analyzed[key] = sentence_nouns(tokens)
+                self.tokens += len(tokens)
+            self.miss_seconds += time.perf_counter() - started
+
+        result = [
+            (start,) + (analyzed[key] if key in analyzed else self.entries[key])
+            for (start, _), key in zip(spans, keys)
+        ]
+
+        if self.max_size > 0:
+            for key, entry in analyzed.items():
+                self.entries[key] = entry
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        return result
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def saved_seconds(self) -> float:
+        """적중한 문장을 분석했다면 걸렸을 시간 추정 (처음 보는 문장의 평균 분석 시간 × 적중 수)"""
+        return self.hits * self.miss_seconds / self.misses if self.misses else 0.0
@@ -0,0 +1,323 @@
+"""
+고정 메모리 근사 상위 키워드 (Space-Saving + Count-Min Sketch)
+
+날짜별 정확한 {단어: 출현횟수} 딕셔너리는 어휘 수만큼 커지고, 기간이 길어지면 어휘 × 날짜만큼 커진다.
+스케치는 크기가 설정값으로 고정되어 있고, 날짜 / 샤드별 스케치를 더해서(merge) 임의 기간의 상위 키워드와
+단어 빈도를 근사로 답한다.
+
+    Count-Min Sketch   depth × width 카운터 표. 빈도 추정은 항상 실제보다 크거나 같고,
+                       확률 1 - delta 이상으로 오차가 epsilon × 전체 출현 수 이하 (width = e/epsilon, depth = ln(1/delta))
+    Space-Saving       최대 capacity개 단어만 추적하는 상위 단어 후보. 빈도가 전체의 1/capacity를 넘는 단어는 반드시 포함
+                       (Agarwal et al. "Mergeable Summaries" 방식으로 병합)
+
+사용 예:
+    python sketch.py --start 20251001 --end 20251031 --top 30   data/sketch/ 날짜별 스케치를 병합해서 상위 30개 출력
+"""
+import json
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SKETCH_DIR = Path(__file__).parent / 'data' / 'sketch'
+
+# 추적할 상위 단어 후보 수 (Space-Saving)
+SKETCH_CAPACITY = 2000
+# 빈도 추정 오차 (전체 출현 수 대비)와 그 오차를 넘을 확률 (Count-Min Sketch)
+SKETCH_EPSILON = 2e-4
+SKETCH_DELTA = 0.01
+# 해시 시드 (병합하려면 같아야 함)
+SKETCH_SEED = 0
+
+
+# 다항식 해시 곱수 (홀수)
+HASH_MULTIPLIER = 0x100000001B3
+
+
+def word_hashes(words: Sequence[str], seed: int = SKETCH_SEED) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    단어별 64비트 해시를 두 개의 32비트 해시로
+
+    프로세스와 관계없이 같은 값이어야 병합할 수 있으므로 hash() 대신 UTF-8 바이트의 다항식 해시
+    (mod 2^64)에 splitmix64 마무리를 붙여 쓴다. 모든 단어를 배열 연산 한 번으로 계산한다.
+    """
+    # 단어 끝 표시로 UTF-8에 나오지 않는 0xFF를 붙여 빈 문자열도 길이가 1 이상이 되게 함
+    encoded = [w.encode('utf-8') + b"\xff" for w in words]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    starts = np.cumsum(lengths) - lengths
+
+    # 바이트마다 곱수^(단어 끝까지 남은 거리)
+    powers = np.cumprod(np.full(int(lengths.max()), HASH_MULTIPLIER, dtype=np.uint64))
+    powers = np.concatenate(([np.uint64(1)], powers[:-1]))
+    distance = np.repeat(starts + lengths - 1, lengths) - np.arange(len(data))
+    h = np.add.reduceat(data * powers[distance], starts) ^ np.uint64(seed)
+
+    h = h + np.uint64(0x9E3779B97F4A7C15)
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    h = h ^ (h >> np.uint64(31))
+    return h & np.uint64(0xFFFFFFFF), h >> np.uint64(32)
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch (행마다 h1 + i × h2 이중 해싱으로 열 선택)
+
+    Args:
+        width: 행당 카운터 수
+        depth: 행 수
+        seed: 해시 시드
+    """
+
+    def __init__(self, width: int, depth: int, seed: int = SKETCH_SEED):
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon: float = SKETCH_EPSILON, delta: float = SKETCH_DELTA,
+                   seed: int = SKETCH_SEED) -> "CountMinSketch":
+        """오차 epsilon × 전체 출현 수를 확률 1 - delta로 보장하는 크기"""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), seed)
+
+    def _columns(self, words: Sequence[str]) -> np.ndarray:
+        """(depth, 단어 수) 열 번호"""
+        h1, h2 = word_hashes(words, self.seed)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((h1[None, :] + rows * h2[None, :]) % np.uint64(self.width)).astype(np.int64)
+
+    def add(self, counts: Dict[str, int]):
+        """{단어: 출현횟수} 일괄 추가"""
+        if not counts:
+            return
+        words = list(counts)
+        values = np.fromiter(counts.values(), dtype=np.int64, count=len(words))
+        for row, columns in enumerate(self._columns(words)):
+            self.table[row] += np.bincount(columns, weights=values, minlength=self.width).astype(np.int64)
+        self.total += int(values.sum())
+
+    def estimate(self, words: Sequence[str]) -> np.ndarray:
+        """단어별 빈도 추정 (실제보다 작지 않음)"""
+        if not len(words):
+            return np.zeros(0, dtype=np.int64)
+        columns = self._columns(words)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def error_bound(self) -> float:
+        """확률 1 - delta로 보장되는 추정 오차 상한 (e / width × 전체 출현 수)"""
+        return math.e / self.width * self.total
+
+    def merge(self, other: "CountMinSketch"):
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Count-Min Sketch 크기 / 시드가 달라 병합할 수 없습니다.")
+        self.table += other.table
+        self.total += other.total
+
+
+class SpaceSaving:
+    """
+    가중치 Space-Saving 상위 단어 요약
+
+    추적 중인 단어의 count는 실제 빈도 이상이고, count - error는 실제 빈도 이하다.
+    단어 묶음을 넣을 때는 그 묶음을 정확한 요약으로 보고 병합하므로, 단어 하나씩 최솟값을 교체하는
+    원래 방식과 같은 오차 보장(전체 출현 수 / capacity)을 묶음 크기에 비례하는 비용으로 얻는다.
+
+    Args:
+        capacity: 최대 추적 단어 수
+    """
+
+    def __init__(self, capacity: int = SKETCH_CAPACITY):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def min_count(self) -> int:
+        """추적하지 않는 단어 빈도의 상한 (가득 차지 않았으면 0)"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def add(self, counts: Dict[str, int]):
+        """{단어: 출현횟수} 일괄 추가"""
+        self._merge(counts, {}, 0)
+
+    def merge(self, other: "SpaceSaving"):
+        """
+        두 요약 병합: 한쪽에만 있는 단어는 다른 쪽의 min_count를 빈도와 오차에 더한 뒤 상위 capacity개만 남김
+        """
+        self._merge(other.counts, other.errors, other.min_count())
+
+    def _merge(self, counts: Dict[str, int], errors: Dict[str, int], floor_other: int):
+        floor_self = self.min_count()
+        merged, merged_errors = {}, {}
+        for word, count in self.counts.items():
+            if word not in counts:
+                merged[word] = count + floor_other
+                merged_errors[word] = self.errors[word] + floor_other
+        for word, count in counts.items():
+            merged[word] = self.counts.get(word, floor_self) + count
+            merged_errors[word] = self.errors.get(word, floor_self) + errors.get(word, 0)
+
+        if len(merged) > self.capacity:
+            # 빈도 내림차순, 같으면 단어 오름차순 (넣은 순서와 관계없이 같은 결과)
+            kept = sorted(merged, key=lambda w: (-merged[w], w))[:self.capacity]
+            merged = {w: merged[w] for w in kept}
+        self.counts = merged
+        self.errors = {w: merged_errors[w] for w in merged}
+
+
+class KeywordSketch:
+    """
+    고정 메모리 키워드 빈도 요약 (Space-Saving 후보 + Count-Min Sketch 빈도)
+
+    Args:
+        capacity: Space-Saving 후보 수
+        epsilon: Count-Min Sketch 오차 (전체 출현 수 대비)
+        delta: 오차를 넘을 확률
+        seed: 해시 시드
+    """
+
+    def __init__(self, capacity: int = SKETCH_CAPACITY, epsilon: float = SKETCH_EPSILON,
+                 delta: float = SKETCH_DELTA, seed: int = SKETCH_SEED):
+        self.heavy = SpaceSaving(capacity)
+        self.cms = CountMinSketch.from_error(epsilon, delta, seed)
+        self.days: List[str] = []
+
+    @property
+    def total(self) -> int:
+        return self.cms.total
+
+    def add(self, counts: Dict[str, int]):
+        """{단어: 출현횟수} 일괄 추가 (기사 하나, 하루치, 샤드 하나 등 단위는 자유)"""
+        self.heavy.add(counts)
+        self.cms.add(counts)
+
+    def merge(self, other: "KeywordSketch"):
+        """다른 날짜 / 샤드 스케치를 더함 (크기와 시드가 같아야 함)"""
+        self.cms.merge(other.cms)
+        self.heavy.merge(other.heavy)
+        self.days = sorted(set(self.days) | set(other.days))
+
+    def frequency(self, words: Sequence[str]) -> np.ndarray:
+        """단어별 빈도 추정 (실제보다 작지 않음. 후보로 추적 중이면 둘 중 작은 값)"""
+        estimates = self.cms.estimate(words)
+        tracked = np.array([self.heavy.counts.get(w, -1) for w in words], dtype=np.int64)
+        return np.where(tracked >= 0, np.minimum(estimates, tracked), estimates)
+
+    def top_k(self, k: int) -> List[Tuple[str, int, int]]:
+        """
+        근사 상위 k개 단어
+
+        Returns:
+            List[Tuple[str, int, int]]: [(단어, 추정 빈도, 보장 하한)] (추정 빈도 내림차순, 같으면 단어 오름차순)
+        """
+        words = list(self.heavy.counts)
+        estimates = self.frequency(words)
+        rows = [
+            (word, int(estimate), max(0, self.heavy.counts[word] - self.heavy.errors[word]))
+            for word, estimate in zip(words, estimates)
+        ]
+        rows.sort(key=lambda row: (-row[1], row[0]))
+        return rows[:k]
+
+    def memory_bytes(self) -> int:
+        """표 + 후보 (단어 문자열 제외) 크기"""
+        return self.cms.table.nbytes + 2 * 8 * self.heavy.capacity
+
+    def save(self, path: Path) -> Path:
+        """npz로 저장 (임시 파일에 쓴 뒤 교체)"""
+        words = list(self.heavy.counts)
+        meta = {
+            "capacity": self.heavy.capacity,
+            "width": self.cms.width,
+            "depth": self.cms.depth,
+            "seed": self.cms.seed,
+            "total": self.cms.total,
+            "days": self.days,
+            "words": words,
+        }
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            meta=np.frombuffer(json.dumps(meta, ensure_ascii=False).encode('utf-8'), dtype=np.uint8),
+            table=self.cms.table,
+            counts=np.array([self.heavy.counts[w] for w in words], dtype=np.int64),
+            errors=np.array([self.heavy.errors[w] for w in words], dtype=np.int64),
+        )
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "KeywordSketch":
+        with np.load(path) as data:
+            meta = json.loads(data["meta"].tobytes().decode('utf-8'))
+            sketch = cls(capacity=meta["capacity"])
+            sketch.cms = CountMinSketch(meta["width"], meta["depth"], meta["seed"])
+            sketch.cms.table = data["table"].astype(np.int64)
+            sketch.cms.total = meta["total"]
+            sketch.days = meta["days"]
+            sketch.heavy.counts = dict(zip(meta["words"], data["counts"].tolist()))
+            sketch.heavy.errors = dict(zip(meta["words"], data["errors"].tolist()))
+        return sketch
+
+
+def save_day_sketch(date_str: str, word_counts: Dict[str, int], output_dir: Path = SKETCH_DIR) -> Path:
+    """하루치 단어 카운트를 스케치로 만들어 data/sketch/yyyymmdd.npz 로 저장"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sketch = KeywordSketch()
+    sketch.add(word_counts)
+    sketch.days = [date_str]
+    return sketch.save(output_dir / f"{date_str}.npz")
+
+
+def merge_sketches(paths: Iterable[Path]) -> Optional[KeywordSketch]:
+    """스케치 파일들을 차례로 병합 (기간이 길어도 메모리는 스케치 두 개 크기)"""
+    merged = None
+    for path in paths:
+        sketch = KeywordSketch.load(path)
+        if merged is None:
+            merged = sketch
+        else:
+            merged.merge(sketch)
+    return merged
+
+
+def window_sketch(start: str = "", end: str = "", sketch_dir: Path = SKETCH_DIR) -> Optional[KeywordSketch]:
+    """start ~ end (yyyymmdd, 비우면 제한 없음) 날짜 스케치 병합. 해당 날짜가 없으면 None"""
+    paths = [
+        p for p in sorted(sketch_dir.glob('*.npz'))
+        if len(p.stem) == 8 and p.stem.isdigit() and (not start or p.stem >= start) and (not end or p.stem <= end)
+    ]
+    return merge_sketches(paths)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="날짜별 스케치를 병합해서 기간 상위 키워드 출력")
+    parser.add_argument("--start", default="", help="시작 날짜 (yyyymmdd)")
+    parser.add_argument("--end", default="", help="끝 날짜 (yyyymmdd)")
+    parser.add_argument("--top", type=int, default=30, help="출력할 단어 수")
+    parser.add_argument("--words", nargs="*", default=[], help="빈도를 추정할 단어")
+    args = parser.parse_args()
+
+    sketch = window_sketch(args.start, args.end)
+    if sketch is None:
+        print(f"✗ No sketches in {SKETCH_DIR} for the given range")
+        return
+    print(f"✓ Merged {len(sketch.days)} days ({sketch.days[0]} ~ {sketch.days[-1]}), "
+          f"{sketch.total:,} nouns, ±{sketch.cms.error_bound():,.0f} (p={1 - SKETCH_DELTA:.0%}), "
+          f"{sketch.memory_bytes() / 1024:,.0f}KB")
+    for rank, (word, estimate, lower) in enumerate(sketch.top_k(args.top), 1):
+        print(f"{rank:>3}. {word:<12} {estimate:>10,}  (≥ {lower:,})")
+    if args.words:
+        for word, estimate in zip(args.words, sketch.frequency(args.words)):
+            print(f"{word}: ≤ {int(estimate):,}")
+
+
+if __name__ == "__main__":
+    main()
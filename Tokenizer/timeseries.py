@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+# 시계열 저장소 기본 위치: Tokenizer/data/timeseries
+TIMESERIES_DIR = Path(__file__).parent / 'data' / 'timeseries'
+
+# 처음 생성할 때의 행렬 크기 (날짜 수, 단어 수). 넘치면 두 배씩 늘림
+INITIAL_DAYS = 64
+INITIAL_WORDS = 4096
+
+# meta.json의 행렬 배치 표시. 없으면 이전 형식(단어 × 날짜 counts.npy)이며 열 때 날짜 × 단어로 바꿔 저장
+LAYOUT = 'day_major'
+MATRIX_NAME = 'daily_counts.npy'
+LEGACY_MATRIX_NAME = 'counts.npy'
+
+
+class TermTimeSeries:
+    """
+    날짜별 단어 출현 횟수를 저장하는 날짜 × 단어 행렬 (uint32)
+
+    저장 형식:
+        daily_counts.npy: (날짜 용량, 단어 용량) 크기의 .npy 파일. 메모리 매핑으로 읽고 씀
+        meta.json: {"layout": "day_major", "words": [...], "dates": [...]}. i번째 날짜가 i번째 행,
+                   j번째 단어가 j번째 열 (행 순서는 추가된 순서, 날짜순이 아닐 수 있음)
+
+    하루치를 추가할 때는 해당 날짜의 행(연속된 영역)만 덮어쓰고, 용량이 부족할 때만 파일을 다시 만든다.
+    이전 형식(단어 × 날짜 counts.npy) 저장소는 처음 열 때 변환하며, meta.json을 바꾸는 시점에 변환이 확정된다
+    (중간에 중단되면 다음 실행에서 다시 변환).
+    """
+
+    def __init__(self, store_dir: Path = TIMESERIES_DIR):
+        self.store_dir = Path(store_dir)
+        self.meta_file = self.store_dir / 'meta.json'
+        self.matrix_file = self.store_dir / MATRIX_NAME
+        self.legacy_matrix_file = self.store_dir / LEGACY_MATRIX_NAME
+
+        self.words = []
+        self.dates = []
+        self.counts = None
+
+        if self.meta_file.exists():
+            with self.meta_file.open('r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('layout') == LAYOUT and self.matrix_file.exists():
+                self.words = meta['words']
+                self.dates = meta['dates']
+                self.counts = np.load(self.matrix_file, mmap_mode='r+')
+                # 변환 직후 지우지 못한 이전 형식 파일
+                self.legacy_matrix_file.unlink(missing_ok=True)
+            elif meta.get('layout') != LAYOUT and self.legacy_matrix_file.exists():
+                self.words = meta['words']
+                self.dates = meta['dates']
+                self._migrate_word_major()
+
+        self.word_index = {w: i for i, w in enumerate(self.words)}
+        self.date_index = {d: j for j, d in enumerate(self.dates)}
+
+    def _replace_matrix(self, shape: tuple, source: np.ndarray = None):
+        """
+        shape 크기의 새 행렬 파일을 만들어 교체 (source가 있으면 왼쪽 위에 복사)
+
+        source는 날짜 × 단어 배치여야 하며, 날짜 행 단위로 나눠 복사해 메모리 사용량을 제한한다.
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.matrix_file.with_suffix('.npy.tmp')
+        grown = np.lib.format.open_memmap(tmp_file, mode='w+', dtype=np.uint32, shape=shape)
+        if source is not None:
+            n_days, n_words = source.shape
+            for start in range(0, n_days, INITIAL_DAYS):
+                grown[start:start + INITIAL_DAYS, :n_words] = source[start:start + INITIAL_DAYS]
+        grown.flush()
+        del grown
+        self.counts = None
+        tmp_file.replace(self.matrix_file)
+        self.counts = np.load(self.matrix_file, mmap_mode='r+')
+
+    def _migrate_word_major(self):
+        """이전 형식(단어 × 날짜 counts.npy) 행렬을 날짜 × 단어로 바꿔 저장"""
+        old = np.load(self.legacy_matrix_file, mmap_mode='r')
+        word_cap, day_cap = old.shape
+        self._replace_matrix((day_cap, word_cap), old.T)
+        del old
+        self._save_meta()
+        self.legacy_matrix_file.unlink()
+        print(f"✓ Migrated time series to day-major layout: {len(self.dates)} days × {len(self.words)} words")
+
+    def _ensure_capacity(self, n_days: int, n_words: int):
+        """행렬 용량이 모자라면 두 배씩 늘려서 새 파일로 교체"""
+        if self.counts is not None and n_days <= self.counts.shape[0] and n_words <= self.counts.shape[1]:
+            return
+
+        old_days, old_words = (self.counts.shape if self.counts is not None else (0, 0))
+        day_cap = max(old_days, INITIAL_DAYS)
+        while day_cap < n_days:
+            day_cap *= 2
+        word_cap = max(old_words, INITIAL_WORDS)
+        while word_cap < n_words:
+            word_cap *= 2
+
+        self._replace_matrix((day_cap, word_cap), self.counts)
+
+    def _save_meta(self):
+        tmp_file = self.store_dir / 'meta.json.tmp'
+        with tmp_file.open('w', encoding='utf-8') as f:
+            json.dump(
+                {'layout': LAYOUT, 'words': self.words, 'dates': self.dates},
+                f, ensure_ascii=False, separators=(',', ':'),
+            )
+        tmp_file.replace(self.meta_file)
+
+    def add_day(self, date_str: str, word_counts: dict, min_count: int = 2):
+        """
+        하루치 단어 카운트를 저장 (같은 날짜가 있으면 덮어씀)
+
+        Args:
+            date_str: 날짜 문자열 (yyyymmdd 형식)
+            word_counts: {단어: 출현횟수} 딕셔너리
+            min_count: 이 값보다 적게 나온 단어는 저장하지 않음 (어휘 크기 제한용)
+        """
+        items = [(w, c) for w, c in word_counts.items() if c >= min_count]
+
+        for word, _ in items:
+            if word not in self.word_index:
+                self.word_index[word] = len(self.words)
+                self.words.append(word)
+        if date_str not in self.date_index:
+            self.date_index[date_str] = len(self.dates)
+            self.dates.append(date_str)
+
+        self._ensure_capacity(len(self.dates), len(self.words))
+
+        # 하루치 행을 메모리에서 만든 뒤 한 번에 기록 (파일의 연속된 영역 하나만 씀)
+        day_row = np.zeros(self.counts.shape[1], dtype=np.uint32)
+        if items:
+            cols = np.fromiter((self.word_index[w] for w, _ in items), dtype=np.int64, count=len(items))
+            day_row[cols] = np.fromiter((c for _, c in items), dtype=np.uint32, count=len(items))
+        self.counts[self.date_index[date_str]] = day_row
+        self.counts.flush()
+        self._save_meta()
@@ -1,8 +1,29 @@
 import reflex as rx
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, TypedDict
-import csv
+
+from .charts import chart_api, load_dashboard_data
+from .clusters import cluster_view
+from .intraday import snapshot_hours, window_view
+from .keyword_index import keyword_articles, preload as preload_keyword_index
+from .network import VIEW_WIDTH, VIEW_HEIGHT, network_view
+from .paths import RANK_DIR, SUMMARY_DIR
+from .rank import read_rank_file
+from .search import SummaryIndex, parse_summary_file
+from .timeseries import TermTimeSeries
+
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "Common"))
+# PROFILE_SAMPLE_RATE(0~1)를 설정하면 @sampled 핸들러 호출 일부를 cProfile로 기록 (profiles/)
+from profiling import sampled
+
+# 요약 기사 검색 인덱스 (모든 세션이 공유)
+summary_index = SummaryIndex()
+
+# 날짜별 단어 빈도수 시계열 저장소 (모든 세션이 공유, 읽기 전용)
+term_series = TermTimeSeries()
 
 class WordCount(TypedDict):
     word: str
@@ -15,6 +36,56 @@ class DateCard(TypedDict):
 class SummaryItem(TypedDict):
     category: str
     summary: str
+    cluster: str
+
+class ClusterCard(TypedDict):
+    id: str
+    keywords: str
+    size: str
+    titles: List[str]
+
+class KeywordSnippet(TypedDict):
+    before: str
+    keyword: str
+    after: str
+
+class KeywordArticle(TypedDict):
+    title: str
+    count: str
+    category: str
+    summary: str
+    snippets: List[KeywordSnippet]
+
+class SearchResult(TypedDict):
+    date: str
+    category: str
+    summary: str
+    score: float
+
+class TermMover(TypedDict):
+    word: str
+    before: int
+    after: int
+    change: int
+
+class NetworkNode(TypedDict):
+    word: str
+    x: int
+    y: int
+    r: int
+
+class NetworkEdge(TypedDict):
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    width: int
+    opacity: str
+
+class NetworkPair(TypedDict):
+    word_a: str
+    word_b: str
+    count: int
 
 class State(rx.State):
     # 현재 선택된 메뉴 상태 관리
@@ -27,18 +98,45 @@ class State(rx.State):
     # 카드 데이터 리스트: [{"date": "20251020", "words": [{"word": "금융", "count": "2509"}, ...]}, ...]
     card_data: List[DateCard] = []
     
-    # 히트맵 데이터: [{"date": "20251020", "word": "금융", "count": 2509}, ...]
-    heatmap_data: List[Dict[str, Any]] = []
-    
     # 라인 차트 데이터: [{"date": "20251020", "금융": 2509, "대출": 1253, ...}, ...]
     line_chart_data: List[Dict[str, Any]] = []
     
+    # 기간 선택 시계열: 선택 기간의 상위 5개 단어 추이와 직전 같은 길이 기간 대비 급상승 단어
+    ts_dates: List[str] = []
+    ts_start_date: str = ""
+    ts_end_date: str = ""
+    ts_words: List[str] = []
+    ts_chart_data: List[Dict[str, Any]] = []
+    ts_movers: List[TermMover] = []
+    
+    # 대시보드 실시간 순위: 시간별 스냅샷(res/intraday) 중 선택한 시간 / 구간(1h, 6h, 24h)의 상위 단어
+    intraday_hours: List[str] = []
+    intraday_hour: str = ""
+    intraday_window: str = "1h"
+    intraday_words: List[WordCount] = []
+    intraday_articles: int = 0
+    
     # 상세 페이지 데이터: 선택된 날짜의 상위 30개 단어
     detail_data: List[WordCount] = []
     
-    # 요약 기사 데이터: 선택된 날짜의 요약 기사들
+    # 상세 페이지 동시 출현 네트워크: SVG 좌표로 변환된 노드/간선 + 상위 단어 쌍 표
+    network_nodes: List[NetworkNode] = []
+    network_edges: List[NetworkEdge] = []
+    network_pairs: List[NetworkPair] = []
+    
+    # 상세 페이지 키워드 드릴다운: 클릭한 키워드가 나온 기사 / 요약 / 문맥 (res/keyword_index)
+    drill_word: str = ""
+    drill_article_count: int = 0
+    drill_occurrences: int = 0
+    drill_items: List[KeywordArticle] = []
+    
+    # 요약 기사 데이터: 선택된 날짜의 요약 기사들 (클러스터가 있으면 큰 클러스터 순으로 정렬)
     summary_data: List[SummaryItem] = []
     
+    # 요약 페이지 상단 이야기 클러스터 카드 (res/clusters)
+    summary_clusters: List[ClusterCard] = []
+    selected_cluster: str = ""
+    
     # 페이지네이션 관련
     current_summary_page: int = 1
     items_per_page: int = 20
@@ -46,6 +144,17 @@ class State(rx.State):
     # 필터링 관련
     selected_category: str = "전체"
     
+    # 검색 관련: 조건 + 현재 페이지 결과만 보관 (전체 결과는 서버에서 페이지 단위로 조회)
+    search_query: str = ""
+    search_start_date: str = ""
+    search_end_date: str = ""
+    search_category: str = "전체"
+    search_page: int = 1
+    search_total: int = 0
+    search_results: List[SearchResult] = []
+    search_dates: List[str] = []
+    search_categories: List[str] = ["전체"]
+    
     @rx.var
     def available_categories(self) -> List[str]:
         """사용 가능한 분류 목록 반환 (전체 + 고유 분류들)"""
@@ -56,10 +165,21 @@ class State(rx.State):
     
     @rx.var
     def filtered_summary_data(self) -> List[SummaryItem]:
-        """선택된 분류에 따라 필터링된 데이터 반환"""
+        """선택된 분류 / 클러스터에 따라 필터링된 데이터 반환"""
+        items = self.summary_data
+        if self.selected_cluster:
+            items = [item for item in items if item["cluster"] == self.selected_cluster]
         if self.selected_category == "전체":
-            return self.summary_data
-        return [item for item in self.summary_data if item["category"] == self.selected_category]
+            return items
+        return [item for item in items if item["category"] == self.selected_category]
+    
+    @rx.var
+    def selected_cluster_keywords(self) -> str:
+        """선택된 클러스터의 대표 단어 (선택 안 했으면 빈 문자열)"""
+        for card in self.summary_clusters:
+            if card["id"] == self.selected_cluster:
+                return card["keywords"]
+        return ""
     
     @rx.var
     def total_summary_pages(self) -> int:
@@ -82,6 +202,11 @@ class State(rx.State):
         self.selected_category = category
         self.current_summary_page = 1  # 필터 변경 시 1페이지로 리셋
     
+    def set_cluster_filter(self, cluster_id: str):
+        """클러스터 카드 클릭: 해당 클러스터 요약만 보기 (다시 누르면 해제)"""
+        self.selected_cluster = "" if self.selected_cluster == cluster_id else cluster_id
+        self.current_summary_page = 1
+    
     def go_to_summary_page(self, page_num: int):
         """특정 페이지로 이동"""
         if 1 <= page_num <= self.total_summary_pages:
@@ -97,37 +222,6 @@ class State(rx.State):
         if self.current_summary_page > 1:
             self.current_summary_page -= 1
 
-    def get_latest_csv_files(self, rank_folder: Path, max_files: int = 7) -> List[Path]:
-        """
-        rank 폴더에서 최신 파일들을 가져오기
-        
-        Args:
-            rank_folder: CSV 파일들이 있는 폴더 경로
-            max_files: 가져올 최대 파일 개수 (기본값: 7)
-            
-        Returns:
-            List[Path]: 최신 CSV 파일 경로 리스트
-        """
-        if not rank_folder or not rank_folder.exists():
-            print(f"✗ Rank folder does not exist: {rank_folder}")
-            return []
-        
-        # 1. CSV 파일들을 모두 가져오기
-        all_csv_files = list(rank_folder.glob("*.csv"))
-        print(f"Found {len(all_csv_files)} CSV files in total")
-        
-        if not all_csv_files:
-            return []
-        
-        # 2. 파일명 기준으로 오름차순 정렬 (yyyymmdd.csv)
-        sorted_csv_files = sorted(all_csv_files, key=lambda f: f.stem)
-        
-        # 3. 최신 max_files개 파일만 선택 (마지막 max_files개)
-        latest_files = sorted_csv_files[-max_files:] if len(sorted_csv_files) > max_files else sorted_csv_files
-        print(f"Processing latest {len(latest_files)} CSV files")
-        
-        return latest_files
-    
     def extract_card_data_from_csv(self, csv_file: Path, max_words: int = 10) -> Dict[str, Any] | None:
         """
         CSV 파일에서 카드 데이터 추출
@@ -139,45 +233,13 @@ class State(rx.State):
         Returns:
             Dict[str, Any] | None: {"date": "20251025", "value": [(word, count), ...]} 또는 None
         """
-        try:
-            # 파일명에서 날짜 추출 (예: 20251025.csv)
-            date_str = csv_file.stem  # 확장자 제외한 파일명
-            print(f"Processing file: {csv_file.name}")
-            
-            if len(date_str) != 8:  # yyyymmdd 형식이 아니면 건너뜀
-                return None
-            
-            word_count_list = []
-            
-            # CSV 파일 읽기
-            with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.reader(f)
-                
-                # 첫 번째 줄(헤더) 건너뛰기
-                next(reader, None)
-                
-                # 상위 max_words개의 데이터 읽기
-                for i, row in enumerate(reader):
-                    if i >= max_words:
-                        break
-                    if row and len(row) >= 2:
-                        word = row[0]
-                        count = row[1]
-                        word_count_list.append((word, count))
-                
-                if word_count_list:
-                    print(f"  → {date_str}: {len(word_count_list)} words extracted")
-                    return {
-                        "date": date_str,
-                        "value": word_count_list
-                    }
-                else:
-                    print(f"  → No data found in {csv_file.name}")
-                    return None
-                    
-        except Exception as e:
-            print(f"Error processing {csv_file}: {e}")
+        rank_file = read_rank_file(csv_file)
+        if rank_file is None or not len(rank_file):
             return None
+        return {
+            "date": rank_file.date,
+            "value": [(word, str(count)) for word, count in rank_file.top(max_words)]
+        }
     
     def extract_kpi_from_csv(self, csv_file: Path) -> Dict[str, str] | None:
         """
@@ -189,283 +251,328 @@ class State(rx.State):
         Returns:
             Dict[str, str] | None: {"title", "word", "count"} 딕셔너리 또는 None
         """
-        try:
-            # 파일명에서 날짜 추출 (예: 20251025.csv -> 10/25)
-            date_str = csv_file.stem  # 확장자 제외한 파일명
-            print(f"Processing file: {csv_file.name} -> {date_str}")
-            
-            if len(date_str) != 8:  # yyyymmdd 형식이 아니면 건너뜀
-                return None
-                
-            mm = date_str[4:6]
-            dd = date_str[6:8]
-            formatted_date = f"{mm}/{dd}"
-            
-            # CSV 파일 읽기
-            with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.reader(f)
-                
-                # 첫 번째 줄(헤더) 건너뛰기
-                next(reader, None)
-                
-                # 두 번째 줄(첫 번째 데이터) 읽기
-                first_row = next(reader, None)
-                
-                if first_row and len(first_row) >= 2:
-                    word = first_row[0]
-                    count = first_row[1]
-                    
-                    print(f"  → {formatted_date}: word='{word}', count='{count}'")
-                    
-                    return {
-                        "title": formatted_date,
-                        "word": word,
-                        "count": count
-                    }
-                else:
-                    print(f"  → No data found in {csv_file.name}")
-                    return None
-                    
-        except Exception as e:
-            print(f"Error processing {csv_file}: {e}")
+        rank_file = read_rank_file(csv_file)
+        if rank_file is None:
             return None
+        return rank_file.kpi()
     
+    @sampled
     def load_rank_files(self):
-        """rank 폴더의 파일명을 읽어서 모든 데이터 생성"""
+        """rank 데이터(dashboard.json 또는 최신 7개 CSV)로 카드/라인 차트 데이터 생성"""
         print("=== load_rank_files() 호출됨 ===")
         
-        # 1. 데이터가 있는 폴더 
-        possible_paths = [
-            Path(__file__).parent / "res" / "rank",
-        ]
+        # 기간 선택 차트는 시계열 저장소에서 별도로 로드
+        self.load_timeseries()
+        self.load_intraday()
         
-        rank_folder = None
-        for path in possible_paths:
-            print(f"Trying path: {path}")
-            if path.exists():
-                rank_folder = path
-                print(f"✓ Found folder at: {path}")
-                break
-               
-        # 2. 최신 7개 파일 가져오기
-        csv_files = self.get_latest_csv_files(rank_folder, max_files=7)
+        # 데이터 버전이 바뀌었을 때만 파일을 다시 읽음 (모든 세션이 공유)
+        data = load_dashboard_data()
+        self.card_data = data["card_data"]
+        self.line_chart_data = data["line_chart_data"]
         
-        # 3. 데이터 저장용 변수들
-        card_items = []  # 카드용
-        heatmap_dict = {}  # 히트맵용 (날짜 → {단어: 빈도수})
-        line_chart_dict = {}  # 라인 차트용 (날짜별로 단어 집계)
-        all_words_by_date = {}  # 각 날짜의 전체 단어 리스트
-       
-        for csv_file in csv_files:
-            # 파일명에서 날짜 추출 (예: 20251020.csv)
-            date_str = csv_file.stem
-            print(f"Processing file: {csv_file.name}")
-            
-            try:
-                # CSV 파일 읽기
-                with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.reader(f)
-                    
-                    # 첫 번째 줄(헤더) 건너뛰기
-                    next(reader, None)
-                    
-                    # 모든 데이터를 한 번에 읽기
-                    all_words = []
-                    for row in reader:
-                        if row and len(row) >= 2:
-                            word = row[0]
-                            count = int(row[1])
-                            all_words.append({"word": word, "count": count})
-                    
-                    all_words_by_date[date_str] = all_words
-                    
-                    # 카드용: 상위 4개만
-                    words_list_for_card = [
-                        {"word": w["word"], "count": str(w["count"])} 
-                        for w in all_words[:4]
-                    ]
-                    
-                    if words_list_for_card:
-                        card_items.append({
-                            "date": date_str,
-                            "words": words_list_for_card
-                        })
-                    
-                    # 히트맵용: 날짜별 단어-빈도 딕셔너리
-                    word_dict = {}
-                    for item in all_words[:30]:
-                        word_dict[item["word"]] = item["count"]
-                    heatmap_dict[date_str] = word_dict
-                    
-                    # 라인 차트용: 상위 10개 단어
-                    line_data = {"date": date_str}
-                    for item in all_words[:10]:
-                        line_data[item["word"]] = item["count"]
-                    line_chart_dict[date_str] = line_data
-                                
-                print(f"  → {date_str}: {len(all_words)}개 단어 추출 완료")
-                        
-            except Exception as e:
-                print(f"Error processing {csv_file}: {e}")
-                continue
+        print(f"Total Card items loaded: {len(self.card_data)} 날짜")
+        print(f"Total Line chart items loaded: {len(self.line_chart_data)} 날짜")
+    
+    def load_intraday(self):
+        """시간별 순위 스냅샷 목록을 읽고 가장 최근 시간을 기본으로 선택"""
+        try:
+            self.intraday_hours = snapshot_hours()
+        except Exception as e:
+            print(f"✗ Error loading intraday snapshots: {e}")
+            self.intraday_hours = []
+        if self.intraday_hour not in self.intraday_hours:
+            self.intraday_hour = self.intraday_hours[0] if self.intraday_hours else ""
+        self.update_intraday()
+    
+    def set_intraday_hour(self, hour: str):
+        """실시간 순위 기준 시간 선택"""
+        self.intraday_hour = hour
+        self.update_intraday()
+    
+    def set_intraday_window(self, window: str | List[str]):
+        """실시간 순위 구간 선택 (1h / 6h / 24h, segmented control은 단일 선택이어도 타입상 리스트가 올 수 있음)"""
+        self.intraday_window = window[0] if isinstance(window, list) else window
+        self.update_intraday()
+    
+    def update_intraday(self):
+        """선택한 시간 / 구간의 상위 단어 로드"""
+        if not self.intraday_hour:
+            self.intraday_words = []
+            self.intraday_articles = 0
+            return
+        words, articles = window_view(self.intraday_hour, self.intraday_window)
+        self.intraday_words = [WordCount(**item) for item in words]
+        self.intraday_articles = articles
+    
+    def load_timeseries(self):
+        """시계열 저장소의 날짜 목록을 읽고 기본 기간(최근 7일) 데이터 생성"""
+        try:
+            self.ts_dates = term_series.dates()
+        except Exception as e:
+            print(f"✗ Error loading time series: {e}")
+            self.ts_dates = []
         
-        # 4. 히트맵 데이터 생성 - 첫 번째 날짜의 상위 20개 단어 기준
-        heatmap_items = []
-        if all_words_by_date:
-            # 첫 번째 날짜의 상위 20개 단어를 기준으로 사용
-            first_date = sorted(all_words_by_date.keys())[0]
-            top_20_words = [w["word"] for w in all_words_by_date[first_date][:20]]
-            
-            # 각 날짜별로 이 20개 단어의 빈도수 수집
-            for date_str in sorted(heatmap_dict.keys()):
-                word_counts = heatmap_dict[date_str]
-                for word in top_20_words:
-                    count = word_counts.get(word, 0)  # 없으면 0
-                    heatmap_items.append({
-                        "date": date_str,
-                        "word": word,
-                        "count": count
-                    })
+        if not self.ts_dates:
+            self.ts_words = []
+            self.ts_chart_data = []
+            self.ts_movers = []
+            return
         
-        # 5. 라인 차트 데이터 정리
-        line_chart_items = []
-        for date_str in sorted(line_chart_dict.keys()):
-            line_chart_items.append(line_chart_dict[date_str])
+        if self.ts_start_date not in self.ts_dates or self.ts_end_date not in self.ts_dates:
+            self.ts_start_date = self.ts_dates[max(0, len(self.ts_dates) - 7)]
+            self.ts_end_date = self.ts_dates[-1]
+        self.update_timeseries()
+    
+    def set_ts_start_date(self, date: str):
+        """기간 시작 날짜 선택"""
+        self.ts_start_date = date
+        self.update_timeseries()
+    
+    def set_ts_end_date(self, date: str):
+        """기간 종료 날짜 선택"""
+        self.ts_end_date = date
+        self.update_timeseries()
+    
+    @sampled
+    def update_timeseries(self):
+        """선택 기간의 상위 단어 추이 및 직전 기간 대비 급상승 단어 계산"""
+        start, end = self.ts_start_date, self.ts_end_date
+        if start > end:
+            start, end = end, start
         
-        # 6. 데이터 저장
-        self.card_data = card_items
-        self.heatmap_data = heatmap_items
-        self.line_chart_data = line_chart_items
-               
-        print(f"Total Card items loaded: {len(self.card_data)} 날짜")
-        print(f"Total Heatmap items loaded: {len(self.heatmap_data)} 데이터 포인트")
-        print(f"Total Line chart items loaded: {len(self.line_chart_data)} 날짜")
-              
-        # 디버깅: 처음 2개 카드 데이터 출력
-        if self.card_data:
-            print("First 2 card data items:")
-            for i, item in enumerate(self.card_data[:2]):
-                print(f"  {i+1}: {item['date']} - {len(item['words'])}개 단어")
+        try:
+            top_words = [word for word, _ in term_series.top_words(start, end, k=5)]
+            dates, series = term_series.series(top_words, start, end)
+            
+            # 직전 같은 길이(날짜 수) 기간과 비교
+            start_idx = self.ts_dates.index(start) if start in self.ts_dates else 0
+            prev_dates = self.ts_dates[max(0, start_idx - len(dates)):start_idx]
+            movers = []
+            if prev_dates:
+                movers = term_series.top_movers((prev_dates[0], prev_dates[-1]), (start, end), k=10)
+        except Exception as e:
+            print(f"✗ Error querying time series: {e}")
+            top_words, dates, series, movers = [], [], {}, []
         
+        chart_data = []
+        for i, date_str in enumerate(dates):
+            point = {"date": date_str}
+            for word in top_words:
+                point[word] = series[word][i]
+            chart_data.append(point)
         
+        self.ts_words = top_words
+        self.ts_chart_data = chart_data
+        self.ts_movers = [TermMover(**item) for item in movers]
     
     def change_page(self, page: str):
         """메뉴 클릭 시 페이지 상태 업데이트"""
         self.current_page = page
         self.selected_date = ""
     
+    @sampled
     def select_date(self, date: str):
         """날짜 선택 시 해당 날짜 페이지로 이동"""
         self.current_page = "Detail"
         self.selected_date = date
         print(f"Selected date: {date}")
+        self.clear_keyword()
         # 선택된 날짜의 상세 데이터 로드
         self.load_detail_data(date)
     
     def load_detail_data(self, date: str):
         """선택된 날짜의 상세 데이터 로드 (상위 30개 단어)"""
-        # res/rank 폴더 경로 설정
-        current_file = Path(__file__)
-        project_root = current_file.parent  # WebProgram/WebProgram 폴더
-        rank_folder = project_root / "res" / "rank"
-        
-        # 해당 날짜의 CSV 파일 찾기
-        csv_file = rank_folder / f"{date}.csv"
+        # 해당 날짜의 CSV 파일 찾기 (res/rank)
+        csv_file = RANK_DIR / f"{date}.csv"
         
         if not csv_file.exists():
             print(f"✗ CSV file not found: {csv_file}")
             self.detail_data = []
+            self.load_network_data(date)
             return
         
-        print(f"Loading detail data from: {csv_file}")
-        detail_words = []
+        # 대시보드 로드 때 이미 읽은 파일이면 캐시에서 바로 가져옴
+        rank_file = read_rank_file(csv_file)
+        if rank_file is None:
+            self.detail_data = []
+            self.load_network_data(date)
+            return
         
+        self.detail_data = [WordCount(**item) for item in rank_file.detail_words()]
+        print(f"✓ Loaded {len(self.detail_data)} words for detail page")
+        self.load_network_data(date)
+        preload_keyword_index(date)
+    
+    @sampled
+    def select_keyword(self, word: str):
+        """상세 페이지에서 키워드 클릭 시 해당 키워드가 나온 기사 목록 로드 (같은 키워드를 다시 누르면 닫음)"""
+        if word == self.drill_word:
+            self.clear_keyword()
+            return
         try:
-            with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.reader(f)
-                next(reader, None)  # 헤더 건너뛰기
-                
-                # 상위 30개 단어 읽기
-                for i, row in enumerate(reader):
-                    if i >= 30:
-                        break
-                    if row and len(row) >= 2:
-                        detail_words.append(WordCount(word=row[0], count=row[1]))
-            
-            self.detail_data = detail_words
-            print(f"✓ Loaded {len(detail_words)} words for detail page")
-            
+            result = keyword_articles(self.selected_date, word)
         except Exception as e:
-            print(f"✗ Error loading detail data: {e}")
-            self.detail_data = []
+            print(f"✗ Error loading keyword articles: {e}")
+            result = {"articles": 0, "occurrences": 0, "items": []}
+        self.drill_word = word
+        self.drill_article_count = result["articles"]
+        self.drill_occurrences = result["occurrences"]
+        self.drill_items = [
+            KeywordArticle(**dict(item, snippets=[KeywordSnippet(**snippet) for snippet in item["snippets"]]))
+            for item in result["items"]
+        ]
+    
+    def clear_keyword(self):
+        """키워드 드릴다운 닫기"""
+        self.drill_word = ""
+        self.drill_article_count = 0
+        self.drill_occurrences = 0
+        self.drill_items = []
     
+    def load_network_data(self, date: str):
+        """선택된 날짜의 키워드 동시 출현 네트워크 로드 (res/network)"""
+        try:
+            view = network_view(date)
+        except Exception as e:
+            print(f"✗ Error building network view: {e}")
+            view = {"nodes": [], "edges": [], "pairs": []}
+        self.network_nodes = [NetworkNode(**item) for item in view["nodes"]]
+        self.network_edges = [NetworkEdge(**item) for item in view["edges"]]
+        self.network_pairs = [NetworkPair(**item) for item in view["pairs"]]
+    
+    @sampled
     def select_summary(self, date: str):
         """요약 기사 페이지로 이동"""
         self.current_page = "Summary"
         self.selected_date = date
         self.current_summary_page = 1  # 페이지를 1로 리셋
         self.selected_category = "전체"  # 분류 필터 리셋
+        self.selected_cluster = ""  # 클러스터 필터 리셋
         print(f"Selected summary for date: {date}")
         # 선택된 날짜의 요약 데이터 로드
         self.load_summary_data(date)
     
     def load_summary_data(self, date: str):
         """선택된 날짜의 요약 기사 데이터 로드"""
-        # res/summary 폴더 경로 설정
-        current_file = Path(__file__)
-        project_root = current_file.parent  # WebProgram/WebProgram 폴더
-        summary_folder = project_root / "res" / "summary"
-        
-        # 해당 날짜의 .sum 파일 찾기
-        summary_file = summary_folder / f"{date}.sum"
+        # 해당 날짜의 .sum 파일 찾기 (res/summary)
+        summary_file = SUMMARY_DIR / f"{date}.sum"
         
         if not summary_file.exists():
             print(f"✗ Summary file not found: {summary_file}")
             self.summary_data = []
+            self.summary_clusters = []
             return
         
         print(f"Loading summary data from: {summary_file}")
-        summaries = []
         
         try:
-            with open(summary_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 각 라인 처리
-            lines = content.split('\n')
-            current_category = ""
-            current_summary = ""
-            
-            for line in lines:
-                line = line.strip()
-                
-                # 코드 블록 마커 무시
-                if line.startswith('```') or line.startswith('````'):
-                    continue
-                
-                # 분류 라인 처리
-                if line.startswith('<분류>:'):
-                    # 이전 항목 저장
-                    if current_category and current_summary:
-                        summaries.append(SummaryItem(category=current_category, summary=current_summary))
-                    # 새 항목 시작
-                    current_category = line.replace('<분류>:', '').strip()
-                    current_summary = ""
-                
-                # 요약 라인 처리
-                elif line.startswith('<요약>:'):
-                    current_summary = line.replace('<요약>:', '').strip()
-            
-            # 마지막 항목 저장
-            if current_category and current_summary:
-                summaries.append(SummaryItem(category=current_category, summary=current_summary))
-            
+            cards, assignments = cluster_view(date)
+            summaries = [
+                SummaryItem(
+                    category=item["category"],
+                    summary=item["summary"],
+                    cluster=str(assignments[item["article"]]) if item["article"] in assignments else "",
+                )
+                for item in parse_summary_file(summary_file)
+            ]
+            # 클러스터 id는 크기 내림차순이므로, 큰 이야기부터 묶어서 보여주고 미분류는 뒤로 (안정 정렬)
+            summaries.sort(key=lambda item: int(item["cluster"]) if item["cluster"] not in ("", "-1") else len(assignments))
+            self.summary_clusters = [ClusterCard(**card) for card in cards]
             self.summary_data = summaries
             print(f"✓ Loaded {len(summaries)} summary items")
             
         except Exception as e:
             print(f"✗ Error loading summary data: {e}")
             self.summary_data = []
+            self.summary_clusters = []
+    
+    @rx.var
+    def total_search_pages(self) -> int:
+        """검색 결과 전체 페이지 수"""
+        if self.search_total == 0:
+            return 1
+        return (self.search_total + self.items_per_page - 1) // self.items_per_page
+    
+    def open_search(self):
+        """검색 페이지로 이동 (새로 생긴 .sum 파일은 이때 색인)"""
+        self.current_page = "Search"
+        self.selected_date = ""
+        summary_index.refresh()
+        self.search_dates = summary_index.dates()
+        if self.search_dates:
+            if self.search_start_date not in self.search_dates:
+                self.search_start_date = self.search_dates[0]
+            if self.search_end_date not in self.search_dates:
+                self.search_end_date = self.search_dates[-1]
+        self.search_page = 1
+        self.execute_search()
+    
+    def set_search_query(self, query: str):
+        """검색어 입력"""
+        self.search_query = query
+    
+    def set_search_start_date(self, date: str):
+        """검색 시작 날짜 설정"""
+        self.search_start_date = date
+        self.search_page = 1
+        self.execute_search()
+    
+    def set_search_end_date(self, date: str):
+        """검색 종료 날짜 설정"""
+        self.search_end_date = date
+        self.search_page = 1
+        self.execute_search()
+    
+    def set_search_category(self, category: str):
+        """검색 분류 필터 설정"""
+        self.search_category = category
+        self.search_page = 1
+        self.execute_search()
+    
+    def submit_search(self):
+        """검색 버튼 클릭 / 엔터 입력 시 1페이지부터 검색"""
+        self.search_page = 1
+        self.execute_search()
+    
+    def search_on_enter(self, key: str):
+        """검색어 입력창에서 엔터 키 처리"""
+        if key == "Enter":
+            self.submit_search()
+    
+    def next_search_page(self):
+        """검색 결과 다음 페이지"""
+        if self.search_page < self.total_search_pages:
+            self.search_page += 1
+            self.execute_search()
+    
+    def prev_search_page(self):
+        """검색 결과 이전 페이지"""
+        if self.search_page > 1:
+            self.search_page -= 1
+            self.execute_search()
+    
+    @sampled
+    def execute_search(self):
+        """현재 검색 조건으로 해당 페이지 결과만 가져오기"""
+        self.search_categories = ["전체"] + summary_index.categories(self.search_start_date, self.search_end_date)
+        if self.search_category not in self.search_categories:
+            self.search_category = "전체"
+        
+        try:
+            total, results = summary_index.search(
+                self.search_query,
+                start_date=self.search_start_date,
+                end_date=self.search_end_date,
+                category=self.search_category,
+                page=self.search_page,
+                per_page=self.items_per_page,
+            )
+        except Exception as e:
+            print(f"✗ Error searching summaries: {e}")
+            total, results = 0, []
+        
+        self.search_total = total
+        self.search_results = [SearchResult(**item) for item in results]
     
     @rx.var
     def chart_data_list(self) -> list:
@@ -477,115 +584,6 @@ class State(rx.State):
             }
             for item in self.kpi_data
         ]
-    
-    @rx.var
-    def heatmap_chart_config(self) -> dict:
-        """히트맵 차트 설정 반환"""
-        if not self.heatmap_data:
-            return {"data": [], "layout": {}}
-        
-        # 날짜와 단어 리스트 추출
-        dates = sorted(list(set([item["date"] for item in self.heatmap_data])))
-        words = []
-        seen_words = set()
-        for item in self.heatmap_data:
-            if item["word"] not in seen_words:
-                words.append(item["word"])
-                seen_words.add(item["word"])
-        
-        # 디버깅
-        print(f"히트맵 날짜: {dates}")
-        print(f"히트맵 단어 개수: {len(words)}")
-        print(f"히트맵 첫 5개 단어: {words[:5]}")
-        
-        # 히트맵용 2D 배열 생성
-        z_data = []
-        for word in words:
-            row = []
-            for date in dates:
-                # 해당 날짜의 해당 단어 빈도수 찾기
-                count = 0
-                for item in self.heatmap_data:
-                    if item["word"] == word and item["date"] == date:
-                        count = item["count"]
-                        break
-                row.append(count)
-            z_data.append(row)
-        
-        print(f"히트맵 z_data 크기: {len(z_data)} x {len(z_data[0]) if z_data else 0}")
-        print(f"히트맵 첫 행 샘플: {z_data[0][:3] if z_data else []}")
-        
-        return {
-            "data": [{
-                "type": "heatmap",
-                "z": z_data,
-                "x": dates,
-                "y": words,
-                "colorscale": "YlOrRd",
-                "hoverongaps": False,
-                "showscale": True
-            }],
-            "layout": {
-                "title": "단어별 빈도수 히트맵",
-                "xaxis": {"title": "날짜"},
-                "yaxis": {"title": "단어", "autorange": "reversed"},
-                "height": 600,
-                "margin": {"l": 100, "r": 50, "t": 50, "b": 50}
-            }
-        }
-    
-    @rx.var
-    def line_chart_config(self) -> dict:
-        """라인 차트 설정 반환"""
-        if not self.line_chart_data:
-            return {"data": [], "layout": {}}
-        
-        # 모든 단어 추출 (date 제외)
-        all_words = set()
-        for item in self.line_chart_data:
-            for key in item.keys():
-                if key != "date":
-                    all_words.add(key)
-        
-        # 상위 5개 단어만 선택 (첫 번째 날짜 기준)
-        if self.line_chart_data:
-            first_day = self.line_chart_data[0]
-            word_counts = [(word, first_day.get(word, 0)) for word in all_words]
-            word_counts.sort(key=lambda x: x[1], reverse=True)
-            top_words = [word for word, _ in word_counts[:5]]
-        else:
-            top_words = list(all_words)[:5]
-        
-        print(f"라인 차트 상위 단어: {top_words}")
-        print(f"라인 차트 날짜 개수: {len(self.line_chart_data)}")
-        
-        # 각 단어별 데이터 라인 생성
-        traces = []
-        for word in top_words:
-            x_values = [item["date"] for item in self.line_chart_data]
-            y_values = [item.get(word, 0) for item in self.line_chart_data]
-            print(f"  {word}: {y_values}")
-            traces.append({
-                "type": "scatter",
-                "mode": "lines+markers",
-                "name": word,
-                "x": x_values,
-                "y": y_values,
-                "line": {"width": 2},
-                "marker": {"size": 8}
-            })
-        
-        return {
-            "data": traces,
-            "layout": {
-                "title": "키워드별 빈도수 추이",
-                "xaxis": {"title": "날짜"},
-                "yaxis": {"title": "빈도수"},
-                "height": 400,
-                "showlegend": True,
-                "hovermode": "closest"
-            }
-        }
 
 
 def dashboard_content() -> rx.Component:
@@ -691,6 +689,59 @@ def dashboard_content() -> rx.Component:
             width="100%"
         ),
         
+        # 실시간 키워드: Tokenizer --intraday 가 시간마다 저장한 이동 구간 순위 (res/intraday)
+        rx.cond(
+            State.intraday_hours.length() > 0,
+            rx.box(
+                rx.hstack(
+                    rx.heading("실시간 키워드", size="6"),
+                    rx.spacer(),
+                    rx.segmented_control.root(
+                        rx.segmented_control.item("1시간", value="1h"),
+                        rx.segmented_control.item("6시간", value="6h"),
+                        rx.segmented_control.item("24시간", value="24h"),
+                        value=State.intraday_window,
+                        on_change=State.set_intraday_window,
+                    ),
+                    rx.select(
+                        State.intraday_hours,
+                        value=State.intraday_hour,
+                        on_change=State.set_intraday_hour,
+                        size="2",
+                    ),
+                    align_items="center",
+                    spacing="3",
+                    width="100%",
+                ),
+                rx.text(
+                    State.intraday_hour, "시 기준 · 기사 ", State.intraday_articles, "건",
+                    color="gray.600",
+                    font_size="14px",
+                    margin_bottom="1em",
+                ),
+                rx.grid(
+                    rx.foreach(
+                        State.intraday_words,
+                        lambda word_item, index: rx.hstack(
+                            rx.badge(f"#{index + 1}", color_scheme="red", size="1"),
+                            rx.text(word_item["word"], font_weight="600", color="gray.800"),
+                            rx.text(word_item["count"], color="gray.500", font_size="14px"),
+                            align_items="center",
+                            spacing="2",
+                        ),
+                    ),
+                    columns="5",
+                    spacing="3",
+                    width="100%",
+                ),
+                padding="20px",
+                border="1px solid #e2e8f0",
+                border_radius="8px",
+                width="100%",
+                margin_top="2em",
+            ),
+        ),
+        
         # 구분선
         rx.divider(margin_top="2em", margin_bottom="2em"),
         
@@ -748,6 +799,92 @@ def dashboard_content() -> rx.Component:
             margin_bottom="2em"
         ),
         
+        # 기간 선택 라인 차트 (시계열 저장소 기반)
+        rx.cond(
+            State.ts_dates.length() > 0,
+            rx.box(
+                rx.heading("기간별 키워드 추이", size="4", margin_bottom="1em"),
+                rx.hstack(
+                    rx.vstack(
+                        rx.text("시작 날짜:", font_weight="600", color="gray.700", font_size="0.9em"),
+                        rx.select(
+                            State.ts_dates,
+                            value=State.ts_start_date,
+                            on_change=State.set_ts_start_date,
+                            size="2",
+                        ),
+                        spacing="1",
+                        align_items="flex-start",
+                    ),
+                    rx.vstack(
+                        rx.text("종료 날짜:", font_weight="600", color="gray.700", font_size="0.9em"),
+                        rx.select(
+                            State.ts_dates,
+                            value=State.ts_end_date,
+                            on_change=State.set_ts_end_date,
+                            size="2",
+                        ),
+                        spacing="1",
+                        align_items="flex-start",
+                    ),
+                    spacing="6",
+                    padding_bottom="1em",
+                ),
+                rx.recharts.line_chart(
+                    rx.foreach(
+                        State.ts_words,
+                        lambda word: rx.recharts.line(
+                            data_key=word,
+                            type_="monotone",
+                        ),
+                    ),
+                    rx.recharts.x_axis(data_key="date"),
+                    rx.recharts.y_axis(),
+                    rx.recharts.legend(),
+                    rx.recharts.cartesian_grid(stroke_dasharray="3 3"),
+                    data=State.ts_chart_data,
+                    width="100%",
+                    height=400,
+                ),
+                rx.cond(
+                    State.ts_movers.length() > 0,
+                    rx.vstack(
+                        rx.text("직전 기간 대비 급상승 키워드", font_weight="600", color="gray.700"),
+                        rx.table.root(
+                            rx.table.header(
+                                rx.table.row(
+                                    rx.table.column_header_cell("단어"),
+                                    rx.table.column_header_cell("직전 기간"),
+                                    rx.table.column_header_cell("선택 기간"),
+                                    rx.table.column_header_cell("증가"),
+                                ),
+                            ),
+                            rx.table.body(
+                                rx.foreach(
+                                    State.ts_movers,
+                                    lambda mover: rx.table.row(
+                                        rx.table.cell(mover["word"]),
+                                        rx.table.cell(mover["before"]),
+                                        rx.table.cell(mover["after"]),
+                                        rx.table.cell(
+                                            rx.badge(f"+{mover['change']}", color_scheme="red", size="2"),
+                                        ),
+                                    ),
+                                ),
+                            ),
+                            variant="surface",
+                            size="2",
+                            width="100%",
+                        ),
+                        width="100%",
+                        padding_top="1em",
+                    ),
+                ),
+                width="100%",
+                margin_bottom="2em"
+            ),
+        ),
+        
         # 바 차트 섹션 (히트맵 대신)
         rx.box(
             rx.heading("바 차트: 날짜별 상위 단어 비교", size="4", margin_bottom="1em"),
@@ -798,6 +935,73 @@ def dashboard_content() -> rx.Component:
         padding="2em",
     )
 
+def keyword_drilldown() -> rx.Component:
+    """상세 페이지 키워드 → 기사 목록 패널"""
+    return rx.vstack(
+        rx.hstack(
+            rx.heading(
+                rx.text.span(State.drill_word, color="rgb(107, 139, 255)"),
+                rx.text.span(" 가 나온 기사", color="gray.700"),
+                size="6",
+            ),
+            rx.badge(State.drill_article_count, "건 · ", State.drill_occurrences, "회", color_scheme="blue", size="2"),
+            rx.spacer(),
+            rx.icon_button(
+                rx.icon("x"),
+                size="1",
+                variant="soft",
+                cursor="pointer",
+                on_click=State.clear_keyword,
+            ),
+            align_items="center",
+            width="100%",
+        ),
+        rx.cond(
+            State.drill_items.length() > 0,
+            rx.vstack(
+                rx.foreach(
+                    State.drill_items,
+                    lambda item: rx.box(
+                        rx.hstack(
+                            rx.text(item["title"], font_weight="600", color="gray.800"),
+                            rx.badge(item["count"], "회", color_scheme="gray", size="1"),
+                            rx.cond(
+                                item["category"] != "",
+                                rx.badge(item["category"], color_scheme="blue", size="1"),
+                            ),
+                            align_items="center",
+                            spacing="2",
+                        ),
+                        rx.foreach(
+                            item["snippets"],
+                            lambda snippet: rx.text(
+                                snippet["before"],
+                                rx.text.strong(snippet["keyword"], color="rgb(107, 139, 255)"),
+                                snippet["after"],
+                                font_size="0.9em",
+                                color="gray.600",
+                                padding_top="0.3em",
+                            ),
+                        ),
+                        rx.cond(
+                            item["summary"] != "",
+                            rx.text(item["summary"], font_size="0.9em", color="gray.800", padding_top="0.3em"),
+                        ),
+                        padding="0.8em",
+                        border_radius="8px",
+                        bg="white",
+                        width="100%",
+                    ),
+                ),
+                spacing="2",
+                width="100%",
+            ),
+            rx.text("이 키워드의 기사 색인이 없습니다 (res/keyword_index)", color="gray.500"),
+        ),
+        width="100%",
+        padding_bottom="2em",
+    )
+
 def detail_page_content() -> rx.Component:
     """상세 페이지 콘텐츠 - 선택된 날짜의 상위 30개 단어 표시"""
     return rx.vstack(
@@ -849,7 +1053,7 @@ def detail_page_content() -> rx.Component:
                                     word_data["word"],
                                     font_size="1.1em",
                                     font_weight="600",
-                                    color="gray.800",
+                                    color=rx.cond(word_data["word"] == State.drill_word, "rgb(107, 139, 255)", "gray.800"),
                                 ),
                             ),
                             rx.table.cell(
@@ -861,6 +1065,8 @@ def detail_page_content() -> rx.Component:
                                 ),
                             ),
                             _hover={"bg": "gray.50"},
+                            cursor="pointer",
+                            on_click=State.select_keyword(word_data["word"]),
                         ),
                     ),
                 ),
@@ -872,6 +1078,12 @@ def detail_page_content() -> rx.Component:
             padding_bottom="2em",
         ),
         
+        # 키워드 드릴다운: 표에서 클릭한 키워드가 나온 기사 (출현 횟수 순) + 문맥 + 요약
+        rx.cond(
+            State.drill_word != "",
+            keyword_drilldown(),
+        ),
+        
         # 바 차트: 상위 30개 단어 시각화
         rx.heading("빈도수 차트", size="6", color="gray.700", padding_top="1em", padding_bottom="0.5em"),
         rx.box(
@@ -899,6 +1111,81 @@ def detail_page_content() -> rx.Component:
             width="100%"
         ),
         
+        # 동시 출현 네트워크: 같은 기사에 함께 나온 키워드 (선 굵기 = 함께 나온 기사 수)
+        rx.heading("함께 나온 키워드", size="6", color="gray.700", padding_top="1em", padding_bottom="0.5em"),
+        rx.cond(
+            State.network_nodes.length() > 0,
+            rx.hstack(
+                rx.box(
+                    rx.el.svg(
+                        rx.foreach(
+                            State.network_edges,
+                            lambda edge: rx.el.line(
+                                x1=edge["x1"],
+                                y1=edge["y1"],
+                                x2=edge["x2"],
+                                y2=edge["y2"],
+                                stroke="rgb(107, 139, 255)",
+                                stroke_width=edge["width"],
+                                stroke_opacity=edge["opacity"],
+                            ),
+                        ),
+                        rx.foreach(
+                            State.network_nodes,
+                            lambda node: rx.el.g(
+                                rx.el.circle(
+                                    cx=node["x"],
+                                    cy=node["y"],
+                                    r=node["r"],
+                                    fill="rgb(255, 170, 90)",
+                                    stroke="white",
+                                    stroke_width=2,
+                                ),
+                                rx.el.text(
+                                    node["word"],
+                                    x=node["x"],
+                                    y=node["y"] - node["r"] - 4,
+                                    text_anchor="middle",
+                                    font_size="14px",
+                                    font_weight="600",
+                                    fill="#333",
+                                ),
+                            ),
+                        ),
+                        view_box=f"0 0 {VIEW_WIDTH} {VIEW_HEIGHT}",
+                        width="100%",
+                    ),
+                    bg="white",
+                    border_radius="8px",
+                    width="70%",
+                ),
+                rx.table.root(
+                    rx.table.header(
+                        rx.table.row(
+                            rx.table.column_header_cell("키워드 쌍"),
+                            rx.table.column_header_cell("기사 수"),
+                        ),
+                    ),
+                    rx.table.body(
+                        rx.foreach(
+                            State.network_pairs,
+                            lambda pair: rx.table.row(
+                                rx.table.cell(rx.text(pair["word_a"], " · ", pair["word_b"], font_weight="600")),
+                                rx.table.cell(rx.text(pair["count"], color="rgb(107, 139, 255)")),
+                            ),
+                        ),
+                    ),
+                    variant="surface",
+                    size="1",
+                    width="30%",
+                ),
+                align_items="flex-start",
+                spacing="4",
+                width="100%",
+            ),
+            rx.text("동시 출현 데이터가 없습니다 (res/network)", color="gray.500"),
+        ),
+        
         align_items="flex-start",
         width="100%",
         padding="2em",
@@ -928,6 +1215,65 @@ def summary_page_content() -> rx.Component:
             padding_bottom="1em",
         ),
         
+        # 이야기 클러스터 카드 (클릭하면 해당 클러스터 요약만 보기)
+        rx.cond(
+            State.summary_clusters.length() > 0,
+            rx.vstack(
+                rx.hstack(
+                    rx.text("주요 이야기", font_weight="600", color="gray.700", font_size="1.1em"),
+                    rx.cond(
+                        State.selected_cluster != "",
+                        rx.button(
+                            f"선택 해제: {State.selected_cluster_keywords}",
+                            on_click=State.set_cluster_filter(State.selected_cluster),
+                            variant="soft",
+                            size="1",
+                        ),
+                    ),
+                    spacing="3",
+                    align_items="center",
+                ),
+                rx.grid(
+                    rx.foreach(
+                        State.summary_clusters,
+                        lambda card: rx.card(
+                            rx.vstack(
+                                rx.hstack(
+                                    rx.text(card["keywords"], font_weight="bold", color="blue.600", font_size="14px"),
+                                    rx.badge(f"{card['size']}건", color_scheme="blue", size="1"),
+                                    justify="between",
+                                    width="100%",
+                                ),
+                                rx.foreach(
+                                    card["titles"],
+                                    lambda title: rx.text(title, font_size="13px", color="gray.700", trim="both"),
+                                ),
+                                align="start",
+                                spacing="1",
+                                width="100%",
+                            ),
+                            padding="14px",
+                            cursor="pointer",
+                            on_click=State.set_cluster_filter(card["id"]),
+                            border=rx.cond(
+                                State.selected_cluster == card["id"],
+                                "2px solid rgb(107, 139, 255)",
+                                "1px solid #e2e8f0",
+                            ),
+                            border_radius="8px",
+                            _hover={"border_color": "blue.300", "box_shadow": "lg"},
+                        ),
+                    ),
+                    columns="3",
+                    spacing="3",
+                    width="100%",
+                ),
+                spacing="2",
+                width="100%",
+                padding_bottom="1em",
+            ),
+        ),
+        
         # 분류 필터 및 통계
         rx.hstack(
             rx.vstack(
@@ -1058,6 +1404,160 @@ def summary_page_content() -> rx.Component:
         padding="2em",
     )
 
+def search_page_content() -> rx.Component:
+    """검색 페이지 콘텐츠 - 전체 요약 기사 대상 키워드/기간/분류 검색"""
+    return rx.vstack(
+        rx.heading("요약 기사 검색", size="8", padding_bottom="0.5em"),
+        
+        # 검색 조건 (검색어 + 기간 + 분류)
+        rx.hstack(
+            rx.input(
+                placeholder="검색어 (예: 금리 대출)",
+                value=State.search_query,
+                on_change=State.set_search_query,
+                on_key_down=State.search_on_enter,
+                width="320px",
+                size="2",
+            ),
+            rx.button("검색", on_click=State.submit_search, size="2"),
+            spacing="3",
+            align_items="center",
+            padding_bottom="0.5em",
+        ),
+        rx.hstack(
+            rx.vstack(
+                rx.text("시작 날짜:", font_weight="600", color="gray.700", font_size="0.9em"),
+                rx.select(
+                    State.search_dates,
+                    value=State.search_start_date,
+                    on_change=State.set_search_start_date,
+                    size="2",
+                ),
+                spacing="1",
+                align_items="flex-start",
+            ),
+            rx.vstack(
+                rx.text("종료 날짜:", font_weight="600", color="gray.700", font_size="0.9em"),
+                rx.select(
+                    State.search_dates,
+                    value=State.search_end_date,
+                    on_change=State.set_search_end_date,
+                    size="2",
+                ),
+                spacing="1",
+                align_items="flex-start",
+            ),
+            rx.vstack(
+                rx.text("분류 필터:", font_weight="600", color="gray.700", font_size="0.9em"),
+                rx.select(
+                    State.search_categories,
+                    value=State.search_category,
+                    on_change=State.set_search_category,
+                    size="2",
+                ),
+                spacing="1",
+                align_items="flex-start",
+            ),
+            rx.vstack(
+                rx.text("검색 결과:", font_weight="600", color="gray.700", font_size="0.9em"),
+                rx.badge(f"{State.search_total}개", color_scheme="blue", size="2"),
+                spacing="1",
+                align_items="flex-start",
+            ),
+            spacing="6",
+            align_items="flex-start",
+            padding_bottom="1em",
+            width="100%",
+        ),
+        
+        rx.box(
+            rx.cond(
+                State.search_total > 0,
+                rx.vstack(
+                    rx.table.root(
+                        rx.table.header(
+                            rx.table.row(
+                                rx.table.column_header_cell("날짜", width="12%"),
+                                rx.table.column_header_cell("분류", width="18%"),
+                                rx.table.column_header_cell("요약", width="70%"),
+                            ),
+                        ),
+                        rx.table.body(
+                            rx.foreach(
+                                State.search_results,
+                                lambda result: rx.table.row(
+                                    rx.table.cell(
+                                        rx.text(
+                                            result["date"],
+                                            font_weight="500",
+                                            color="gray.600",
+                                            cursor="pointer",
+                                            on_click=lambda: State.select_summary(result["date"]),
+                                        ),
+                                    ),
+                                    rx.table.cell(
+                                        rx.badge(
+                                            result["category"],
+                                            color_scheme="green",
+                                            size="2",
+                                        ),
+                                    ),
+                                    rx.table.cell(
+                                        rx.text(
+                                            result["summary"],
+                                            font_size="0.95em",
+                                            line_height="1.6",
+                                            color="gray.700",
+                                        ),
+                                    ),
+                                    _hover={"bg": "gray.50"},
+                                ),
+                            ),
+                        ),
+                        variant="surface",
+                        size="3",
+                        width="100%",
+                    ),
+                    # 페이지네이션 컨트롤
+                    rx.hstack(
+                        rx.button(
+                            rx.icon("chevron-left"),
+                            on_click=State.prev_search_page,
+                            disabled=State.search_page == 1,
+                            variant="soft",
+                            size="2",
+                        ),
+                        rx.text(
+                            f"{State.search_page} / {State.total_search_pages}",
+                            font_size="0.9em",
+                            color="gray.700",
+                        ),
+                        rx.button(
+                            rx.icon("chevron-right"),
+                            on_click=State.next_search_page,
+                            disabled=State.search_page >= State.total_search_pages,
+                            variant="soft",
+                            size="2",
+                        ),
+                        spacing="3",
+                        justify="center",
+                        width="100%",
+                        padding_top="1em",
+                    ),
+                    width="100%",
+                    spacing="0",
+                ),
+                rx.text("검색 결과가 없습니다.", color="gray.500")
+            ),
+            width="100%",
+            padding_bottom="2em",
+        ),
+        
+        align_items="flex-start",
+        width="100%",
+        padding="2em",
+    )
+
 def sidebar() -> rx.Component:
     # 왼쪽 네비게이션 사이드바 생성
     return rx.box(
@@ -1082,6 +1582,20 @@ def sidebar() -> rx.Component:
                 align_items="center",
                 padding_left="12px",
             ),
+            
+            # 검색 메뉴
+            rx.hstack(
+                rx.icon("search", color="rgb(107, 139, 255)", mr="2"),
+                rx.heading(
+                    "Search",
+                    size="5",
+                    cursor="pointer",
+                    on_click=State.open_search,
+                    _hover={"color": "rgb(80, 110, 200)"},
+                ),
+                align_items="center",
+                padding_left="12px",
+            ),
             align_items="flex-start",
             width="100%",
             spacing="4",
@@ -1105,7 +1619,11 @@ def main_content() -> rx.Component:
                 rx.cond(
                     State.current_page == "Summary",
                     summary_page_content(),
-                    dashboard_content(),  # 기본값
+                    rx.cond(
+                        State.current_page == "Search",
+                        search_page_content(),
+                        dashboard_content(),  # 기본값
+                    ),
                 ),
             ),
         ),
@@ -1127,5 +1645,5 @@ def index() -> rx.Component:
     )
 
 # Reflex 앱 초기화 및 라우트 설정
-app = rx.App()
+app = rx.App(api_transformer=chart_api)
 app.add_page(index)
\ No newline at end of file
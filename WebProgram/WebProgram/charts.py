@@ -0,0 +1,232 @@
+import hashlib
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import List, Dict, Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from .paths import RANK_DIR, ARTIFACT_FILE
+from .rank import read_rank_file
+
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "Common"))
+from dashboard import DETAIL_TOP, MAX_DAYS, build_dashboard, latest_rank_dates
+
+# 데이터 버전별로 한 번만 만드는 대시보드 데이터 / 차트 설정 캐시
+_cache_lock = threading.Lock()
+_cache: Dict[str, Any] = {"version": None, "data": None, "charts": {}}
+
+
+def get_latest_csv_files(rank_folder: Path, max_files: int = MAX_DAYS) -> List[Path]:
+    """
+    rank 폴더에서 최신 파일들을 가져오기
+
+    Args:
+        rank_folder: CSV 파일들이 있는 폴더 경로
+        max_files: 가져올 최대 파일 개수 (기본값: 7)
+
+    Returns:
+        List[Path]: 최신 CSV 파일 경로 리스트 (날짜 오름차순)
+    """
+    if not rank_folder or not rank_folder.exists():
+        print(f"✗ Rank folder does not exist: {rank_folder}")
+        return []
+
+    # 파일명 기준으로 오름차순 정렬 (yyyymmdd.csv) 후 최신 max_files개만 선택
+    return [rank_folder / f"{date}.csv" for date in latest_rank_dates(rank_folder, max_files)]
+
+
+def data_version() -> str:
+    """
+    rank CSV와 dashboard.json의 (이름, 수정시각, 크기)로 만든 데이터 버전 문자열
+    파일이 하나라도 바뀌면 버전이 바뀐다.
+    """
+    digest = hashlib.sha1()
+    files = sorted(RANK_DIR.glob("*.csv")) if RANK_DIR.exists() else []
+    if ARTIFACT_FILE.exists():
+        files.append(ARTIFACT_FILE)
+    for f in files:
+        stat = f.stat()
+        digest.update(f"{f.name}:{stat.st_mtime_ns}:{stat.st_size};".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def load_dashboard_artifact() -> Dict[str, Any] | None:
+    """
+    Tokenizer가 만든 사전 계산 데이터(res/dashboard.json) 로드
+
+    Returns:
+        Dict[str, Any] | None: 파일이 없거나 rank 폴더의 최신 날짜와 artifact의 날짜가 다르면 None
+    """
+    if not ARTIFACT_FILE.exists():
+        return None
+
+    try:
+        with open(ARTIFACT_FILE, 'r', encoding='utf-8') as f:
+            artifact = json.load(f)
+    except Exception as e:
+        print(f"✗ Error loading dashboard artifact: {e}")
+        return None
+
+    # rank 폴더에 artifact에 없는 날짜가 들어왔으면 CSV에서 직접 생성
+    # (파일 수정 시각은 복사 방법에 따라 바뀌므로 비교하지 않고 artifact에 적힌 날짜를 기준으로 함)
+    rank_dates = latest_rank_dates(RANK_DIR)
+    if rank_dates and artifact.get("dates") != rank_dates:
+        print(f"✗ Dashboard artifact dates do not match rank CSVs: {ARTIFACT_FILE}")
+        return None
+
+    print(f"✓ Loaded dashboard artifact: {len(artifact['dates'])} 날짜")
+    return artifact
+
+
+def build_dashboard_data(rank_folder: Path, max_files: int = MAX_DAYS) -> Dict[str, Any]:
+    """
+    rank CSV들을 읽어서 dashboard.json과 같은 구조의 데이터 생성 (Tokenizer와 같은 build_dashboard 사용)
+
+    Args:
+        rank_folder: CSV 파일들이 있는 폴더 경로
+        max_files: 사용할 최신 파일 개수 (기본값: 7)
+
+    Returns:
+        Dict[str, Any]: {"dates", "top_k", "card_data", "heatmap_matrix", "line_chart_data", "line_series"}
+    """
+    top_by_date = {}
+    for csv_file in get_latest_csv_files(rank_folder, max_files=max_files):
+        rank_file = read_rank_file(csv_file)
+        if rank_file is not None:
+            top_by_date[rank_file.date] = rank_file.top(DETAIL_TOP)
+    return build_dashboard(top_by_date)
+
+
+def heatmap_figure(data: Dict[str, Any]) -> dict:
+    """히트맵 Plotly figure (단어 × 날짜 행렬)"""
+    matrix = data.get("heatmap_matrix")
+    if not matrix:
+        return {"data": [], "layout": {}}
+
+    return {
+        "data": [{
+            "type": "heatmap",
+            "z": matrix["z"],
+            "x": matrix["x"],
+            "y": matrix["y"],
+            "colorscale": "YlOrRd",
+            "hoverongaps": False,
+            "showscale": True
+        }],
+        "layout": {
+            "title": "단어별 빈도수 히트맵",
+            "xaxis": {"title": "날짜"},
+            "yaxis": {"title": "단어", "autorange": "reversed"},
+            "height": 600,
+            "margin": {"l": 100, "r": 50, "t": 50, "b": 50}
+        }
+    }
+
+
+def line_figure(data: Dict[str, Any]) -> dict:
+    """라인 차트 Plotly figure (첫 번째 날짜 기준 상위 5개 단어 추이)"""
+    series_list = data.get("line_series")
+    if not series_list:
+        return {"data": [], "layout": {}}
+
+    traces = [
+        {
+            "type": "scatter",
+            "mode": "lines+markers",
+            "name": series["name"],
+            "x": series["x"],
+            "y": series["y"],
+            "line": {"width": 2},
+            "marker": {"size": 8}
+        }
+        for series in series_list
+    ]
+
+    return {
+        "data": traces,
+        "layout": {
+            "title": "키워드별 빈도수 추이",
+            "xaxis": {"title": "날짜"},
+            "yaxis": {"title": "빈도수"},
+            "height": 400,
+            "showlegend": True,
+            "hovermode": "closest"
+        }
+    }
+
+
+CHART_BUILDERS = {
+    "heatmap": heatmap_figure,
+    "line": line_figure,
+}
+
+
+def load_dashboard_data() -> Dict[str, Any]:
+    """
+    대시보드 데이터 반환 (데이터 버전이 바뀌었을 때만 다시 로드)
+
+    Returns:
+        Dict[str, Any]: dashboard.json 구조 + "version" 키
+    """
+    version = data_version()
+    with _cache_lock:
+        if _cache["version"] == version:
+            return _cache["data"]
+
+    data = load_dashboard_artifact() or build_dashboard_data(RANK_DIR)
+    data = dict(data, version=version)
+
+    with _cache_lock:
+        _cache["version"] = version
+        _cache["data"] = data
+        _cache["charts"] = {}
+    return data
+
+
+def get_chart(name: str) -> Dict[str, Any]:
+    """
+    차트 figure를 데이터 버전별로 한 번만 생성해서 반환
+
+    Returns:
+        Dict[str, Any]: {"version", "figure"}
+    """
+    data = load_dashboard_data()
+    with _cache_lock:
+        cached = _cache["charts"].get(name)
+        if cached and cached["version"] == data["version"]:
+            return cached
+
+    chart = {"version": data["version"], "figure": CHART_BUILDERS[name](data)}
+    with _cache_lock:
+        if _cache["version"] == data["version"]:
+            _cache["charts"][name] = chart
+    return chart
+
+
+def chart_endpoint(request: Request) -> Response:
+    """
+    GET /api/charts/{heatmap|line} → Plotly figure JSON
+
+    ETag(데이터 버전)로 재검증하므로 같은 버전에서는 304 응답만 오가고,
+    State 델타에는 차트 데이터가 실리지 않는다.
+    """
+    name = request.path_params["name"]
+    if name not in CHART_BUILDERS:
+        return JSONResponse({"error": f"unknown chart: {name}"}, status_code=404)
+
+    chart = get_chart(name)
+    etag = f'"{chart["version"]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(chart["figure"], headers=headers)
+
+
+# Reflex 백엔드에 붙는 차트 API (rx.App(api_transformer=chart_api))
+chart_api = Starlette(routes=[Route("/api/charts/{name}", chart_endpoint, methods=["GET"])])
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from .filecache import FileCache, cached
+from .paths import CLUSTER_DIR
+
+# 카드로 보여줄 최대 클러스터 수 (나머지 작은 클러스터는 요약 목록에서만 묶여 보임)
+VIEW_CLUSTERS = 12
+
+# (경로) → ((수정시각, 크기), 클러스터 결과). 파일이 바뀌지 않았으면 다시 읽지 않음
+_cluster_cache: FileCache = {}
+
+
+def read_cluster_file(date: str, cluster_dir: Path = CLUSTER_DIR) -> Dict[str, Any]:
+    """
+    Tokenizer가 만든 클러스터 결과(yyyymmdd.json) 읽기
+
+    Returns:
+        Dict[str, Any]: {"articles", "clusters": [{"id", "size", "keywords", "representatives"}],
+            "assignments": {기사 파일명: 클러스터 id}}. 파일이 없으면 빈 결과
+    """
+    def load(path: Path) -> Dict[str, Any]:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    json_file = cluster_dir / f"{date}.json"
+    empty = {"articles": 0, "clusters": [], "assignments": {}}
+    try:
+        return cached(_cluster_cache, json_file, load) or empty
+    except Exception as e:
+        print(f"✗ Error reading cluster file {json_file}: {e}")
+        return empty
+
+
+def article_title(file_name: str) -> str:
+    """기사 파일명 → 제목 (Downloader는 제목을 파일명으로 저장)"""
+    return Path(file_name).stem
+
+
+def cluster_view(date: str, max_clusters: int = VIEW_CLUSTERS) -> Tuple[list, Dict[str, int]]:
+    """
+    요약 페이지 상단 클러스터 카드와 기사 → 클러스터 매핑
+
+    Returns:
+        Tuple[list, Dict[str, int]]: ([{"id", "keywords", "size", "titles"}] (id / size는 문자열, 2개 이상 묶인 클러스터만),
+            {기사 파일명: 클러스터 id})
+    """
+    result = read_cluster_file(date)
+    cards = [
+        {
+            "id": str(cluster["id"]),
+            "keywords": " · ".join(cluster["keywords"]),
+            "size": str(cluster["size"]),
+            "titles": [article_title(name) for name in cluster["representatives"]],
+        }
+        for cluster in result["clusters"]
+        if cluster["size"] >= 2
+    ][:max_clusters]
+    return cards, result["assignments"]
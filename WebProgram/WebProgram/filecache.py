@@ -0,0 +1,33 @@
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 모든 파일 캐시가 함께 쓰는 잠금 (캐시 조회 / 저장만 감싸고 파일 읽기는 잠금 밖에서 함)
+_cache_lock = threading.Lock()
+
+# (경로) → ((수정시각, 크기), 내용)
+FileCache = Dict[str, Tuple[Tuple[int, int], Any]]
+
+
+def cached(cache: FileCache, path: Path, load: Callable[[Path], Any]) -> Optional[Any]:
+    """
+    파일 (수정시각, 크기)가 같으면 캐시, 아니면 load(path) 결과를 캐시에 넣고 반환 (파일이 없으면 None)
+
+    load에서 난 예외는 그대로 전달하고 캐시에 넣지 않는다 (다음 호출에서 다시 읽음).
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = str(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        entry = cache.get(key)
+    if entry and entry[0] == version:
+        return entry[1]
+
+    value = load(path)
+    with _cache_lock:
+        cache[key] = (version, value)
+    return value
@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .filecache import FileCache, cached
+from .paths import INTRADAY_DIR
+
+# 대시보드에 보여줄 구간별 상위 단어 수와 선택 가능한 최근 시간 수
+VIEW_TOP = 15
+VIEW_HOURS = 48
+
+# (경로) → ((수정시각, 크기), 스냅샷). 파일이 바뀌지 않았으면 다시 읽지 않음
+_snapshot_cache: FileCache = {}
+
+
+def snapshot_hours(intraday_dir: Path = INTRADAY_DIR, limit: int = VIEW_HOURS) -> List[str]:
+    """Tokenizer가 만든 시간별 순위 스냅샷(yyyymmddHH.json)의 시간 목록 (최신순)"""
+    if not intraday_dir.exists():
+        return []
+    hours = sorted(
+        (p.stem for p in intraday_dir.glob('*.json') if len(p.stem) == 10 and p.stem.isdigit()),
+        reverse=True,
+    )
+    return hours[:limit]
+
+
+def read_snapshot(hour: str, intraday_dir: Path = INTRADAY_DIR) -> Dict[str, Any]:
+    """
+    시간별 순위 스냅샷 읽기
+
+    Returns:
+        Dict[str, Any]: {"hour", "windows": {"1h" | "6h" | "24h": {"hours", "articles", "words": [[단어, 빈도수], ...]}}}.
+            파일이 없으면 빈 windows
+    """
+    def load(path: Path) -> Dict[str, Any]:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    json_file = intraday_dir / f"{hour}.json"
+    empty = {"hour": hour, "windows": {}}
+    try:
+        return cached(_snapshot_cache, json_file, load) or empty
+    except Exception as e:
+        print(f"✗ Error reading intraday snapshot {json_file}: {e}")
+        return empty
+
+
+def window_view(hour: str, window: str, k: int = VIEW_TOP) -> Tuple[List[Dict[str, str]], int]:
+    """
+    스냅샷 한 구간의 상위 단어
+
+    Returns:
+        Tuple[List[Dict[str, str]], int]: ([{"word", "count"}] (count는 문자열), 구간 기사 수)
+    """
+    data = read_snapshot(hour)["windows"].get(window)
+    if not data:
+        return [], 0
+    return [{"word": word, "count": str(count)} for word, count in data["words"][:k]], data["articles"]
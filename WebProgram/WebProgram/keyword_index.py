@@ -0,0 +1,122 @@
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .clusters import article_title
+from .filecache import FileCache, cached
+from .paths import ARTICLE_DIR, KEYWORD_INDEX_DIR, SUMMARY_DIR
+from .search import parse_summary_file
+
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "Common"))
+from postings import INDEX_SUFFIX, PostingIndex
+
+# 드릴다운에 보여줄 최대 기사 수 (출현 횟수가 많은 기사부터)
+DRILLDOWN_ARTICLES = 20
+# 기사마다 보여줄 문맥 수와 키워드 앞뒤 글자 수
+SNIPPETS_PER_ARTICLE = 2
+SNIPPET_CONTEXT = 40
+
+# (경로) → ((수정시각, 크기), 내용). 파일이 바뀌지 않았으면 다시 읽지 않음
+_index_cache: FileCache = {}
+_summary_cache: FileCache = {}
+
+
+def read_keyword_index(date: str, index_dir: Path = KEYWORD_INDEX_DIR) -> Optional[PostingIndex]:
+    """Tokenizer가 만든 날짜별 명사 → 기사 역색인 (yyyymmdd.kidx). 없거나 읽지 못하면 None"""
+    try:
+        return cached(_index_cache, index_dir / f"{date}{INDEX_SUFFIX}", PostingIndex.load)
+    except Exception as e:
+        print(f"✗ Error reading keyword index for {date}: {e}")
+        return None
+
+
+def summaries_by_article(date: str, summary_dir: Path = SUMMARY_DIR) -> Dict[str, Dict[str, str]]:
+    """날짜 .sum 파일의 {기사 파일명: {"category", "summary"}} (<기사> 줄이 있는 항목만)"""
+    def load(path: Path) -> Dict[str, Dict[str, str]]:
+        return {item["article"]: item for item in parse_summary_file(path) if item["article"]}
+
+    try:
+        return cached(_summary_cache, summary_dir / f"{date}.sum", load) or {}
+    except Exception as e:
+        print(f"✗ Error reading summaries for {date}: {e}")
+        return {}
+
+
+def preload(date: str):
+    """상세 페이지를 열 때 역색인과 요약을 미리 읽어 둠 (첫 키워드 클릭도 캐시에서 바로 조회)"""
+    read_keyword_index(date)
+    summaries_by_article(date)
+
+
+def keyword_in_context(text: str, word: str, offsets, max_snippets: int = SNIPPETS_PER_ARTICLE,
+                       context: int = SNIPPET_CONTEXT) -> List[Dict[str, str]]:
+    """
+    출현 위치 앞뒤 문맥 (겹치는 위치는 하나로)
+
+    Returns:
+        List[Dict[str, str]]: [{"before", "keyword", "after"}] (줄바꿈은 공백으로)
+    """
+    snippets = []
+    covered = -1
+    for offset in offsets:
+        offset = int(offset)
+        if offset < covered:
+            continue
+        if text[offset:offset + len(word)] != word:
+            # 색인 이후 기사가 바뀐 경우 등: 위치 근처에서 다시 찾음
+            offset = text.find(word, max(0, offset - context))
+            if offset < 0:
+                continue
+        end = offset + len(word)
+        start = max(0, offset - context)
+        stop = min(len(text), end + context)
+        snippets.append({
+            "before": ("…" if start > 0 else "") + text[start:offset].replace("\n", " "),
+            "keyword": text[offset:end],
+            "after": text[end:stop].replace("\n", " ") + ("…" if stop < len(text) else ""),
+        })
+        covered = stop
+        if len(snippets) >= max_snippets:
+            break
+    return snippets
+
+
+def keyword_articles(date: str, word: str, limit: int = DRILLDOWN_ARTICLES,
+                     article_dir: Path = ARTICLE_DIR) -> Dict[str, Any]:
+    """
+    키워드 → 기사 / 요약 드릴다운
+
+    Returns:
+        Dict[str, Any]: {"articles": 키워드가 나온 기사 수, "occurrences": 전체 출현 횟수,
+            "items": [{"title", "count", "category", "summary", "snippets": [{"before", "keyword", "after"}]}]}
+            (출현 횟수 내림차순, 같으면 파일명 순. 원문이 없으면 snippets는 빈 리스트)
+    """
+    result = {"articles": 0, "occurrences": 0, "items": []}
+    index = read_keyword_index(date)
+    if index is None or not word:
+        return result
+
+    doc_ids, counts, offsets, starts = index.postings(word)
+    result["articles"] = len(doc_ids)
+    result["occurrences"] = int(counts.sum())
+
+    summaries = summaries_by_article(date)
+    for row in np.lexsort((doc_ids, -counts))[:limit]:
+        name = index.articles[doc_ids[row]]
+        try:
+            text = (article_dir / date / name).read_text(encoding='utf-8')
+            snippets = keyword_in_context(text, word, offsets[starts[row]:starts[row] + counts[row]])
+        except OSError:
+            snippets = []
+        summary = summaries.get(name, {})
+        result["items"].append({
+            "title": article_title(name),
+            "count": str(counts[row]),
+            "category": summary.get("category", ""),
+            "summary": summary.get("summary", ""),
+            "snippets": snippets,
+        })
+    return result
@@ -0,0 +1,143 @@
+import csv
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+
+from .filecache import FileCache, cached
+from .paths import NETWORK_DIR
+
+# 화면에 그리는 최대 간선 / 노드 수 (파일에는 더 많이 저장되어 있음)
+VIEW_EDGES = 60
+VIEW_NODES = 30
+
+# SVG 좌표계 크기 (viewBox="0 0 VIEW_WIDTH VIEW_HEIGHT")
+VIEW_WIDTH = 1000
+VIEW_HEIGHT = 600
+VIEW_MARGIN = 60
+
+LAYOUT_ITERATIONS = 150
+
+# (경로) → ((수정시각, 크기), 간선 리스트). 파일이 바뀌지 않았으면 다시 읽지 않음
+_network_cache: FileCache = {}
+
+
+def read_network_file(date: str, network_dir: Path = NETWORK_DIR) -> List[Tuple[str, str, int]]:
+    """
+    Tokenizer가 만든 동시 출현 간선 CSV(yyyymmdd.csv: word_a,word_b,count) 읽기
+
+    Returns:
+        List[Tuple[str, str, int]]: (단어, 단어, 함께 나온 기사 수), 파일 순서 그대로 (기사 수 내림차순)
+    """
+    def load(path: Path) -> List[Tuple[str, str, int]]:
+        edges = []
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # 헤더 건너뛰기
+            for row in reader:
+                if row and len(row) >= 3:
+                    edges.append((row[0], row[1], int(row[2])))
+        return edges
+
+    csv_file = network_dir / f"{date}.csv"
+    try:
+        return cached(_network_cache, csv_file, load) or []
+    except Exception as e:
+        print(f"✗ Error reading network file {csv_file}: {e}")
+        return []
+
+
+def force_layout(n: int, pairs: np.ndarray, weights: np.ndarray, iterations: int = LAYOUT_ITERATIONS) -> np.ndarray:
+    """
+    Fruchterman-Reingold 방식 배치 (시드 고정이라 같은 입력이면 항상 같은 위치)
+
+    Args:
+        n: 노드 수
+        pairs: (간선 수, 2) 노드 번호 배열
+        weights: 간선 가중치 (0~1)
+
+    Returns:
+        np.ndarray: (n, 2) 좌표, 각 축 0~1 범위
+    """
+    rng = np.random.default_rng(0)
+    pos = rng.random((n, 2))
+    k = np.sqrt(1.0 / n)
+    temperature = 0.1
+    for _ in range(iterations):
+        delta = pos[:, None, :] - pos[None, :, :]
+        dist = np.maximum(np.linalg.norm(delta, axis=2), 1e-3)
+        # 모든 노드 쌍 사이의 척력
+        disp = (delta / dist[..., None] * (k * k / dist)[..., None]).sum(axis=1)
+        # 간선으로 이어진 노드 사이의 인력 (함께 나온 기사가 많을수록 강하게)
+        if len(pairs):
+            d = pos[pairs[:, 0]] - pos[pairs[:, 1]]
+            length = np.maximum(np.linalg.norm(d, axis=1), 1e-3)
+            pull = d * (length / k * (0.5 + weights))[:, None]
+            np.add.at(disp, pairs[:, 0], -pull)
+            np.add.at(disp, pairs[:, 1], pull)
+        length = np.maximum(np.linalg.norm(disp, axis=1), 1e-9)
+        pos += disp / length[:, None] * np.minimum(length, temperature)[:, None]
+        temperature = max(temperature * 0.97, 0.002)
+
+    pos -= pos.min(axis=0)
+    span = pos.max(axis=0)
+    return pos / np.where(span > 0, span, 1)
+
+
+def network_view(date: str, max_edges: int = VIEW_EDGES, max_nodes: int = VIEW_NODES) -> Dict[str, Any]:
+    """
+    날짜의 동시 출현 네트워크를 SVG로 그릴 수 있는 형태로 변환
+
+    Returns:
+        Dict[str, Any]: {
+            "nodes": [{"word", "x", "y", "r"}],          (좌표는 VIEW_WIDTH × VIEW_HEIGHT 기준)
+            "edges": [{"x1", "y1", "x2", "y2", "width", "opacity"}],
+            "pairs": [{"word_a", "word_b", "count"}]   (상위 간선 표)
+        }
+    """
+    edges = read_network_file(date)
+    if not edges:
+        return {"nodes": [], "edges": [], "pairs": []}
+
+    # 기사 수가 많은 간선부터 노드 수 제한 안에서 선택
+    words: Dict[str, int] = {}
+    selected = []
+    for a, b, count in edges:
+        if len(selected) >= max_edges:
+            break
+        new_words = [w for w in (a, b) if w not in words]
+        if len(words) + len(new_words) > max_nodes:
+            continue
+        for w in new_words:
+            words[w] = len(words)
+        selected.append((words[a], words[b], count))
+
+    pairs = np.array([(i, j) for i, j, _ in selected], dtype=np.int64).reshape(-1, 2)
+    counts = np.array([c for _, _, c in selected], dtype=np.float64)
+    weights = counts / counts.max()
+    pos = force_layout(len(words), pairs, weights)
+
+    xs = VIEW_MARGIN + pos[:, 0] * (VIEW_WIDTH - 2 * VIEW_MARGIN)
+    ys = VIEW_MARGIN + pos[:, 1] * (VIEW_HEIGHT - 2 * VIEW_MARGIN)
+
+    # 노드 크기: 연결된 간선의 기사 수 합
+    strength = np.zeros(len(words))
+    np.add.at(strength, pairs[:, 0], counts)
+    np.add.at(strength, pairs[:, 1], counts)
+    radius = 6 + 14 * np.sqrt(strength / strength.max())
+
+    # SVG 속성으로 바로 넘기므로 좌표는 정수, 투명도는 문자열
+    nodes = [
+        {"word": w, "x": int(round(xs[i])), "y": int(round(ys[i])), "r": int(round(radius[i]))}
+        for w, i in words.items()
+    ]
+    lines = [
+        {
+            "x1": int(round(xs[i])), "y1": int(round(ys[i])),
+            "x2": int(round(xs[j])), "y2": int(round(ys[j])),
+            "width": int(round(1 + 5 * w)), "opacity": f"{0.25 + 0.6 * w:.2f}",
+        }
+        for (i, j), w in zip(pairs.tolist(), weights.tolist())
+    ]
+    table = [{"word_a": a, "word_b": b, "count": count} for a, b, count in edges[:20]]
+    return {"nodes": nodes, "edges": lines, "pairs": table}
@@ -0,0 +1,18 @@
+import os
+from pathlib import Path
+
+# 데이터 폴더. WEBPROGRAM_RES_DIR 환경 변수로 다른 폴더를 지정할 수 있음 (부하 테스트용 합성 데이터 등)
+RES_DIR = Path(os.environ.get("WEBPROGRAM_RES_DIR") or Path(__file__).parent / "res")
+
+RANK_DIR = RES_DIR / "rank"
+SUMMARY_DIR = RES_DIR / "summary"
+INDEX_DIR = RES_DIR / "index"
+TIMESERIES_DIR = RES_DIR / "timeseries"
+ARTIFACT_FILE = RES_DIR / "dashboard.json"
+NETWORK_DIR = RES_DIR / "network"
+CLUSTER_DIR = RES_DIR / "clusters"
+KEYWORD_INDEX_DIR = RES_DIR / "keyword_index"
+INTRADAY_DIR = RES_DIR / "intraday"
+
+# 키워드 드릴다운 문맥(KWIC)용 기사 원문 폴더 (Downloader/data/yyyymmdd/*.txt). WEBPROGRAM_ARTICLE_DIR로 변경 가능
+ARTICLE_DIR = Path(os.environ.get("WEBPROGRAM_ARTICLE_DIR") or Path(__file__).resolve().parents[2] / "Downloader" / "data")
@@ -0,0 +1,87 @@
+import csv
+import sys
+from array import array
+from pathlib import Path
+from typing import List, Dict, Tuple
+
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "Common"))
+from dashboard import DETAIL_TOP
+
+from .filecache import FileCache, cached
+
+# (경로) → ((수정시각, 크기), RankFile). 파일이 바뀌지 않았으면 다시 읽지 않음
+_rank_cache: FileCache = {}
+
+
+class RankFile:
+    """
+    rank CSV(yyyymmdd.csv) 하나를 파싱한 결과
+
+    단어와 빈도수를 같은 순서의 병렬 배열로 보관하고(빈도수 내림차순, CSV 순서 그대로),
+    KPI/상세 페이지와 대시보드 데이터(Common/dashboard.py)가 필요한 만큼 잘라서 사용한다.
+    """
+
+    __slots__ = ("date", "words", "counts")
+
+    def __init__(self, date: str, words: List[str], counts: array):
+        self.date = date
+        self.words = words
+        self.counts = counts
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """상위 n개 (단어, 빈도수)"""
+        return list(zip(self.words[:n], self.counts[:n]))
+
+    def kpi(self) -> Dict[str, str] | None:
+        """KPI용 1위 단어 {"title": "mm/dd", "word", "count"}"""
+        if not self.words:
+            return None
+        return {
+            "title": f"{self.date[4:6]}/{self.date[6:8]}",
+            "word": self.words[0],
+            "count": str(self.counts[0]),
+        }
+
+    def detail_words(self) -> List[Dict[str, str]]:
+        """상세 페이지용 상위 30개 [{"word", "count"}] (count는 문자열)"""
+        return [{"word": w, "count": str(c)} for w, c in self.top(DETAIL_TOP)]
+
+
+def read_rank_file(csv_file: Path) -> RankFile | None:
+    """
+    rank CSV를 한 번만 읽어서 RankFile로 반환 (수정되지 않았으면 캐시 사용)
+
+    Args:
+        csv_file: yyyymmdd.csv 파일 경로
+
+    Returns:
+        RankFile | None: 파일명이 yyyymmdd 형식이 아니거나 읽기 실패 시 None
+    """
+    date_str = csv_file.stem
+    if not (len(date_str) == 8 and date_str.isdigit()):
+        return None
+
+    def load(path: Path) -> RankFile:
+        words = []
+        counts = array("q")
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # 헤더 건너뛰기
+            for row in reader:
+                if row and len(row) >= 2:
+                    words.append(row[0])
+                    counts.append(int(row[1]))
+        return RankFile(date_str, words, counts)
+
+    try:
+        rank_file = cached(_rank_cache, csv_file, load)
+    except Exception as e:
+        print(f"Error processing {csv_file}: {e}")
+        return None
+    if rank_file is None:
+        print(f"✗ Rank file not found: {csv_file}")
+    return rank_file
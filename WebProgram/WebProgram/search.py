@@ -0,0 +1,320 @@
+import json
+import math
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+from .paths import SUMMARY_DIR, INDEX_DIR
+
+# 단계 공용 모듈 (Common/) 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "Common"))
+from categories import categorize, model_version
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_kiwi = None
+
+
+def get_kiwi():
+    """Kiwi 인스턴스를 한 번만 생성해서 재사용 (모델 로딩이 무거움)"""
+    global _kiwi
+    if _kiwi is None:
+        from kiwipiepy import Kiwi
+        _kiwi = Kiwi()
+    return _kiwi
+
+
+def extract_nouns(text: str) -> List[str]:
+    """
+    텍스트에서 2음절 이상 명사만 추출 (Tokenizer의 gen_word_count와 같은 기준)
+
+    Args:
+        text: 분석할 텍스트
+
+    Returns:
+        List[str]: 등장 순서대로의 명사 리스트 (중복 포함)
+    """
+    if not text.strip():
+        return []
+    nouns = []
+    for token in get_kiwi().tokenize(text):
+        if token.tag.startswith('N') and len(token.form) >= 2:
+            nouns.append(token.form)
+    return nouns
+
+
+def parse_summary_file(summary_file: Path) -> List[Dict[str, str]]:
+    """
+    .sum 파일을 읽어서 {"category", "summary", "article"} 리스트로 변환
+
+    분류는 파일에 적힌 자유 형식 분류를 고정 분류 체계(Common/categories.py)로 바꾼 값이다.
+
+    Args:
+        summary_file: .sum 파일 경로
+
+    Returns:
+        List[Dict[str, str]]: 파일에 나온 순서대로의 요약 항목 리스트
+            (article은 원본 기사 파일명, <기사> 줄이 없는 예전 파일이면 빈 문자열)
+    """
+    content = summary_file.read_text(encoding='utf-8')
+
+    summaries = []
+    current_category = ""
+    current_summary = ""
+    current_article = ""
+
+    def flush():
+        if current_category and current_summary:
+            summaries.append({"category": current_category, "summary": current_summary, "article": current_article})
+
+    for line in content.split('\n'):
+        line = line.strip()
+
+        # 코드 블록 마커 무시
+        if line.startswith('```'):
+            continue
+
+        # 분류 라인 처리
+        if line.startswith('<분류>:'):
+            # 이전 항목 저장
+            flush()
+            # 새 항목 시작
+            current_category = line.replace('<분류>:', '').strip()
+            current_summary = ""
+            current_article = ""
+
+        # 요약 라인 처리
+        elif line.startswith('<요약>:'):
+            current_summary = line.replace('<요약>:', '').strip()
+
+        # 원본 기사 파일명 (예전 .sum 파일에는 없음)
+        elif line.startswith('<기사>:'):
+            current_article = line.replace('<기사>:', '').strip()
+
+    # 마지막 항목 저장
+    flush()
+
+    categories = categorize([s["category"] for s in summaries], [s["summary"] for s in summaries])
+    for summary, category in zip(summaries, categories):
+        summary["category"] = category
+    return summaries
+
+
+def build_segment(date_str: str, summary_file: Path) -> Dict[str, Any]:
+    """
+    하루치 .sum 파일로 역색인 세그먼트 생성
+
+    Args:
+        date_str: 날짜 문자열 (yyyymmdd 형식)
+        summary_file: 해당 날짜의 .sum 파일 경로
+
+    Returns:
+        Dict[str, Any]: {"date", "source", "categories", "docs", "lengths", "postings"} 세그먼트
+            categories는 분류기 버전 (바뀌면 다시 색인)
+            postings는 {명사: [[문서번호, 출현횟수], ...]} 형태
+    """
+    stat = summary_file.stat()
+    docs = parse_summary_file(summary_file)
+
+    lengths = []
+    postings: Dict[str, List[List[int]]] = {}
+    for doc_id, doc in enumerate(docs):
+        # 분류도 검색 대상에 포함 (예: "보험" 으로 검색 시 분류가 보험인 기사도 매칭)
+        nouns = extract_nouns(doc["category"] + "\n" + doc["summary"])
+        lengths.append(len(nouns))
+
+        term_freq: Dict[str, int] = {}
+        for noun in nouns:
+            term_freq[noun] = term_freq.get(noun, 0) + 1
+        for noun, tf in term_freq.items():
+            postings.setdefault(noun, []).append([doc_id, tf])
+
+    return {
+        "date": date_str,
+        "source": {"mtime": stat.st_mtime, "size": stat.st_size},
+        "categories": model_version(),
+        "docs": docs,
+        "lengths": lengths,
+        "postings": postings,
+    }
+
+
+class SummaryIndex:
+    """
+    날짜별 세그먼트로 나뉜 요약 기사 역색인
+
+    세그먼트는 INDEX_DIR/<yyyymmdd>.json 으로 저장되며, refresh() 호출 시
+    새로 생기거나 수정된 .sum 파일만 다시 색인한다.
+    """
+
+    def __init__(self, summary_dir: Path = SUMMARY_DIR, index_dir: Path = INDEX_DIR):
+        self.summary_dir = summary_dir
+        self.index_dir = index_dir
+        # 날짜 → 세그먼트
+        self.segments: Dict[str, Dict[str, Any]] = {}
+
+    def _load_segment(self, date_str: str) -> Dict[str, Any] | None:
+        segment_file = self.index_dir / f"{date_str}.json"
+        if not segment_file.exists():
+            return None
+        try:
+            with open(segment_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"✗ Error loading index segment {segment_file}: {e}")
+            return None
+
+    def _save_segment(self, segment: Dict[str, Any]):
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        segment_file = self.index_dir / f"{segment['date']}.json"
+        tmp_file = segment_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(segment, f, ensure_ascii=False, separators=(",", ":"))
+        tmp_file.replace(segment_file)
+
+    def refresh(self) -> int:
+        """
+        summary 폴더와 세그먼트를 비교해서 바뀐 날짜만 다시 색인
+
+        Returns:
+            int: 새로 색인한 세그먼트 개수
+        """
+        if not self.summary_dir.exists():
+            self.segments = {}
+            return 0
+
+        current_dates = set()
+        rebuilt = 0
+        categories_version = model_version()
+        for summary_file in self.summary_dir.glob("*.sum"):
+            date_str = summary_file.stem
+            if not (len(date_str) == 8 and date_str.isdigit()):
+                continue
+            current_dates.add(date_str)
+
+            stat = summary_file.stat()
+            segment = self.segments.get(date_str) or self._load_segment(date_str)
+            if (segment and segment["source"] == {"mtime": stat.st_mtime, "size": stat.st_size}
+                    and segment.get("categories") == categories_version):
+                self.segments[date_str] = segment
+                continue
+
+            # 새 파일이거나 수정된 파일 (또는 분류기가 바뀜) → 해당 날짜 세그먼트만 재생성
+            try:
+                segment = build_segment(date_str, summary_file)
+                self._save_segment(segment)
+                self.segments[date_str] = segment
+                rebuilt += 1
+                print(f"✓ Indexed {summary_file.name}: {len(segment['docs'])} summaries")
+            except Exception as e:
+                print(f"✗ Error indexing {summary_file}: {e}")
+
+        # 삭제된 .sum 파일의 세그먼트는 메모리에서 제거
+        for date_str in list(self.segments.keys()):
+            if date_str not in current_dates:
+                del self.segments[date_str]
+
+        return rebuilt
+
+    def dates(self) -> List[str]:
+        """색인된 날짜 목록 (오름차순)"""
+        return sorted(self.segments.keys())
+
+    def categories(self, start_date: str = "", end_date: str = "") -> List[str]:
+        """기간 내 등장한 분류 목록 (정렬됨)"""
+        categories = set()
+        for segment in self._segments_in_range(start_date, end_date):
+            categories.update(doc["category"] for doc in segment["docs"])
+        return sorted(categories)
+
+    def _segments_in_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        return [
+            self.segments[date_str]
+            for date_str in self.dates()
+            if (not start_date or date_str >= start_date) and (not end_date or date_str <= end_date)
+        ]
+
+    def search(
+        self,
+        query: str,
+        start_date: str = "",
+        end_date: str = "",
+        category: str = "전체",
+        page: int = 1,
+        per_page: int = 20,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        키워드 + 기간 + 분류 조건으로 요약 기사 검색 (BM25 순위)
+
+        Args:
+            query: 검색어 (명사 단위로 분석됨). 비어 있으면 기간 내 전체 목록을 최신순으로 반환
+            start_date: 시작 날짜 (yyyymmdd, 빈 문자열이면 제한 없음)
+            end_date: 종료 날짜 (yyyymmdd, 빈 문자열이면 제한 없음)
+            category: 분류 필터 ("전체"면 필터 없음)
+            page: 페이지 번호 (1부터 시작)
+            per_page: 페이지당 결과 수
+
+        Returns:
+            Tuple[int, List[Dict[str, Any]]]: (전체 결과 수, 해당 페이지의
+                {"date", "category", "summary", "score"} 리스트)
+        """
+        segments = self._segments_in_range(start_date, end_date)
+
+        def category_ok(doc: Dict[str, str]) -> bool:
+            return category == "전체" or doc["category"] == category
+
+        terms = list(dict.fromkeys(extract_nouns(query))) if query.strip() else []
+        if not terms and query.strip():
+            # 명사가 하나도 안 나오면 입력 그대로 검색
+            terms = query.split()
+
+        hits: List[Tuple[float, str, int]] = []
+        if not terms:
+            for segment in reversed(segments):
+                for doc_id, doc in enumerate(segment["docs"]):
+                    if category_ok(doc):
+                        hits.append((0.0, segment["date"], doc_id))
+        else:
+            # 기간 내 통계 (문서 수, 평균 길이, 단어별 문서 빈도)
+            total_docs = sum(len(segment["docs"]) for segment in segments)
+            total_length = sum(sum(segment["lengths"]) for segment in segments)
+            avg_length = total_length / total_docs if total_docs else 0.0
+            doc_freq = {
+                term: sum(len(segment["postings"].get(term, [])) for segment in segments)
+                for term in terms
+            }
+
+            for segment in segments:
+                scores: Dict[int, float] = {}
+                lengths = segment["lengths"]
+                for term in terms:
+                    postings = segment["postings"].get(term)
+                    if not postings:
+                        continue
+                    df = doc_freq[term]
+                    idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+                    for doc_id, tf in postings:
+                        norm = 1 - BM25_B + BM25_B * (lengths[doc_id] / avg_length if avg_length else 1.0)
+                        scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+                docs = segment["docs"]
+                for doc_id, score in scores.items():
+                    if category_ok(docs[doc_id]):
+                        hits.append((score, segment["date"], doc_id))
+
+            # 점수 내림차순, 같으면 최신 날짜 우선
+            hits.sort(key=lambda h: (-h[0], -int(h[1]), h[2]))
+
+        start_idx = (page - 1) * per_page
+        results = []
+        for score, date_str, doc_id in hits[start_idx:start_idx + per_page]:
+            doc = self.segments[date_str]["docs"][doc_id]
+            results.append({
+                "date": date_str,
+                "category": doc["category"],
+                "summary": doc["summary"],
+                "score": round(score, 3),
+            })
+        return len(hits), results
@@ -0,0 +1,146 @@
+import json
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+
+from .paths import TIMESERIES_DIR
+
+
+class TermTimeSeries:
+    """
+    Tokenizer가 만든 날짜 × 단어 빈도수 행렬(daily_counts.npy + meta.json)의 읽기 전용 뷰
+
+    행렬은 메모리 매핑으로 열기 때문에 몇 년치 데이터라도 필요한 부분(기간에 해당하는 날짜 행)만 읽는다.
+    파일이 갱신되면 다음 조회 시 자동으로 다시 연다.
+    이전 형식(단어 × 날짜 counts.npy)을 복사해 둔 경우에는 전치 뷰로 같은 배치처럼 읽는다.
+    """
+
+    def __init__(self, store_dir: Path = TIMESERIES_DIR):
+        self.store_dir = store_dir
+        self.meta_file = store_dir / "meta.json"
+        self.matrix_file = store_dir / "daily_counts.npy"
+        self.legacy_matrix_file = store_dir / "counts.npy"
+        self._loaded_mtime = None
+        self.words: List[str] = []
+        self.word_index: Dict[str, int] = {}
+        self.sorted_dates: List[str] = []
+        self.sorted_rows = np.zeros(0, dtype=np.int64)
+        self.counts = None
+
+    def _reload_if_changed(self):
+        if not self.meta_file.exists():
+            self.counts = None
+            self.sorted_dates = []
+            return
+        mtime = self.meta_file.stat().st_mtime
+        if mtime == self._loaded_mtime:
+            return
+
+        with open(self.meta_file, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get("layout") == "day_major" and self.matrix_file.exists():
+            counts = np.load(self.matrix_file, mmap_mode="r")
+        elif meta.get("layout") is None and self.legacy_matrix_file.exists():
+            counts = np.load(self.legacy_matrix_file, mmap_mode="r").T
+        else:
+            self.counts = None
+            self.sorted_dates = []
+            return
+        self.words = meta["words"]
+        self.word_index = {w: i for i, w in enumerate(self.words)}
+        self.counts = counts
+
+        # 행은 추가된 순서이므로 날짜순 행 번호를 따로 계산
+        order = sorted(range(len(meta["dates"])), key=lambda j: meta["dates"][j])
+        self.sorted_dates = [meta["dates"][j] for j in order]
+        self.sorted_rows = np.array(order, dtype=np.int64)
+        self._loaded_mtime = mtime
+        print(f"✓ Loaded time series: {len(self.words)} words × {len(self.sorted_dates)} days")
+
+    def dates(self) -> List[str]:
+        """저장된 날짜 목록 (오름차순)"""
+        self._reload_if_changed()
+        return list(self.sorted_dates)
+
+    def _rows(self, start_date: str, end_date: str) -> Tuple[List[str], np.ndarray]:
+        """기간에 해당하는 (날짜 리스트, 행 번호 배열)"""
+        self._reload_if_changed()
+        lo = bisect_left(self.sorted_dates, start_date) if start_date else 0
+        hi = bisect_right(self.sorted_dates, end_date) if end_date else len(self.sorted_dates)
+        return self.sorted_dates[lo:hi], self.sorted_rows[lo:hi]
+
+    def series(self, words: List[str], start_date: str = "", end_date: str = "") -> Tuple[List[str], Dict[str, List[int]]]:
+        """
+        주어진 단어들의 기간 내 날짜별 빈도수
+
+        Args:
+            words: 조회할 단어 리스트 (저장소에 없는 단어는 0으로 채움)
+            start_date: 시작 날짜 (yyyymmdd, 빈 문자열이면 처음부터)
+            end_date: 종료 날짜 (yyyymmdd, 빈 문자열이면 끝까지)
+
+        Returns:
+            Tuple[List[str], Dict[str, List[int]]]: (날짜 리스트, {단어: [빈도수, ...]})
+        """
+        dates, rows = self._rows(start_date, end_date)
+        result = {word: [0] * len(dates) for word in words}
+        found = [(word, self.word_index[word]) for word in words if word in self.word_index]
+        if found and self.counts is not None and len(rows):
+            # 기간의 날짜 행 × 조회 단어 열만 한 번에 읽음
+            block = self.counts[np.ix_(rows, [col for _, col in found])].astype(np.int64)
+            for i, (word, _) in enumerate(found):
+                result[word] = block[:, i].tolist()
+        return dates, result
+
+    def _totals(self, start_date: str, end_date: str) -> np.ndarray:
+        """기간 내 단어별 합계 벡터"""
+        _, rows = self._rows(start_date, end_date)
+        if self.counts is None or len(rows) == 0:
+            return np.zeros(len(self.words), dtype=np.int64)
+        return self.counts[rows, :len(self.words)].sum(axis=0, dtype=np.int64)
+
+    def top_words(self, start_date: str = "", end_date: str = "", k: int = 5) -> List[Tuple[str, int]]:
+        """기간 내 합계 기준 상위 k개 (단어, 합계)"""
+        totals = self._totals(start_date, end_date)
+        if totals.size == 0:
+            return []
+        k = min(k, totals.size)
+        top = np.argpartition(-totals, k - 1)[:k]
+        top = top[np.lexsort((top, -totals[top]))]
+        return [(self.words[i], int(totals[i])) for i in top if totals[i] > 0]
+
+    def top_movers(
+        self,
+        before: Tuple[str, str],
+        after: Tuple[str, str],
+        k: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        두 기간 사이에 가장 많이 늘어난 단어들
+
+        Args:
+            before: 비교 기준 기간 (시작, 종료)
+            after: 비교 대상 기간 (시작, 종료)
+            k: 반환할 단어 수
+
+        Returns:
+            List[Dict[str, Any]]: [{"word", "before", "after", "change"}, ...] (증가량 내림차순)
+        """
+        before_totals = self._totals(*before)
+        after_totals = self._totals(*after)
+        if after_totals.size == 0:
+            return []
+        change = after_totals - before_totals
+        k = min(k, change.size)
+        top = np.argpartition(-change, k - 1)[:k]
+        top = top[np.lexsort((top, -change[top]))]
+        return [
+            {
+                "word": self.words[i],
+                "before": int(before_totals[i]),
+                "after": int(after_totals[i]),
+                "change": int(change[i]),
+            }
+            for i in top if change[i] > 0
+        ]
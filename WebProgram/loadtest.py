@@ -0,0 +1,394 @@
+"""
+WebProgram 대시보드 부하 테스트
+
+합성 rank/summary 데이터를 만들고, 그 데이터로 Reflex 백엔드를 띄운 뒤
+N개의 웹소켓 클라이언트가 실제 프론트엔드와 같은 이벤트를 보내면서
+이벤트 지연(p50/p99), 처리량, 세션당 백엔드 메모리를 측정한다.
+
+사용 예:
+    python loadtest.py --clients 50 --iterations 20 --days 30 --summaries-per-day 2000
+    python loadtest.py --clients 100 --max-p99-ms 500 --output result.json   # 회귀 게이트
+
+기준치(--max-p99-ms, --min-throughput, --max-mem-per-session-mb)를 넘으면 종료 코드 1로 끝난다.
+
+필요 패키지: python-socketio[asyncio_client], psutil (pip install -e ".[loadtest]")
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import socketio
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PROJECT_DIR = Path(__file__).resolve().parent
+
+# 합성 데이터용 음절 / 분류
+SYLLABLES = "가나다라마바사아자차카타파하금융대출은행투자시장기업자산고객서비스정책경제성장지원"
+CATEGORIES = ["은행", "보험", "증권", "카드", "부동산", "가상자산", "금융정책", "기업", "소비자 보호", "글로벌 경제"]
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list:
+    """2~4음절 합성 단어 size개 생성 (중복 없음)"""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def generate_synthetic_data(res_dir: Path, days: int, words_per_day: int, summaries_per_day: int, seed: int = 42) -> list:
+    """
+    res 폴더 구조(rank/*.csv, summary/*.sum)로 합성 데이터 생성
+
+    Args:
+        res_dir: 생성할 res 폴더 경로
+        days: 날짜 수 (오늘 기준 과거로)
+        words_per_day: 날짜별 rank CSV 단어 수
+        summaries_per_day: 날짜별 요약 기사 수
+        seed: 난수 시드 (같은 시드면 같은 데이터)
+
+    Returns:
+        list: 생성된 날짜 문자열 리스트 (yyyymmdd)
+    """
+    rng = random.Random(seed)
+    vocab = make_vocabulary(max(words_per_day * 2, 100), rng)
+
+    rank_dir = res_dir / "rank"
+    summary_dir = res_dir / "summary"
+    rank_dir.mkdir(parents=True, exist_ok=True)
+    summary_dir.mkdir(parents=True, exist_ok=True)
+
+    start = datetime.now() - timedelta(days=days)
+    dates = []
+    for i in range(days):
+        date_str = (start + timedelta(days=i)).strftime("%Y%m%d")
+        dates.append(date_str)
+
+        # rank CSV: 빈도수 내림차순 (Tokenizer 출력 형식과 동일)
+        words = rng.sample(vocab, words_per_day)
+        counts = sorted((rng.randint(10, 3000) for _ in words), reverse=True)
+        with open(rank_dir / f"{date_str}.csv", "w", encoding="utf-8-sig", newline="") as f:
+            f.write("word,count\n")
+            for word, count in zip(words, counts):
+                f.write(f"{word},{count}\n")
+
+        # .sum 파일: <분류>/<요약> 블록 (Summarizer 출력 형식과 동일)
+        with open(summary_dir / f"{date_str}.sum", "w", encoding="utf-8") as f:
+            for _ in range(summaries_per_day):
+                summary = " ".join(rng.choice(vocab) for _ in range(rng.randint(15, 40)))
+                f.write(f"<분류>: {rng.choice(CATEGORIES)}\n<요약>: {summary}.\n\n")
+
+    return dates
+
+
+def start_backend(res_dir: Path, port: int, timeout: float = 120.0) -> subprocess.Popen:
+    """
+    합성 데이터 폴더를 가리키도록 Reflex 백엔드만 실행하고 /ping 응답을 기다림
+    """
+    env = dict(os.environ, WEBPROGRAM_RES_DIR=str(res_dir))
+    proc = subprocess.Popen(
+        ["reflex", "run", "--env", "prod", "--backend-only", "--backend-port", str(port)],
+        cwd=PROJECT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Backend exited with code {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/ping", timeout=1) as resp:
+                if resp.status == 200:
+                    return proc
+        except Exception:
+            time.sleep(0.5)
+
+    stop_backend(proc)
+    raise RuntimeError(f"Backend did not start within {timeout}s")
+
+
+def stop_backend(proc: subprocess.Popen):
+    """백엔드와 자식 프로세스 종료"""
+    if psutil is not None:
+        try:
+            for child in psutil.Process(proc.pid).children(recursive=True):
+                child.terminate()
+        except psutil.NoSuchProcess:
+            pass
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def backend_rss_mb(pid: int) -> float | None:
+    """백엔드 프로세스 트리의 RSS 합계 (MB). psutil이 없으면 None"""
+    if psutil is None or pid is None:
+        return None
+    try:
+        root = psutil.Process(pid)
+        procs = [root] + root.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return None
+    total = 0
+    for p in procs:
+        try:
+            total += p.memory_info().rss
+        except psutil.NoSuchProcess:
+            continue
+    return total / (1024 * 1024)
+
+
+def get_state_name() -> str:
+    """이벤트 이름 앞에 붙는 State 전체 이름 (예: reflex___state____state.web_program___web_program____state)"""
+    sys.path.insert(0, str(PROJECT_DIR))
+    from WebProgram.WebProgram import State
+    return State.get_full_name()
+
+
+class DashboardClient:
+    """브라우저 한 탭을 흉내 내는 웹소켓 클라이언트"""
+
+    def __init__(self, url: str, state_name: str, timeout: float):
+        self.url = url
+        self.state_name = state_name
+        self.timeout = timeout
+        self.token = str(uuid.uuid4())
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.sio.on("event", self._on_update, namespace="/_event")
+        self._final = asyncio.Event()
+        self.received_bytes = 0
+
+    async def connect(self):
+        await self.sio.connect(
+            f"{self.url}?token={self.token}",
+            socketio_path="/_event",
+            namespaces=["/_event"],
+            transports=["websocket"],
+        )
+
+    async def close(self):
+        await self.sio.disconnect()
+
+    async def _on_update(self, data):
+        if isinstance(data, str):
+            self.received_bytes += len(data.encode("utf-8"))
+            data = json.loads(data)
+        else:
+            self.received_bytes += len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        if data.get("final", True):
+            self._final.set()
+
+    async def send(self, handler: str, payload: dict | None = None) -> float:
+        """
+        이벤트 하나를 보내고 final 업데이트가 올 때까지의 시간(초)을 반환
+        """
+        self._final.clear()
+        started = time.perf_counter()
+        await self.sio.emit(
+            "event",
+            {
+                "token": self.token,
+                "name": f"{self.state_name}.{handler}",
+                "router_data": {"pathname": "/", "query": {}, "asPath": "/"},
+                "payload": payload or {},
+            },
+            namespace="/_event",
+        )
+        await asyncio.wait_for(self._final.wait(), self.timeout)
+        return time.perf_counter() - started
+
+
+async def run_session(client: DashboardClient, dates: list, iterations: int, pages: int, seed: int, latencies: dict, errors: list):
+    """
+    한 세션의 시나리오: 대시보드 로드 → (상세 순위 → 요약 기사 → 페이지 넘기기) 반복
+    """
+    rng = random.Random(seed)
+
+    async def timed(handler: str, payload: dict | None = None):
+        try:
+            latencies.setdefault(handler, []).append(await client.send(handler, payload))
+        except Exception as e:
+            errors.append(f"{handler}: {type(e).__name__}: {e}")
+
+    await timed("load_rank_files")
+    for _ in range(iterations):
+        await timed("select_date", {"date": rng.choice(dates)})
+        await timed("select_summary", {"date": rng.choice(dates)})
+        for _ in range(pages):
+            await timed("next_summary_page")
+        await timed("prev_summary_page")
+
+
+def percentile(values: list, pct: float) -> float:
+    """정렬된 값에서 pct(0~100) 백분위수 (최근접 순위 방식)"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+async def run_load_test(url: str, state_name: str, dates: list, args, backend_pid: int | None) -> dict:
+    """N개 클라이언트를 동시에 실행하고 결과 통계를 반환"""
+    rss_before = backend_rss_mb(backend_pid)
+
+    clients = [DashboardClient(url, state_name, args.timeout) for _ in range(args.clients)]
+    await asyncio.gather(*(c.connect() for c in clients))
+
+    latencies: dict = {}
+    errors: list = []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_session(c, dates, args.iterations, args.pages, args.seed + i, latencies, errors)
+        for i, c in enumerate(clients)
+    ))
+    elapsed = time.perf_counter() - started
+
+    # 세션이 살아 있는 상태에서 메모리 측정
+    rss_after = backend_rss_mb(backend_pid)
+    received_bytes = sum(c.received_bytes for c in clients)
+    await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+
+    all_latencies = [v for values in latencies.values() for v in values]
+    result = {
+        "clients": args.clients,
+        "iterations": args.iterations,
+        "events": len(all_latencies),
+        "errors": len(errors),
+        "error_samples": errors[:10],
+        "elapsed_s": round(elapsed, 3),
+        "throughput_eps": round(len(all_latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(all_latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(all_latencies, 99) * 1000, 2),
+        "avg_update_bytes": round(received_bytes / len(all_latencies)) if all_latencies else 0,
+        "per_event": {
+            name: {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+            }
+            for name, values in sorted(latencies.items())
+        },
+        "rss_before_mb": round(rss_before, 1) if rss_before is not None else None,
+        "rss_after_mb": round(rss_after, 1) if rss_after is not None else None,
+        "mem_per_session_mb": (
+            round((rss_after - rss_before) / args.clients, 3)
+            if rss_before is not None and rss_after is not None else None
+        ),
+    }
+    return result
+
+
+def check_gates(result: dict, args) -> list:
+    """기준치 위반 목록 반환 (비어 있으면 통과)"""
+    failures = []
+    if result["errors"]:
+        failures.append(f"{result['errors']} event errors")
+    if args.max_p99_ms is not None and result["p99_ms"] > args.max_p99_ms:
+        failures.append(f"p99 {result['p99_ms']}ms > {args.max_p99_ms}ms")
+    if args.min_throughput is not None and result["throughput_eps"] < args.min_throughput:
+        failures.append(f"throughput {result['throughput_eps']}/s < {args.min_throughput}/s")
+    if (args.max_mem_per_session_mb is not None and result["mem_per_session_mb"] is not None
+            and result["mem_per_session_mb"] > args.max_mem_per_session_mb):
+        failures.append(f"memory {result['mem_per_session_mb']}MB/session > {args.max_mem_per_session_mb}MB")
+    return failures
+
+
+def print_report(result: dict):
+    print(f"\n{'='*60}")
+    print(f"클라이언트: {result['clients']}개, 이벤트: {result['events']}개, 오류: {result['errors']}개")
+    print(f"처리량: {result['throughput_eps']} events/s ({result['elapsed_s']}s)")
+    print(f"지연: p50 {result['p50_ms']}ms, p99 {result['p99_ms']}ms")
+    print(f"평균 업데이트 크기: {result['avg_update_bytes']} bytes")
+    if result["mem_per_session_mb"] is not None:
+        print(f"메모리: {result['rss_before_mb']}MB → {result['rss_after_mb']}MB "
+              f"(세션당 {result['mem_per_session_mb']}MB)")
+    print(f"{'-'*60}")
+    for name, stats in result["per_event"].items():
+        print(f"  {name:<20} n={stats['count']:<6} p50 {stats['p50_ms']:>8}ms  p99 {stats['p99_ms']:>8}ms")
+    print(f"{'='*60}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebProgram 대시보드 웹소켓 부하 테스트")
+    parser.add_argument("--clients", type=int, default=20, help="동시 접속 클라이언트 수")
+    parser.add_argument("--iterations", type=int, default=10, help="세션별 시나리오 반복 횟수")
+    parser.add_argument("--pages", type=int, default=3, help="반복마다 넘길 요약 페이지 수")
+    parser.add_argument("--days", type=int, default=30, help="합성 데이터 날짜 수")
+    parser.add_argument("--words-per-day", type=int, default=30, help="날짜별 rank 단어 수")
+    parser.add_argument("--summaries-per-day", type=int, default=500, help="날짜별 요약 기사 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--port", type=int, default=8765, help="백엔드 포트 (직접 실행할 때)")
+    parser.add_argument("--res-dir", default=None, help="합성 데이터를 만들 폴더 (지정 시 테스트 후에도 남겨 둠)")
+    parser.add_argument("--url", default=None,
+                        help="이미 실행 중인 백엔드 주소 (지정 시 백엔드를 띄우지 않음. "
+                             "백엔드는 WEBPROGRAM_RES_DIR=<--res-dir> 로 실행해 두어야 함)")
+    parser.add_argument("--backend-pid", type=int, default=None, help="--url 사용 시 메모리 측정할 백엔드 PID")
+    parser.add_argument("--timeout", type=float, default=30.0, help="이벤트당 응답 대기 시간(초)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--max-p99-ms", type=float, default=None, help="p99 지연 상한 (회귀 게이트)")
+    parser.add_argument("--min-throughput", type=float, default=None, help="처리량 하한 events/s (회귀 게이트)")
+    parser.add_argument("--max-mem-per-session-mb", type=float, default=None, help="세션당 메모리 상한 (회귀 게이트)")
+    args = parser.parse_args()
+
+    res_dir = Path(args.res_dir) if args.res_dir else Path(tempfile.mkdtemp(prefix="webprogram_loadtest_"))
+    proc = None
+    try:
+        print(f"합성 데이터 생성 중: {res_dir}")
+        dates = generate_synthetic_data(res_dir, args.days, args.words_per_day, args.summaries_per_day, args.seed)
+
+        if args.url:
+            url, backend_pid = args.url, args.backend_pid
+        else:
+            print(f"백엔드 실행 중 (port {args.port})...")
+            proc = start_backend(res_dir, args.port)
+            url, backend_pid = f"http://localhost:{args.port}", proc.pid
+
+        result = asyncio.run(run_load_test(url, get_state_name(), dates, args, backend_pid))
+        result["data"] = {
+            "days": args.days,
+            "words_per_day": args.words_per_day,
+            "summaries_per_day": args.summaries_per_day,
+        }
+    finally:
+        if proc is not None:
+            stop_backend(proc)
+        if not args.res_dir:
+            shutil.rmtree(res_dir, ignore_errors=True)
+
+    print_report(result)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.output}")
+
+    failures = check_gates(result, args)
+    if failures:
+        print("✗ 부하 테스트 기준 미달:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("✓ 부하 테스트 통과")
+
+
+if __name__ == "__main__":
+    main()